@@ -614,6 +614,14 @@ background_thread(void *data)
     struct serialqueue *sq = data;
     pollreactor_run(sq->pr);
 
+    if (sq->serial_fd_type == SQT_DEBUGFILE) {
+        // Write any remaining messages to the debug file
+        double waketime = get_monotonic();
+        while (waketime != PR_NEVER
+               && (sq->ready_bytes || sq->upcoming_bytes))
+            waketime = command_event(sq, waketime);
+    }
+
     pthread_mutex_lock(&sq->lock);
     check_wake_receive(sq);
     pthread_mutex_unlock(&sq->lock);
@@ -640,6 +640,18 @@ stepcompress_queue_mq_msg(struct stepcompress *sc, uint64_t req_clock
     return 0;
 }
 
+// Copy a history entry to the external storage format
+static void
+fill_pull_history(struct pull_history_steps *p, struct history_steps *hs)
+{
+    p->first_clock = hs->first_clock;
+    p->last_clock = hs->last_clock;
+    p->start_position = hs->start_position;
+    p->step_count = hs->step_count;
+    p->interval = hs->interval;
+    p->add = hs->add;
+}
+
 // Return history of queue_step commands
 int __visible
 stepcompress_extract_old(struct stepcompress *sc, struct pull_history_steps *p
@@ -652,18 +664,48 @@ stepcompress_extract_old(struct stepcompress *sc, struct pull_history_steps *p
             break;
         if (end_clock <= hs->first_clock)
             continue;
-        p->first_clock = hs->first_clock;
-        p->last_clock = hs->last_clock;
-        p->start_position = hs->start_position;
-        p->step_count = hs->step_count;
-        p->interval = hs->interval;
-        p->add = hs->add;
+        fill_pull_history(p, hs);
         p++;
         res++;
     }
     return res;
 }
 
+// Store the oldest 'max' queue_step commands in the given time range
+// into 'p' (in chronological order).  Returns the total number of
+// commands in the range (which may be larger than 'max').
+int __visible
+stepcompress_extract_history(struct stepcompress *sc
+                             , struct pull_history_steps *p, int max
+                             , uint64_t start_clock, uint64_t end_clock)
+{
+    // Count entries in range (history_list is ordered newest first)
+    int count = 0;
+    struct history_steps *hs;
+    list_for_each_entry(hs, &sc->history_list, node) {
+        if (start_clock >= hs->last_clock)
+            break;
+        if (end_clock <= hs->first_clock)
+            continue;
+        count++;
+    }
+    // Fill buffer from its end so that the oldest entry is stored first
+    int skip = count > max ? count - max : 0, pos = count - skip;
+    list_for_each_entry(hs, &sc->history_list, node) {
+        if (!pos)
+            break;
+        if (end_clock <= hs->first_clock)
+            continue;
+        if (skip) {
+            skip--;
+            continue;
+        }
+        pos--;
+        fill_pull_history(&p[pos], hs);
+    }
+    return count;
+}
+
 
 /****************************************************************
  * Step compress synchronization
@@ -686,6 +728,8 @@ struct steppersync {
     // Storage for list of pending move clocks
     uint64_t *move_clocks;
     int num_move_clocks;
+    // Stats
+    uint32_t msgs_sent, bytes_sent;
 };
 
 // Allocate a new 'steppersync' object
@@ -816,6 +860,8 @@ steppersync_flush(struct steppersync *ss, uint64_t move_clock
         // Batch this command
         list_del(&qm->node);
         list_add_tail(&qm->node, &msgs);
+        ss->msgs_sent++;
+        ss->bytes_sent += qm->len;
     }
 
     // Transmit commands
@@ -825,3 +871,11 @@ steppersync_flush(struct steppersync *ss, uint64_t move_clock
     steppersync_history_expire(ss, clear_history_clock);
     return 0;
 }
+
+// Report the number of messages and bytes transmitted
+void __visible
+steppersync_get_stats(struct steppersync *ss, char *buf, int len)
+{
+    snprintf(buf, len, "step_msgs=%u step_bytes=%u"
+             , ss->msgs_sent, ss->bytes_sent);
+}
@@ -34,6 +34,9 @@ int stepcompress_queue_mq_msg(struct stepcompress *sc, uint64_t req_clock
 int stepcompress_extract_old(struct stepcompress *sc
                              , struct pull_history_steps *p, int max
                              , uint64_t start_clock, uint64_t end_clock);
+int stepcompress_extract_history(struct stepcompress *sc
+                                 , struct pull_history_steps *p, int max
+                                 , uint64_t start_clock, uint64_t end_clock);
 
 struct serialqueue;
 struct steppersync *steppersync_alloc(
@@ -44,5 +47,6 @@ void steppersync_set_time(struct steppersync *ss, double time_offset
                           , double mcu_freq);
 int steppersync_flush(struct steppersync *ss, uint64_t move_clock
                       , uint64_t clear_history_clock);
+void steppersync_get_stats(struct steppersync *ss, char *buf, int len);
 
 #endif // stepcompress.h
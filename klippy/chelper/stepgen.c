@@ -0,0 +1,168 @@
+// Parallel generation of stepper step times
+//
+// Copyright (C) 2026  agent <agent@local>
+//
+// This file may be distributed under the terms of the GNU GPLv3 license.
+
+#include <pthread.h> // pthread_create
+#include <stdlib.h> // malloc
+#include <string.h> // memset
+#include "compiler.h" // __visible
+#include "itersolve.h" // itersolve_generate_steps
+#include "pyhelper.h" // report_errno
+#include "stepgen.h" // stepgen_pool_alloc
+#include "trapq.h" // trapq_check_sentinels
+
+// The stepgen_pool object runs itersolve_generate_steps() for a set
+// of steppers using a pool of worker threads.  Each stepper has its
+// own stepper_kinematics and stepcompress objects, so the steps of
+// different steppers may be generated concurrently.  The shared trapq
+// sentinels are updated by the caller prior to dispatching work.
+
+struct stepgen_pool {
+    pthread_mutex_t lock;
+    pthread_cond_t work_cond, done_cond;
+    pthread_t *threads;
+    int num_threads, is_shutdown;
+    // Steppers queued for the next generate call
+    struct stepper_kinematics **sk_list;
+    int sk_num, sk_alloc;
+    // Current work state (protected by lock)
+    double flush_time;
+    int next_sk, completed, work_num;
+    int32_t ret;
+};
+
+// Generate steps for pending steppers (must be called with lock held)
+static void
+run_pending(struct stepgen_pool *sp)
+{
+    while (sp->next_sk < sp->work_num) {
+        struct stepper_kinematics *sk = sp->sk_list[sp->next_sk++];
+        double flush_time = sp->flush_time;
+        pthread_mutex_unlock(&sp->lock);
+        int32_t ret = itersolve_generate_steps(sk, flush_time);
+        pthread_mutex_lock(&sp->lock);
+        if (ret && !sp->ret)
+            sp->ret = ret;
+        sp->completed++;
+        if (sp->completed >= sp->work_num)
+            pthread_cond_signal(&sp->done_cond);
+    }
+}
+
+// Main code for worker threads
+static void *
+worker_thread(void *data)
+{
+    struct stepgen_pool *sp = data;
+    pthread_mutex_lock(&sp->lock);
+    for (;;) {
+        if (sp->is_shutdown)
+            break;
+        if (sp->next_sk >= sp->work_num) {
+            pthread_cond_wait(&sp->work_cond, &sp->lock);
+            continue;
+        }
+        run_pending(sp);
+    }
+    pthread_mutex_unlock(&sp->lock);
+    return NULL;
+}
+
+// Create a new stepgen_pool object
+struct stepgen_pool * __visible
+stepgen_pool_alloc(int num_threads)
+{
+    struct stepgen_pool *sp = malloc(sizeof(*sp));
+    memset(sp, 0, sizeof(*sp));
+    pthread_mutex_init(&sp->lock, NULL);
+    pthread_cond_init(&sp->work_cond, NULL);
+    pthread_cond_init(&sp->done_cond, NULL);
+    if (num_threads < 0)
+        num_threads = 0;
+    sp->threads = malloc(sizeof(*sp->threads) * (num_threads ? : 1));
+    int i;
+    for (i = 0; i < num_threads; i++) {
+        int ret = pthread_create(&sp->threads[i], NULL, worker_thread, sp);
+        if (ret) {
+            report_errno("stepgen pthread_create", ret);
+            break;
+        }
+    }
+    sp->num_threads = i;
+    return sp;
+}
+
+// Stop worker threads and free memory
+void __visible
+stepgen_pool_free(struct stepgen_pool *sp)
+{
+    if (!sp)
+        return;
+    pthread_mutex_lock(&sp->lock);
+    sp->is_shutdown = 1;
+    pthread_cond_broadcast(&sp->work_cond);
+    pthread_mutex_unlock(&sp->lock);
+    int i;
+    for (i = 0; i < sp->num_threads; i++)
+        pthread_join(sp->threads[i], NULL);
+    pthread_cond_destroy(&sp->work_cond);
+    pthread_cond_destroy(&sp->done_cond);
+    pthread_mutex_destroy(&sp->lock);
+    free(sp->threads);
+    free(sp->sk_list);
+    free(sp);
+}
+
+// Queue a stepper for the next call to stepgen_pool_generate()
+void __visible
+stepgen_pool_add(struct stepgen_pool *sp, struct stepper_kinematics *sk)
+{
+    if (sp->sk_num >= sp->sk_alloc) {
+        int new_alloc = sp->sk_alloc ? sp->sk_alloc * 2 : 16;
+        sp->sk_list = realloc(sp->sk_list, sizeof(*sp->sk_list) * new_alloc);
+        sp->sk_alloc = new_alloc;
+    }
+    sp->sk_list[sp->sk_num++] = sk;
+}
+
+// Generate steps for all queued steppers and wait for completion
+int32_t __visible
+stepgen_pool_generate(struct stepgen_pool *sp, double flush_time)
+{
+    int sk_num = sp->sk_num, i;
+    sp->sk_num = 0;
+    if (!sk_num)
+        return 0;
+    // Update trapq sentinels (trapqs may be shared between steppers)
+    for (i = 0; i < sk_num; i++) {
+        struct stepper_kinematics *sk = sp->sk_list[i];
+        if (sk->tq)
+            trapq_check_sentinels(sk->tq);
+    }
+    if (!sp->num_threads || sk_num == 1) {
+        // No need to wake worker threads
+        for (i = 0; i < sk_num; i++) {
+            int32_t ret = itersolve_generate_steps(sp->sk_list[i]
+                                                   , flush_time);
+            if (ret)
+                return ret;
+        }
+        return 0;
+    }
+    // Dispatch work to worker threads (and process work in this thread)
+    pthread_mutex_lock(&sp->lock);
+    sp->flush_time = flush_time;
+    sp->next_sk = sp->completed = 0;
+    sp->ret = 0;
+    sp->work_num = sk_num;
+    pthread_cond_broadcast(&sp->work_cond);
+    run_pending(sp);
+    while (sp->completed < sp->work_num)
+        pthread_cond_wait(&sp->done_cond, &sp->lock);
+    int32_t ret = sp->ret;
+    sp->next_sk = sp->completed = sp->work_num = 0;
+    pthread_mutex_unlock(&sp->lock);
+    return ret;
+}
@@ -227,6 +227,22 @@ trapq_set_position(struct trapq *tq, double print_time
     list_add_head(&m->node, &tq->history);
 }
 
+// Copy a move to the external storage format
+static void
+fill_pull_move(struct pull_move *p, struct move *m)
+{
+    p->print_time = m->print_time;
+    p->move_t = m->move_t;
+    p->start_v = m->start_v;
+    p->accel = 2. * m->half_accel;
+    p->start_x = m->start_pos.x;
+    p->start_y = m->start_pos.y;
+    p->start_z = m->start_pos.z;
+    p->x_r = m->axes_r.x;
+    p->y_r = m->axes_r.y;
+    p->z_r = m->axes_r.z;
+}
+
 // Return history of movement queue
 int __visible
 trapq_extract_old(struct trapq *tq, struct pull_move *p, int max
@@ -239,18 +255,43 @@ trapq_extract_old(struct trapq *tq, struct pull_move *p, int max
             break;
         if (end_time <= m->print_time)
             continue;
-        p->print_time = m->print_time;
-        p->move_t = m->move_t;
-        p->start_v = m->start_v;
-        p->accel = 2. * m->half_accel;
-        p->start_x = m->start_pos.x;
-        p->start_y = m->start_pos.y;
-        p->start_z = m->start_pos.z;
-        p->x_r = m->axes_r.x;
-        p->y_r = m->axes_r.y;
-        p->z_r = m->axes_r.z;
+        fill_pull_move(p, m);
         p++;
         res++;
     }
     return res;
 }
+
+// Store the oldest 'max' history moves in the given time range into
+// 'p' (in chronological order).  Returns the total number of moves in
+// the range (which may be larger than 'max').
+int __visible
+trapq_extract_history(struct trapq *tq, struct pull_move *p, int max
+                      , double start_time, double end_time)
+{
+    // Count moves in range (history is ordered newest first)
+    int count = 0;
+    struct move *m;
+    list_for_each_entry(m, &tq->history, node) {
+        if (start_time >= m->print_time + m->move_t)
+            break;
+        if (end_time <= m->print_time)
+            continue;
+        count++;
+    }
+    // Fill buffer from its end so that the oldest move is stored first
+    int skip = count > max ? count - max : 0, pos = count - skip;
+    list_for_each_entry(m, &tq->history, node) {
+        if (!pos)
+            break;
+        if (end_time <= m->print_time)
+            continue;
+        if (skip) {
+            skip--;
+            continue;
+        }
+        pos--;
+        fill_pull_move(&p[pos], m);
+    }
+    return count;
+}
@@ -3,7 +3,7 @@
 # Copyright (C) 2016-2018  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, math
+import logging, math, collections
 
 RTT_AGE = .000010 / (60. * 60.)
 DECAY = 1. / 30.
@@ -27,6 +27,10 @@ class ClockSync:
         self.clock_avg = self.clock_covariance = 0.
         self.prediction_variance = 0.
         self.last_prediction_time = 0.
+        # Optional history of clock samples (for diagnostics)
+        self.sample_history = None
+    def setup_history(self, size):
+        self.sample_history = collections.deque(maxlen=size)
     def connect(self, serial):
         self.serial = serial
         self.mcu_freq = serial.msgparser.get_constant_float('CLOCK_FREQ')
@@ -91,6 +95,8 @@ class ClockSync:
                               " freq=%d diff=%d stddev=%.3f",
                               sent_time, self.clock_est[2], clock - exp_clock,
                               math.sqrt(self.prediction_variance))
+                self._note_sample(sent_time, receive_time, clock, exp_clock,
+                                  self.clock_est[2], 1)
                 return
             logging.info("Resetting prediction variance %.3f:"
                          " freq=%d diff=%d stddev=%.3f",
@@ -117,8 +123,22 @@ class ClockSync:
                                   int(self.clock_avg - 3. * pred_stddev), clock)
         self.clock_est = (self.time_avg + self.min_half_rtt,
                           self.clock_avg, new_freq)
+        self._note_sample(sent_time, receive_time, clock, exp_clock,
+                          new_freq, 0)
         #logging.debug("regr %.3f: freq=%.3f d=%d(%.3f)",
         #              sent_time, new_freq, clock - exp_clock, pred_stddev)
+    def _note_sample(self, sent_time, receive_time, clock, exp_clock, freq,
+                     is_ignored):
+        if self.sample_history is None:
+            return
+        self.sample_history.append(
+            (sent_time, receive_time, clock, clock - exp_clock, freq,
+             math.sqrt(self.prediction_variance), is_ignored))
+    def get_history(self):
+        if self.sample_history is None:
+            return {}
+        return {'mcu_freq': self.mcu_freq,
+                'samples': list(self.sample_history)}
     # clock frequency conversions
     def print_time_to_clock(self, print_time):
         return int(print_time * self.mcu_freq)
@@ -166,6 +186,10 @@ class SecondarySync(ClockSync):
         self.main_sync = main_sync
         self.clock_adj = (0., 1.)
         self.last_sync_time = 0.
+        self.adj_history = None
+    def setup_history(self, size):
+        ClockSync.setup_history(self, size)
+        self.adj_history = collections.deque(maxlen=size)
     def connect(self, serial):
         ClockSync.connect(self, serial)
         self.clock_adj = (0., self.mcu_freq)
@@ -192,6 +216,11 @@ class SecondarySync(ClockSync):
     def stats(self, eventtime):
         adjusted_offset, adjusted_freq = self.clock_adj
         return "%s adj=%d" % (ClockSync.stats(self, eventtime), adjusted_freq)
+    def get_history(self):
+        res = ClockSync.get_history(self)
+        if self.adj_history is not None:
+            res['adjustments'] = list(self.adj_history)
+        return res
     def calibrate_clock(self, print_time, eventtime):
         # Calculate: est_print_time = main_sync.estimatated_print_time()
         ser_time, ser_clock, ser_freq = self.main_sync.clock_est
@@ -212,6 +241,12 @@ class SecondarySync(ClockSync):
                          / (sync2_print_time - sync1_print_time))
         adjusted_offset = sync1_print_time - sync1_clock / adjusted_freq
         # Apply new values
+        if self.adj_history is not None:
+            # Note deviation of the prior mapping from main mcu print_time
+            local_clock = self.get_clock(eventtime)
+            skew = self.clock_to_print_time(local_clock) - est_print_time
+            self.adj_history.append((eventtime, est_print_time,
+                                     adjusted_offset, adjusted_freq, skew))
         self.clock_adj = (adjusted_offset, adjusted_freq)
         self.last_sync_time = sync2_print_time
         return self.clock_adj
@@ -3,8 +3,12 @@
 # Copyright (C) 2020-2023  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, time, collections, multiprocessing, os
+import logging, time, collections, threading, struct
 from . import bus, bulk_sensor
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
 
 # ADXL345 registers
 REG_DEVID = 0x00
@@ -30,6 +34,82 @@ SCALE_Z  = 0.003906 * FREEFALL_ACCEL # 1 / 256 (at 3.3V) mg/LSB
 Accel_Measurement = collections.namedtuple(
     'Accel_Measurement', ('time', 'accel_x', 'accel_y', 'accel_z'))
 
+# Supported raw data file formats (the "npy" format is the numpy binary
+# array format, which can be loaded with numpy.load(mmap_mode='r'))
+RAW_DATA_FORMATS = ['csv', 'npy']
+NPY_HEADER_SIZE = 128
+WRITE_CHUNK_SIZE = 4096
+
+# Write accelerometer samples to a csv or npy file
+class AccelDataFile:
+    def __init__(self, filename):
+        self.is_binary = filename.endswith('.npy')
+        self.sample_count = 0
+        if self.is_binary:
+            self.file = open(filename, 'wb')
+            self._write_npy_header()
+        else:
+            self.file = open(filename, 'w')
+            self.file.write("#time,accel_x,accel_y,accel_z\n")
+    def _write_npy_header(self):
+        # Version 1.0 header of a little-endian float64 array with a
+        # (time, accel_x, accel_y, accel_z) row per sample.  The header
+        # has a fixed size so that the final sample count can be filled
+        # in after the data is written.
+        header = ("{'descr': '<f8', 'fortran_order': False,"
+                  " 'shape': (%d, 4), }" % (self.sample_count,))
+        header = header.ljust(NPY_HEADER_SIZE - 11) + "\n"
+        self.file.write(b'\x93NUMPY\x01\x00'
+                        + struct.pack('<H', len(header))
+                        + header.encode())
+    def write_samples(self, samples):
+        for i in range(0, len(samples), WRITE_CHUNK_SIZE):
+            chunk = samples[i:i+WRITE_CHUNK_SIZE]
+            if self.is_binary:
+                values = [v for s in chunk for v in s]
+                self.file.write(struct.pack('<%dd' % (len(values),), *values))
+            else:
+                self.file.write("".join(["%.6f,%.6f,%.6f,%.6f\n" % tuple(s)
+                                         for s in chunk]))
+        self.sample_count += len(samples)
+    def close(self):
+        if self.is_binary:
+            self.file.seek(0)
+            self._write_npy_header()
+        self.file.close()
+
+# Stream samples to a file from a background thread as they arrive
+class AccelDataWriter:
+    def __init__(self, filename):
+        self.filename = filename
+        self.sample_count = 0
+        self.is_error = False
+        self.queue = Queue()
+        self.thread = threading.Thread(target=self._write_thread)
+        self.thread.daemon = True
+        self.thread.start()
+    def _write_thread(self):
+        try:
+            f = AccelDataFile(self.filename)
+            while 1:
+                samples = self.queue.get()
+                if samples is None:
+                    break
+                f.write_samples(samples)
+            f.close()
+        except (IOError, OSError) as e:
+            self.is_error = True
+            logging.warning("Unable to write accelerometer data to '%s': %s",
+                            self.filename, str(e))
+    def add_samples(self, samples):
+        if samples and not self.is_error:
+            self.queue.put(samples)
+            self.sample_count += len(samples)
+    def get_sample_count(self):
+        return self.sample_count
+    def finish(self):
+        self.queue.put(None)
+
 # Helper class to obtain measurements
 class AccelQueryHelper:
     def __init__(self, printer):
@@ -39,20 +119,38 @@ class AccelQueryHelper:
         self.request_start_time = self.request_end_time = print_time
         self.msgs = []
         self.samples = []
+        self.sample_processors = []
+        self.have_end_time = False
+    def add_sample_processor(self, processor):
+        # Pass samples to processor.add_samples() as they arrive instead
+        # of storing them (get_samples() then does not return them)
+        self.sample_processors.append(processor)
     def finish_measurements(self):
         toolhead = self.printer.lookup_object('toolhead')
         self.request_end_time = toolhead.get_last_move_time()
+        self.have_end_time = True
         toolhead.wait_moves()
         self.is_finished = True
+    def _process_batch(self, msg):
+        samples = [s for s in msg['data'] if s[0] >= self.request_start_time]
+        if self.have_end_time:
+            samples = [s for s in samples if s[0] <= self.request_end_time]
+        for processor in self.sample_processors:
+            processor.add_samples(samples)
     def handle_batch(self, msg):
         if self.is_finished:
             return False
+        if self.sample_processors:
+            self._process_batch(msg)
+            return True
         if len(self.msgs) >= 10000:
             # Avoid filling up memory with too many samples
             return False
         self.msgs.append(msg)
         return True
     def has_valid_samples(self):
+        if self.sample_processors:
+            return self.sample_processors[0].get_sample_count() > 0
         for msg in self.msgs:
             data = msg['data']
             first_sample_time = data[0][0]
@@ -85,23 +183,31 @@ class AccelQueryHelper:
                 count += 1
         del samples[count:]
         return self.samples
+    def get_sample_array(self):
+        # Return the samples as an array with a row per sample (this
+        # requires the numpy module)
+        np = bulk_sensor.get_numpy()
+        if not self.msgs:
+            return np.array(self.samples, dtype=float).reshape(-1, 4)
+        data = np.concatenate([np.array(msg['data'], dtype=float).reshape(-1, 4)
+                               for msg in self.msgs])
+        ptimes = data[:, 0]
+        return data[(ptimes >= self.request_start_time)
+                    & (ptimes <= self.request_end_time)]
     def write_to_file(self, filename):
+        # Write the stored samples from a background thread (the file
+        # format is selected by the filename extension)
         def write_impl():
             try:
-                # Try to re-nice writing process
-                os.nice(20)
-            except:
-                pass
-            f = open(filename, "w")
-            f.write("#time,accel_x,accel_y,accel_z\n")
-            samples = self.samples or self.get_samples()
-            for t, accel_x, accel_y, accel_z in samples:
-                f.write("%.6f,%.6f,%.6f,%.6f\n" % (
-                    t, accel_x, accel_y, accel_z))
-            f.close()
-        write_proc = multiprocessing.Process(target=write_impl)
-        write_proc.daemon = True
-        write_proc.start()
+                f = AccelDataFile(filename)
+                f.write_samples(self.samples or self.get_samples())
+                f.close()
+            except (IOError, OSError) as e:
+                logging.warning("Unable to write accelerometer data to"
+                                " '%s': %s", filename, str(e))
+        write_thread = threading.Thread(target=write_impl)
+        write_thread.daemon = True
+        write_thread.start()
 
 # Helper class for G-Code commands
 class AccelCommandHelper:
@@ -142,14 +248,18 @@ class AccelCommandHelper:
         name = gcmd.get("NAME", time.strftime("%Y%m%d_%H%M%S"))
         if not name.replace('-', '').replace('_', '').isalnum():
             raise gcmd.error("Invalid NAME parameter")
+        fmt = gcmd.get("FORMAT", "csv").lower()
+        if fmt not in RAW_DATA_FORMATS:
+            raise gcmd.error("Invalid FORMAT parameter")
         bg_client = self.bg_client
         self.bg_client = None
         bg_client.finish_measurements()
         # Write data to file
         if self.base_name == self.name:
-            filename = "/tmp/%s-%s.csv" % (self.base_name, name)
+            filename = "/tmp/%s-%s.%s" % (self.base_name, name, fmt)
         else:
-            filename = "/tmp/%s-%s-%s.csv" % (self.base_name, self.name, name)
+            filename = "/tmp/%s-%s-%s.%s" % (self.base_name, self.name,
+                                             name, fmt)
         bg_client.write_to_file(filename)
         gcmd.respond_info("Writing raw accelerometer data to %s file"
                           % (filename,))
@@ -175,6 +285,16 @@ class AccelCommandHelper:
         val = gcmd.get("VAL", minval=0, maxval=255, parser=lambda x: int(x, 0))
         self.chip.set_reg(reg, val)
 
+# Convert arrays of sample times and raw (x, y, z) values into a list
+# of [time, accel_x, accel_y, accel_z] samples
+def convert_accel_arrays(axes_map, ptimes, raw_xyz):
+    np = bulk_sensor.get_numpy()
+    samples = np.empty((len(ptimes), 4))
+    samples[:, 0] = ptimes
+    for i, (pos, scale) in enumerate(axes_map):
+        samples[:, i + 1] = raw_xyz[:, pos] * scale
+    return np.round(samples, 6).tolist()
+
 # Helper to read the axes_map parameter from the config
 def read_axes_map(config, scale_x, scale_y, scale_z):
     am = {'x': (0, scale_x), 'y': (1, scale_y), 'z': (2, scale_z),
@@ -259,6 +379,18 @@ class ADXL345:
             samples[count] = (round(ptime, 6), x, y, z)
             count += 1
         del samples[count:]
+    def _convert_sample_arrays(self, ptimes, raw):
+        raw = raw.astype('i4')
+        xlow, ylow, zlow, xzhigh, yzhigh = raw.T
+        is_valid = (yzhigh & 0x80) == 0
+        self.last_error_count += len(is_valid) - int(is_valid.sum())
+        rx = (xlow | ((xzhigh & 0x1f) << 8)) - ((xzhigh & 0x10) << 9)
+        ry = (ylow | ((yzhigh & 0x1f) << 8)) - ((yzhigh & 0x10) << 9)
+        rz = ((zlow | ((xzhigh & 0xe0) << 3) | ((yzhigh & 0xe0) << 6))
+              - ((yzhigh & 0x40) << 7))
+        raw_xyz = bulk_sensor.get_numpy().column_stack((rx, ry, rz))
+        return convert_accel_arrays(self.axes_map, ptimes[is_valid],
+                                    raw_xyz[is_valid])
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing ADXL345 device ID prevents treating
@@ -291,8 +423,8 @@ class ADXL345:
         self.ffreader.note_end()
         logging.info("ADXL345 finished '%s' measurements", self.name)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        samples = self.ffreader.pull_converted_samples(
+            self._convert_samples, self._convert_sample_arrays)
         if not samples:
             return {}
         return {'data': samples, 'errors': self.last_error_count,
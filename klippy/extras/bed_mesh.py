@@ -4,7 +4,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import logging, math, json, collections
-from . import probe
+from . import probe, bulk_sensor
 
 PROFILE_VERSION = 1
 PROFILE_OPTIONS = {
@@ -1338,6 +1338,9 @@ class ZMesh:
             'bicubic': self._sample_bicubic,
             'direct': self._sample_direct
         }
+        if bulk_sensor.get_numpy() is not None:
+            interpolation_algos['lagrange'] = self._sample_lagrange_numpy
+            interpolation_algos['bicubic'] = self._sample_bicubic_numpy
         self._sample = interpolation_algos.get(params['algo'])
         # Number of points to interpolate per segment
         mesh_x_pps = params['mesh_x_pps']
@@ -1619,6 +1622,67 @@ class ZMesh:
         c = m1 * (t3 - 2*t2 + t)
         d = m2 * (t3 - t2)
         return a + b + c + d
+    # Vectorized versions of the above (the results are identical)
+    def _calc_lagrange_numpy(self, lpts, coords, z_values):
+        # Interpolate each row of z_values (the values at lpts) at coords
+        pt_cnt = len(lpts)
+        total = 0.
+        for i in range(pt_cnt):
+            n = 1.
+            d = 1.
+            for j in range(pt_cnt):
+                if j == i:
+                    continue
+                n *= (coords - lpts[j])
+                d *= (lpts[i] - lpts[j])
+            total += z_values[:, i:i+1] * n / d
+        return total
+    def _sample_lagrange_numpy(self, z_matrix):
+        np = bulk_sensor.get_numpy()
+        x_mult = self.x_mult
+        y_mult = self.y_mult
+        probed = np.array(z_matrix, dtype=float)
+        xpts, ypts = self._get_lagrange_coords()
+        # Interpolate X coordinates of rows that have probed coordinates
+        xs = np.array([self.get_x_coordinate(i)
+                       for i in range(self.mesh_x_count)])
+        rows = self._calc_lagrange_numpy(xpts, xs, probed)
+        rows[:, ::x_mult] = probed
+        # Interpolate Y coordinates
+        ys = np.array([self.get_y_coordinate(j)
+                       for j in range(self.mesh_y_count)])
+        mesh = self._calc_lagrange_numpy(ypts, ys, rows.T).T
+        mesh[::y_mult, :] = rows
+        self.mesh_matrix = mesh.tolist()
+    def _get_ctl_pts_numpy(self, np, mult, count):
+        # Return the indexes of the control points and t of each
+        # interpolated position along an axis
+        pos = np.arange(count)
+        pos = pos[pos % mult != 0]
+        seg = pos // mult
+        last_idx = (count - 1) // mult
+        idxs = [np.maximum(seg - 1, 0), seg, seg + 1,
+                np.minimum(seg + 2, last_idx)]
+        return pos, idxs, (pos - seg * mult) / float(mult)
+    def _sample_bicubic_numpy(self, z_matrix):
+        np = bulk_sensor.get_numpy()
+        x_mult = self.x_mult
+        y_mult = self.y_mult
+        c = self.mesh_params['tension']
+        probed = np.array(z_matrix, dtype=float)
+        # Interpolate X values
+        rows = np.empty((len(probed), self.mesh_x_count))
+        rows[:, ::x_mult] = probed
+        pos, idxs, t = self._get_ctl_pts_numpy(np, x_mult, self.mesh_x_count)
+        pts = [probed[:, idx] for idx in idxs] + [t]
+        rows[:, pos] = self._cardinal_spline(pts, c)
+        # Interpolate Y values
+        mesh = np.empty((self.mesh_y_count, self.mesh_x_count))
+        mesh[::y_mult, :] = rows
+        pos, idxs, t = self._get_ctl_pts_numpy(np, y_mult, self.mesh_y_count)
+        pts = [rows[idx, :] for idx in idxs] + [t[:, None]]
+        mesh[pos, :] = self._cardinal_spline(pts, c)
+        self.mesh_matrix = mesh.tolist()
 
 
 class ProfileManager:
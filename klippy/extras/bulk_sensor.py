@@ -3,7 +3,7 @@
 # Copyright (C) 2020-2023  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, threading, struct
+import logging, threading, struct, importlib
 
 # This "bulk sensor" module facilitates the processing of sensor chip
 # measurements that do not require the host to respond with low
@@ -200,6 +200,30 @@ class ClockSyncRegression:
 
 MAX_BULK_MSG_SIZE = 51
 
+# The numpy module is optional - it is used (when available) to decode
+# samples in bulk and by bed_mesh to interpolate the mesh.  It is
+# imported on first use to not slow startup.
+numpy_module = None
+
+def get_numpy():
+    global numpy_module
+    if numpy_module is None:
+        try:
+            numpy_module = importlib.import_module('numpy')
+        except ImportError:
+            numpy_module = False
+    return numpy_module or None
+
+# Return the numpy dtype and field count of a struct format (or None if
+# the fields do not all have the same integer type)
+def get_array_dtype(unpack_fmt):
+    byteorder = {'<': '<', '>': '>', '!': '>'}.get(unpack_fmt[:1], '=')
+    codes = unpack_fmt.lstrip('<>!=@')
+    types = {'B': 'u1', 'b': 'i1', 'H': 'u2', 'h': 'i2', 'I': 'u4', 'i': 'i4'}
+    if len(set(codes)) != 1 or codes[0] not in types:
+        return None, 0
+    return byteorder + types[codes[0]], len(codes)
+
 # Read sensor_bulk_data and calculate timestamps for devices that take
 # samples at a fixed frequency (and produce fixed data size samples).
 class FixedFreqReader:
@@ -210,6 +234,8 @@ class FixedFreqReader:
         self.unpack_from = unpack.unpack_from
         self.bytes_per_sample = unpack.size
         self.samples_per_block = MAX_BULK_MSG_SIZE // self.bytes_per_sample
+        self.array_dtype, self.array_fields = get_array_dtype(unpack_fmt)
+        self.numpy = None
         self.last_sequence = self.max_query_duration = 0
         self.last_overflows = 0
         self.bulk_queue = self.oid = self.query_status_cmd = None
@@ -227,6 +253,8 @@ class FixedFreqReader:
     def _clear_duration_filter(self):
         self.max_query_duration = 1 << 31
     def note_start(self):
+        if self.array_dtype is not None:
+            self.numpy = get_numpy()
         self.last_sequence = 0
         self.last_overflows = 0
         # Clear local queue (clear any stale samples from previous session)
@@ -295,3 +323,52 @@ class FixedFreqReader:
         self.clock_sync.set_last_chip_clock(seq * samples_per_block + i)
         del samples[count:]
         return samples
+    # Array based alternative to pull_samples()
+    def pull_sample_arrays(self):
+        # Return a numpy array of sample times and a numpy array with
+        # the unpacked fields of each sample (one row per sample)
+        np = self.numpy
+        self._update_clock()
+        raw_samples = self.bulk_queue.pull_queue()
+        time_base, chip_base, inv_freq = self.clock_sync.get_time_translation()
+        last_sequence = self.last_sequence
+        bytes_per_sample = self.bytes_per_sample
+        samples_per_block = self.samples_per_block
+        datas = []
+        msg_cdiffs = []
+        counts = []
+        last_chip_clock = None
+        for params in raw_samples:
+            seq_diff = (params['sequence'] - last_sequence) & 0xffff
+            seq_diff -= (seq_diff & 0x8000) << 1
+            seq = last_sequence + seq_diff
+            data = params['data']
+            count = len(data) // bytes_per_sample
+            if not count:
+                continue
+            datas.append(data[:count * bytes_per_sample])
+            msg_cdiffs.append(seq * samples_per_block - chip_base)
+            counts.append(count)
+            last_chip_clock = seq * samples_per_block + count - 1
+        values = np.frombuffer(b"".join(datas), dtype=self.array_dtype)
+        values = values.reshape(-1, self.array_fields)
+        if last_chip_clock is None:
+            return np.zeros(0), values
+        # Sample time is time_base + (msg_cdiff + index_in_msg) * inv_freq
+        counts = np.array(counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        indexes = np.arange(values.shape[0]) - starts
+        ptimes = (np.repeat(msg_cdiffs, counts) + indexes) * inv_freq
+        ptimes += time_base
+        self.clock_sync.set_last_chip_clock(last_chip_clock)
+        return ptimes, values
+    # Pull and convert the pending samples.  The convert_arrays callback
+    # is used when numpy is available (it is passed the results of
+    # pull_sample_arrays() and returns a list of samples), otherwise
+    # convert_samples is called to convert the pull_samples() list.
+    def pull_converted_samples(self, convert_samples, convert_arrays):
+        if self.numpy is not None:
+            return convert_arrays(*self.pull_sample_arrays())
+        samples = self.pull_samples()
+        convert_samples(samples)
+        return samples
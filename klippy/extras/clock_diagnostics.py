@@ -0,0 +1,112 @@
+# Clock synchronization diagnostics
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import math, json, logging
+
+# Fields stored (per clock sample) by clocksync.ClockSync.sample_history
+SAMPLE_HEADER = ('sent_time', 'receive_time', 'clock', 'residual', 'freq',
+                 'pred_stddev', 'ignored')
+# Fields stored (per adjustment) by clocksync.SecondarySync.adj_history
+ADJ_HEADER = ('eventtime', 'print_time', 'adj_offset', 'adj_freq', 'skew')
+
+class PrinterClockDiagnostics:
+    def __init__(self, config):
+        self.printer = config.get_printer()
+        history_size = config.getint('history_size', 600, minval=10)
+        # Enable sample recording in each mcu's clocksync
+        self.mcus = {}
+        for name, mcu in self.printer.lookup_objects('mcu'):
+            mcu.setup_clock_history(history_size)
+            self.mcus[mcu.get_name()] = mcu
+        self.last_status = {}
+        # Register commands
+        webhooks = self.printer.lookup_object('webhooks')
+        webhooks.register_endpoint("clock_diagnostics/dump",
+                                   self._handle_dump_request)
+        gcode = self.printer.lookup_object('gcode')
+        gcode.register_command("DUMP_CLOCK_DIAGNOSTICS",
+                               self.cmd_DUMP_CLOCK_DIAGNOSTICS,
+                               desc=self.cmd_DUMP_CLOCK_DIAGNOSTICS_help)
+    def _dump_history(self, mcu_names=None):
+        if mcu_names is None:
+            mcu_names = sorted(self.mcus.keys())
+        out = {'sample_header': SAMPLE_HEADER, 'adj_header': ADJ_HEADER,
+               'mcus': {}}
+        for name in mcu_names:
+            out['mcus'][name] = self.mcus[name].get_clock_history()
+        return out
+    def _summarize(self, history):
+        mcu_freq = history.get('mcu_freq')
+        samples = history.get('samples')
+        if not samples or not mcu_freq:
+            return None
+        used = [s for s in samples if not s[6]]
+        ignored = len(samples) - len(used)
+        if not used:
+            return None
+        resids = [s[3] / mcu_freq for s in used]
+        resid_avg = sum(resids) / len(resids)
+        resid_var = sum([(r - resid_avg)**2 for r in resids]) / len(resids)
+        hrtts = [.5 * (s[1] - s[0]) for s in used]
+        freq = used[-1][4]
+        res = {'residual_stddev': math.sqrt(resid_var),
+               'residual_max': max([abs(r) for r in resids]),
+               'min_half_rtt': min(hrtts),
+               'avg_half_rtt': sum(hrtts) / len(hrtts),
+               'freq': freq,
+               'freq_ppm': (freq - mcu_freq) * 1000000. / mcu_freq,
+               'ignored': ignored}
+        adjustments = history.get('adjustments')
+        if adjustments:
+            res['skew'] = adjustments[-1][4]
+            res['skew_max'] = max([abs(a[4]) for a in adjustments])
+        return res
+    def stats(self, eventtime):
+        msgs = []
+        status = {}
+        for name, mcu in sorted(self.mcus.items()):
+            summary = self._summarize(mcu.get_clock_history())
+            if summary is None:
+                continue
+            status[name] = summary
+            msg = ("clocksync_%s: resid_stddev=%.9f resid_max=%.9f"
+                   " hrtt_min=%.6f hrtt_avg=%.6f freq_ppm=%.3f ignored=%d" % (
+                       name, summary['residual_stddev'],
+                       summary['residual_max'], summary['min_half_rtt'],
+                       summary['avg_half_rtt'], summary['freq_ppm'],
+                       summary['ignored']))
+            if 'skew' in summary:
+                msg += " skew=%.9f skew_max=%.9f" % (summary['skew'],
+                                                     summary['skew_max'])
+            msgs.append(msg)
+        self.last_status = status
+        return False, ' '.join(msgs)
+    def get_status(self, eventtime):
+        return {'mcus': self.last_status}
+    def _handle_dump_request(self, web_request):
+        mcu_name = web_request.get_str('mcu', None)
+        if mcu_name is None:
+            web_request.send(self._dump_history())
+            return
+        if mcu_name not in self.mcus:
+            raise web_request.error("Unknown mcu '%s'" % (mcu_name,))
+        web_request.send(self._dump_history([mcu_name]))
+    cmd_DUMP_CLOCK_DIAGNOSTICS_help = "Write clock sync history to a file"
+    def cmd_DUMP_CLOCK_DIAGNOSTICS(self, gcmd):
+        filename = gcmd.get('FILENAME', '/tmp/clock_diagnostics.json')
+        data = self._dump_history()
+        try:
+            f = open(filename, 'w')
+            json.dump(data, f)
+            f.close()
+        except (IOError, OSError) as e:
+            logging.exception("clock_diagnostics dump")
+            raise gcmd.error("Unable to write '%s': %s" % (filename, str(e)))
+        total = sum([len(h.get('samples', ()))
+                     for h in data['mcus'].values()])
+        gcmd.respond_info("Wrote %d clock samples to %s" % (total, filename))
+
+def load_config(config):
+    return PrinterClockDiagnostics(config)
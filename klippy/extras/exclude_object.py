@@ -5,9 +5,55 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 
-import logging
+import logging, math
 import json
 
+GRID_CELL_SIZE = 10.
+
+# Return true if a point is inside a polygon (even-odd rule)
+def point_in_polygon(x, y, polygon):
+    inside = False
+    prev_x, prev_y = polygon[-1]
+    for cur_x, cur_y in polygon:
+        if ((cur_y > y) != (prev_y > y)
+            and x < ((prev_x - cur_x) * (y - cur_y) / (prev_y - cur_y)
+                     + cur_x)):
+            inside = not inside
+        prev_x, prev_y = cur_x, cur_y
+    return inside
+
+# Grid of object polygons (by bounding box) for fast point lookups
+class PolygonIndex:
+    def __init__(self, objects):
+        self.cells = {}
+        for obj in objects:
+            try:
+                polygon = [(float(p[0]), float(p[1]))
+                           for p in obj.get('polygon', [])]
+            except (TypeError, ValueError, IndexError):
+                logging.info("exclude_object: Ignoring invalid polygon of"
+                             " object %s", obj['name'])
+                continue
+            if len(polygon) < 3:
+                continue
+            min_cell = self._get_cell(min([p[0] for p in polygon]),
+                                      min([p[1] for p in polygon]))
+            max_cell = self._get_cell(max([p[0] for p in polygon]),
+                                      max([p[1] for p in polygon]))
+            for cx in range(min_cell[0], max_cell[0] + 1):
+                for cy in range(min_cell[1], max_cell[1] + 1):
+                    self.cells.setdefault((cx, cy), []).append(
+                        (obj['name'], polygon))
+    def _get_cell(self, x, y):
+        return (int(math.floor(x / GRID_CELL_SIZE)),
+                int(math.floor(y / GRID_CELL_SIZE)))
+    def lookup(self, x, y):
+        # Return the name of an object containing the given point
+        for name, polygon in self.cells.get(self._get_cell(x, y), ()):
+            if point_in_polygon(x, y, polygon):
+                return name
+        return None
+
 class ExcludeObject:
     def __init__(self, config):
         self.printer = config.get_printer()
@@ -17,6 +63,7 @@ class ExcludeObject:
                                         self._handle_connect)
         self.printer.register_event_handler("virtual_sdcard:reset_file",
                                             self._reset_file)
+        self.polygon_exclusion = config.getboolean('polygon_exclusion', False)
         self.next_transform = None
         self.last_position_extruded = [0., 0., 0., 0.]
         self.last_position_excluded = [0., 0., 0., 0.]
@@ -74,7 +121,9 @@ class ExcludeObject:
 
     def _reset_state(self):
         self.objects = []
+        self.object_names = set()
         self.excluded_objects = []
+        self.excluded_index = None
         self.current_object = None
         self.in_excluded_region = False
 
@@ -136,10 +185,9 @@ class ExcludeObject:
             offset[3] += self.extruder_adj
             self.extruder_adj = 0
 
-        tx_pos = newpos[:]
-        for i in range(4):
-            tx_pos[i] = newpos[i] - offset[i]
-        self.next_transform.move(tx_pos, speed)
+        if offset[0] or offset[1] or offset[2] or offset[3]:
+            newpos = [newpos[i] - offset[i] for i in range(4)]
+        self.next_transform.move(newpos, speed)
 
     def _ignore_move(self, newpos, speed):
         offset = self._get_extrusion_offsets()
@@ -164,10 +212,24 @@ class ExcludeObject:
             - (self.max_position_extruded - self.last_position_extruded[3])
         self._normal_move(newpos, speed)
 
-    def _test_in_excluded_region(self):
+    def _test_in_excluded_polygon(self, newpos):
+        if not self.polygon_exclusion or not self.excluded_objects:
+            return False
+        if self.excluded_index is None:
+            excluded = set(self.excluded_objects)
+            self.excluded_index = PolygonIndex(
+                [obj for obj in self.objects if obj['name'] in excluded])
+        return self.excluded_index.lookup(newpos[0], newpos[1]) is not None
+
+    def _test_in_excluded_region(self, newpos=None):
+        if self.current_object is None and newpos is not None:
+            # Unlabeled move - check if it ends inside a cancelled object
+            if not self._test_in_excluded_polygon(newpos):
+                return False
+        elif self.current_object not in self.excluded_objects:
+            return False
         # Inside cancelled object
-        return self.current_object in self.excluded_objects \
-            and self.initial_extrusion_moves == 0
+        return self.initial_extrusion_moves == 0
 
     def get_status(self, eventtime=None):
         status = {
@@ -178,7 +240,7 @@ class ExcludeObject:
         return status
 
     def move(self, newpos, speed):
-        move_in_excluded_region = self._test_in_excluded_region()
+        move_in_excluded_region = self._test_in_excluded_region(newpos)
         self.last_speed = speed
 
         if move_in_excluded_region:
@@ -196,7 +258,7 @@ class ExcludeObject:
                                     " as labeled"
     def cmd_EXCLUDE_OBJECT_START(self, gcmd):
         name = gcmd.get('NAME').upper()
-        if not any(obj["name"] == name for obj in self.objects):
+        if name not in self.object_names:
             self._add_object_definition({"name": name})
         self.current_object = name
         self.was_excluded_at_start = self._test_in_excluded_region()
@@ -227,6 +289,7 @@ class ExcludeObject:
 
             else:
                 self.excluded_objects = []
+                self.excluded_index = None
 
         elif name:
             if name.upper() not in self.excluded_objects:
@@ -273,12 +336,15 @@ class ExcludeObject:
     def _add_object_definition(self, definition):
         self.objects = sorted(self.objects + [definition],
                               key=lambda o: o["name"])
+        self.object_names.add(definition["name"])
+        self.excluded_index = None
 
     def _exclude_object(self, name):
         self._register_transform()
         self.gcode.respond_info('Excluding object {}'.format(name.upper()))
         if name not in self.excluded_objects:
             self.excluded_objects = sorted(self.excluded_objects + [name])
+            self.excluded_index = None
 
     def _unexclude_object(self, name):
         self.gcode.respond_info('Unexcluding object {}'.format(name.upper()))
@@ -286,6 +352,7 @@ class ExcludeObject:
             excluded_objects = list(self.excluded_objects)
             excluded_objects.remove(name)
             self.excluded_objects = sorted(excluded_objects)
+            self.excluded_index = None
 
     def _list_objects(self, gcmd):
         if gcmd.get('JSON', None) is not None:
@@ -8,7 +8,8 @@
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import math
 
-# Coordinates created by this are converted into G1 commands.
+# Coordinates created by this are passed directly to gcode_move as
+# linear moves.
 #
 # supports XY, XZ & YZ planes with remaining axis as helical
 
@@ -23,12 +24,17 @@ Y_AXIS = 1
 Z_AXIS = 2
 E_AXIS = 3
 
+# Maximum angle of a segment when using chord_tolerance
+MAX_SEGMENT_ANGLE = math.pi / 4.
+
 
 class ArcSupport:
 
     def __init__(self, config):
         self.printer = config.get_printer()
         self.mm_per_arc_segment = config.getfloat('resolution', 1., above=0.0)
+        self.chord_tolerance = config.getfloat('chord_tolerance', None,
+                                               above=0.)
 
         self.gcode_move = self.printer.load_object(config, 'gcode_move')
         self.gcode = self.printer.lookup_object('gcode')
@@ -88,28 +94,25 @@ class ArcSupport:
             raise gcmd.error("G2/G3 requires IJ, IK or JK parameters")
 
         asE = gcmd.get_float("E", None)
-        asF = gcmd.get_float("F", None)
+        asF = gcmd.get_float("F", None, above=0.)
 
-        # Build list of linear coordinates to move
-        coords = self.planArc(currentPos, asTarget, asPlanar,
-                              clockwise, *axes)
+        # Generate linear coordinates to move to
+        segments, coords = self.planArc(currentPos, asTarget, asPlanar,
+                                        clockwise, *axes)
         e_per_move = e_base = 0.
         if asE is not None:
             if gcodestatus['absolute_extrude']:
                 e_base = currentPos[3]
-            e_per_move = (asE - e_base) / len(coords)
+            e_per_move = (asE - e_base) / segments
 
-        # Convert coords into G1 commands
+        # Move to each coordinate
         for coord in coords:
-            g1_params = {'X': coord[0], 'Y': coord[1], 'Z': coord[2]}
+            e = None
             if e_per_move:
-                g1_params['E'] = e_base + e_per_move
+                e = e_base + e_per_move
                 if gcodestatus['absolute_extrude']:
                     e_base += e_per_move
-            if asF is not None:
-                g1_params['F'] = asF
-            g1_gcmd = self.gcode.create_gcode_command("G1", "G1", g1_params)
-            self.gcode_move.cmd_G1(g1_gcmd)
+            self.gcode_move.move_to(coord, e, asF)
 
     # function planArc() originates from marlin plan_arc()
     # https://github.com/MarlinFirmware/Marlin
@@ -119,6 +122,8 @@ class ArcSupport:
     # Arcs smaller then this value, will be a Line only
     #
     # alpha and beta axes are the current plane, helical axis is linear travel
+    #
+    # Returns the number of segments and an iterator over their end points
     def planArc(self, currentPos, targetPos, offset, clockwise,
                 alpha_axis, beta_axis, helical_axis):
         # todo: sometimes produces full circles
@@ -154,28 +159,39 @@ class ArcSupport:
             mm_of_travel = math.hypot(flat_mm, linear_travel)
         else:
             mm_of_travel = math.fabs(flat_mm)
-        segments = max(1., math.floor(mm_of_travel / self.mm_per_arc_segment))
+        if self.chord_tolerance is None:
+            segments = max(1., math.floor(mm_of_travel
+                                          / self.mm_per_arc_segment))
+        else:
+            segments = max(1., math.ceil(mm_of_travel
+                                         / self._calc_segment_length(radius)))
 
         # Generate coordinates
         theta_per_segment = angular_travel / segments
         linear_per_segment = linear_travel / segments
-        coords = []
-        for i in range(1, int(segments)):
-            dist_Helical = i * linear_per_segment
-            cos_Ti = math.cos(i * theta_per_segment)
-            sin_Ti = math.sin(i * theta_per_segment)
-            r_P = -offset[0] * cos_Ti + offset[1] * sin_Ti
-            r_Q = -offset[0] * sin_Ti - offset[1] * cos_Ti
-
-            # Coord doesn't support index assignment, create list
-            c = [None, None, None, None]
-            c[alpha_axis] = center_P + r_P
-            c[beta_axis] = center_Q + r_Q
-            c[helical_axis] = currentPos[helical_axis] + dist_Helical
-            coords.append(self.Coord(*c))
-
-        coords.append(targetPos)
-        return coords
+        def gen_coords():
+            for i in range(1, int(segments)):
+                dist_Helical = i * linear_per_segment
+                cos_Ti = math.cos(i * theta_per_segment)
+                sin_Ti = math.sin(i * theta_per_segment)
+                r_P = -offset[0] * cos_Ti + offset[1] * sin_Ti
+                r_Q = -offset[0] * sin_Ti - offset[1] * cos_Ti
+
+                # Coord doesn't support index assignment, create list
+                c = [None, None, None, None]
+                c[alpha_axis] = center_P + r_P
+                c[beta_axis] = center_Q + r_Q
+                c[helical_axis] = currentPos[helical_axis] + dist_Helical
+                yield self.Coord(*c)
+            yield targetPos
+        return int(segments), gen_coords()
+
+    # Return the longest segment length that keeps the segments within
+    # chord_tolerance of an arc with the given radius
+    def _calc_segment_length(self, radius):
+        cos_half_angle = max(1. - self.chord_tolerance / radius,
+                             math.cos(.5 * MAX_SEGMENT_ANGLE))
+        return radius * 2. * math.acos(cos_half_angle)
 
 def load_config(config):
     return ArcSupport(config)
@@ -0,0 +1,600 @@
+# Background indexing of gcode print files
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import os, re, math, json, shlex, logging, multiprocessing
+import toolhead, kinematics.extruder
+
+INDEX_VERSION = 2
+INDEX_FORMAT = "klipper_gcode_index"
+SCAN_INTERVAL = 10.
+
+# Slicer comments that mark the start of a new layer
+LAYER_MARKERS = [';LAYER_CHANGE', ';LAYER:']
+
+
+######################################################################
+# Move planning
+######################################################################
+
+# Z axis limits (as applied by the cartesian style kinematics)
+class EstimatorKinematics:
+    def __init__(self, limits):
+        self.max_z_velocity = limits['max_z_velocity']
+        self.max_z_accel = limits['max_z_accel']
+    def check_move(self, move):
+        if not move.axes_d[2]:
+            return
+        z_ratio = move.move_d / abs(move.axes_d[2])
+        move.limit_speed(
+            self.max_z_velocity * z_ratio, self.max_z_accel * z_ratio)
+
+# Extruder limits (range and temperature checks are not performed)
+class EstimatorExtruder:
+    def __init__(self, limits):
+        self.instant_corner_v = limits['instantaneous_corner_velocity']
+        self.max_e_velocity = limits['max_extrude_only_velocity']
+        self.max_e_accel = limits['max_extrude_only_accel']
+    calc_junction = kinematics.extruder.PrinterExtruder.calc_junction
+    def check_move(self, move):
+        axis_r = move.axes_r[3]
+        if (not move.axes_d[0] and not move.axes_d[1]) or axis_r < 0.:
+            inv_extrude_r = 1. / abs(axis_r)
+            move.limit_speed(self.max_e_velocity * inv_extrude_r,
+                             self.max_e_accel * inv_extrude_r)
+
+# Toolhead replacement that runs the look-ahead planner and totals the
+# resulting move times instead of generating steps
+class EstimatorToolHead:
+    def __init__(self, limits):
+        self.max_velocity = limits['max_velocity']
+        self.max_accel = limits['max_accel']
+        self.min_cruise_ratio = limits['minimum_cruise_ratio']
+        self.square_corner_velocity = limits['square_corner_velocity']
+        self.junction_deviation = self.max_accel_to_decel = 0.
+        self._calc_junction_deviation()
+        self.kin = EstimatorKinematics(limits)
+        self.extruder = EstimatorExtruder(limits)
+        self.lookahead = toolhead.LookAheadQueue(self)
+        self.lookahead.set_flush_time(toolhead.BUFFER_TIME_HIGH)
+        self.commanded_pos = [0., 0., 0., 0.]
+        self.print_time = 0.
+        self.move_count = 0
+    _calc_junction_deviation = toolhead.ToolHead._calc_junction_deviation
+    def _process_moves(self, moves):
+        print_time = self.print_time
+        for move in moves:
+            print_time += move.accel_t + move.cruise_t + move.decel_t
+        self.print_time = print_time
+        self.move_count += len(moves)
+    def flush(self):
+        self.lookahead.flush()
+    def move(self, newpos, speed):
+        move = toolhead.Move(self, self.commanded_pos, newpos, speed)
+        if not move.move_d:
+            return
+        if move.is_kinematic_move:
+            self.kin.check_move(move)
+        if move.axes_d[3]:
+            self.extruder.check_move(move)
+        self.commanded_pos[:] = move.end_pos
+        self.lookahead.add_move(move)
+    def dwell(self, delay):
+        self.flush()
+        self.print_time += max(0., delay)
+    def set_position(self, newpos):
+        self.flush()
+        self.commanded_pos[:] = newpos
+    def set_velocity_limit(self, velocity=None, accel=None, scv=None,
+                           min_cruise_ratio=None):
+        if velocity is not None:
+            self.max_velocity = velocity
+        if accel is not None:
+            self.max_accel = accel
+        if scv is not None:
+            self.square_corner_velocity = scv
+        if min_cruise_ratio is not None:
+            self.min_cruise_ratio = min_cruise_ratio
+        self._calc_junction_deviation()
+    def get_print_time(self):
+        self.flush()
+        return self.print_time
+
+
+######################################################################
+# G-Code processing
+######################################################################
+
+ARGS_R = re.compile('([A-Z_]+|[A-Z*/])')
+EXTENDED_R = re.compile(
+    r'^\s*(?:N[0-9]+\s*)?'
+    r'(?P<cmd>[a-zA-Z_][a-zA-Z0-9_]+)(?:\s+|$)'
+    r'(?P<args>[^#*;]*?)'
+    r'\s*(?:$|[#*;].*$)')
+MOVE_R = re.compile(r'G1(?:\s+[A-Z][-+0-9.]*)*\s*$')
+
+def get_extended_params(line):
+    m = EXTENDED_R.match(line)
+    if m is None:
+        return {}
+    eparams = [earg.split('=', 1) for earg in shlex.split(m.group('args'))]
+    return {k.upper(): v for k, v in eparams}
+
+# Track the gcode state of a file and send its moves to the planner
+class GCodeEstimator:
+    def __init__(self, limits):
+        self.toolhead = EstimatorToolHead(limits)
+        self.position = [0., 0., 0., 0.]
+        self.absolute_coord = self.absolute_extrude = True
+        self.speed = 25.
+        self.speed_factor = 1. / 60.
+        self.handlers = {
+            'G0': self.cmd_G1, 'G1': self.cmd_G1,
+            'G2': self.cmd_G2, 'G3': self.cmd_G2, 'G4': self.cmd_G4,
+            'G28': self.cmd_G28, 'G90': self.cmd_G90, 'G91': self.cmd_G91,
+            'G92': self.cmd_G92, 'M82': self.cmd_M82, 'M83': self.cmd_M83,
+            'M204': self.cmd_M204, 'M220': self.cmd_M220,
+        }
+        self.extended_handlers = {
+            'SET_VELOCITY_LIMIT': self.cmd_SET_VELOCITY_LIMIT,
+        }
+    def _get_float(self, params, name, default=None):
+        try:
+            return float(params[name])
+        except (KeyError, ValueError):
+            return default
+    def _move(self, params, offset, xy_length=None):
+        # Returns the distance moved on each axis (raises ValueError on
+        # an invalid parameter before any state is changed)
+        position = self.position
+        newpos = list(position)
+        absolute_coord = self.absolute_coord
+        for pos, axis in enumerate('XYZ'):
+            if axis in params:
+                v = float(params[axis])
+                newpos[pos] = v if absolute_coord else newpos[pos] + v
+        if 'E' in params:
+            v = float(params['E'])
+            if absolute_coord and self.absolute_extrude:
+                newpos[3] = v
+            else:
+                newpos[3] += v
+        if 'F' in params:
+            gcode_speed = float(params['F'])
+            if gcode_speed <= 0.:
+                raise ValueError("Invalid speed")
+            self.speed = gcode_speed * self.speed_factor
+        axes_d = [newpos[0] - position[0], newpos[1] - position[1],
+                  newpos[2] - position[2], newpos[3] - position[3]]
+        self.position = newpos
+        if xy_length is not None:
+            # Use the length of an arc instead of the XY distance
+            chord = math.hypot(axes_d[0], axes_d[1])
+            if chord > .000001:
+                axes_d[0] *= xy_length / chord
+                axes_d[1] *= xy_length / chord
+            else:
+                axes_d[0] = xy_length
+        cpos = self.toolhead.commanded_pos
+        self.toolhead.move([cpos[0] + axes_d[0], cpos[1] + axes_d[1],
+                            cpos[2] + axes_d[2], cpos[3] + axes_d[3]],
+                           self.speed)
+        return axes_d
+    # Command handlers
+    def cmd_G1(self, params, offset):
+        try:
+            self._move(params, offset)
+        except ValueError:
+            pass
+    def cmd_G2(self, params, offset):
+        # Arcs are estimated as a single move with the length of the arc
+        try:
+            i = float(params.get('I', 0.))
+            j = float(params.get('J', 0.))
+            end_x = float(params['X']) if 'X' in params else None
+            end_y = float(params['Y']) if 'Y' in params else None
+        except ValueError:
+            return
+        start_x, start_y = self.position[:2]
+        if end_x is None:
+            end_x = start_x
+        elif not self.absolute_coord:
+            end_x += start_x
+        if end_y is None:
+            end_y = start_y
+        elif not self.absolute_coord:
+            end_y += start_y
+        radius = math.hypot(i, j)
+        chord = math.hypot(end_x - start_x, end_y - start_y)
+        angle = 2. * math.pi
+        if chord > .000001 and radius > .000001:
+            angle = 2. * math.asin(min(1., .5 * chord / radius))
+            # Determine if the arc spans more than half a circle
+            cross = i * (end_y - start_y) - j * (end_x - start_x)
+            if (cross > 0.) != (params.get('G') == '2'):
+                angle = 2. * math.pi - angle
+        try:
+            self._move(params, offset, angle * radius)
+        except ValueError:
+            pass
+    def cmd_G4(self, params, offset):
+        delay = self._get_float(params, 'P')
+        if delay is not None:
+            delay /= 1000.
+        else:
+            delay = self._get_float(params, 'S', 0.)
+        self.toolhead.dwell(delay)
+    def cmd_G28(self, params, offset):
+        # Homing time is not estimated
+        axes = [pos for pos, axis in enumerate('XYZ') if axis in params]
+        for pos in axes or [0, 1, 2]:
+            self.position[pos] = 0.
+        self.toolhead.set_position(self.toolhead.commanded_pos)
+    def cmd_G90(self, params, offset):
+        self.absolute_coord = True
+    def cmd_G91(self, params, offset):
+        self.absolute_coord = False
+    def cmd_G92(self, params, offset):
+        for pos, axis in enumerate('XYZE'):
+            v = self._get_float(params, axis)
+            if v is not None:
+                self.position[pos] = v
+    def cmd_M82(self, params, offset):
+        self.absolute_extrude = True
+    def cmd_M83(self, params, offset):
+        self.absolute_extrude = False
+    def cmd_M204(self, params, offset):
+        accel = self._get_float(params, 'S')
+        if accel is None:
+            p = self._get_float(params, 'P')
+            t = self._get_float(params, 'T')
+            if p is None or t is None:
+                return
+            accel = min(p, t)
+        if accel > 0.:
+            self.toolhead.set_velocity_limit(accel=accel)
+    def cmd_M220(self, params, offset):
+        value = self._get_float(params, 'S', 100.)
+        if value > 0.:
+            value /= 60. * 100.
+            self.speed = self.speed / self.speed_factor * value
+            self.speed_factor = value
+    def cmd_SET_VELOCITY_LIMIT(self, params, offset):
+        th = self.toolhead
+        velocity = self._get_float(params, 'VELOCITY')
+        accel = self._get_float(params, 'ACCEL')
+        scv = self._get_float(params, 'SQUARE_CORNER_VELOCITY')
+        min_cruise_ratio = self._get_float(params, 'MINIMUM_CRUISE_RATIO')
+        if velocity is not None and velocity <= 0.:
+            velocity = None
+        if accel is not None and accel <= 0.:
+            accel = None
+        if scv is not None and scv < 0.:
+            scv = None
+        if min_cruise_ratio is None:
+            accel_to_decel = self._get_float(params, 'ACCEL_TO_DECEL')
+            if accel_to_decel is not None and accel_to_decel > 0.:
+                min_cruise_ratio = 1. - min(1., accel_to_decel
+                                            / (accel or th.max_accel))
+        elif not 0. <= min_cruise_ratio < 1.:
+            min_cruise_ratio = None
+        th.set_velocity_limit(velocity, accel, scv, min_cruise_ratio)
+    # Line processing
+    def process_comment(self, comment, offset):
+        pass
+    def process_line(self, line, offset):
+        cpos = line.find(';')
+        if cpos >= 0:
+            self.process_comment(line[cpos:], offset)
+            line = line[:cpos]
+        uline = line.upper()
+        if MOVE_R.match(uline):
+            # Fast path for regular moves (with spaces between parameters)
+            try:
+                self._move({w[0]: w[1:] for w in uline[3:].split()}, offset)
+                return
+            except ValueError:
+                pass
+        parts = ARGS_R.split(uline)
+        numparts = len(parts)
+        if numparts >= 3 and parts[1] != 'N':
+            cmd = parts[1] + parts[2].strip()
+        elif numparts >= 5 and parts[1] == 'N':
+            # Skip line number at start of command
+            cmd = parts[3] + parts[4].strip()
+        else:
+            return
+        handler = self.handlers.get(cmd)
+        if handler is not None:
+            params = {parts[i]: parts[i+1].strip()
+                      for i in range(1, numparts, 2)}
+            handler(params, offset)
+            return
+        handler = self.extended_handlers.get(cmd)
+        if handler is not None:
+            try:
+                params = get_extended_params(line)
+            except ValueError:
+                return
+            handler(params, offset)
+    def scan(self, f):
+        offset = 0
+        process_line = self.process_line
+        for line in f:
+            process_line(line.decode(errors='replace'), offset)
+            offset += len(line)
+    def get_estimated_time(self):
+        return self.toolhead.get_print_time()
+
+
+######################################################################
+# G-Code file scanning
+######################################################################
+
+# Extract layer offsets, object definitions, filament usage, and an
+# estimated print time from a gcode file
+class GCodeScanner(GCodeEstimator):
+    def __init__(self, limits):
+        GCodeEstimator.__init__(self, limits)
+        self.filament_total = 0.
+        self.marker_layers = []
+        self.z_layers = []
+        self.layer_z = None
+        self.z_change_offset = 0
+        self.objects = []
+        self.extended_handlers['EXCLUDE_OBJECT_DEFINE'] = (
+            self.cmd_EXCLUDE_OBJECT_DEFINE)
+    def _move(self, params, offset, xy_length=None):
+        axes_d = GCodeEstimator._move(
+            self, params, offset, xy_length)
+        if axes_d[2]:
+            self.z_change_offset = offset
+        if axes_d[3] > 0.:
+            self.filament_total += axes_d[3]
+            z = self.position[2]
+            if (axes_d[0] or axes_d[1]) and (self.layer_z is None
+                                             or z > self.layer_z):
+                self.layer_z = z
+                self.z_layers.append(self.z_change_offset)
+        return axes_d
+    def cmd_EXCLUDE_OBJECT_DEFINE(self, params, offset):
+        name = params.pop('NAME', '').upper()
+        if not name:
+            return
+        center = params.pop('CENTER', None)
+        polygon = params.pop('POLYGON', None)
+        obj = {"name": name}
+        obj.update(params)
+        try:
+            if center is not None:
+                obj['center'] = json.loads('[%s]' % center)
+            if polygon is not None:
+                obj['polygon'] = json.loads(polygon)
+        except ValueError:
+            pass
+        self.objects.append(obj)
+    def process_comment(self, comment, offset):
+        for marker in LAYER_MARKERS:
+            if comment.startswith(marker):
+                self.marker_layers.append(offset)
+                break
+    def get_metadata(self):
+        layers = self.marker_layers or self.z_layers
+        return {'layers': layers, 'objects': self.objects,
+                'estimated_time': round(self.get_estimated_time(), 3),
+                'filament_total': round(self.filament_total, 3)}
+
+
+######################################################################
+# Printer limits
+######################################################################
+
+# Return the velocity and acceleration limits of the printer
+def get_printer_limits(printer):
+    th = printer.lookup_object('toolhead')
+    status = th.get_status(printer.get_reactor().monotonic())
+    max_velocity, max_accel = th.get_max_velocity()
+    kin = th.get_kinematics()
+    extruder = th.get_extruder()
+    return {
+        'max_velocity': max_velocity, 'max_accel': max_accel,
+        'minimum_cruise_ratio': status['minimum_cruise_ratio'],
+        'square_corner_velocity': status['square_corner_velocity'],
+        'max_z_velocity': getattr(kin, 'max_z_velocity', max_velocity),
+        'max_z_accel': getattr(kin, 'max_z_accel', max_accel),
+        'instantaneous_corner_velocity': getattr(
+            extruder, 'instant_corner_v', 1.),
+        'max_extrude_only_velocity': getattr(
+            extruder, 'max_e_velocity', max_velocity),
+        'max_extrude_only_accel': getattr(
+            extruder, 'max_e_accel', max_accel)}
+
+
+######################################################################
+# Index files
+######################################################################
+
+def get_index_filename(index_dirname, fname):
+    return os.path.join(index_dirname, fname + ".index")
+
+def _get_file_info(filename, limits):
+    st = os.stat(filename)
+    return {'version': INDEX_VERSION, 'size': st.st_size,
+            'mtime': st.st_mtime, 'limits': limits}
+
+def load_index(filename, index_filename, limits):
+    # Return the stored metadata of a file (or None if not up to date)
+    try:
+        f = open(index_filename, 'r')
+        data = json.load(f)
+        f.close()
+        info = _get_file_info(filename, limits)
+    except (IOError, OSError, ValueError):
+        return None
+    if data.get('info') != info:
+        return None
+    return data['metadata']
+
+def build_index(filename, index_filename, limits):
+    info = _get_file_info(filename, limits)
+    scanner = GCodeScanner(limits)
+    f = open(filename, 'rb')
+    scanner.scan(f)
+    f.close()
+    metadata = scanner.get_metadata()
+    # Write the index atomically
+    index_dirname = os.path.dirname(index_filename)
+    if not os.path.isdir(index_dirname):
+        os.makedirs(index_dirname)
+    tmpname = index_filename + ".tmp"
+    f = open(tmpname, 'w')
+    json.dump({'format': INDEX_FORMAT, 'info': info, 'metadata': metadata},
+              f, separators=(',', ':'))
+    f.close()
+    os.rename(tmpname, index_filename)
+    return metadata
+
+def get_metadata(dirname, index_dirname, fname, limits):
+    filename = os.path.join(dirname, fname)
+    index_filename = get_index_filename(index_dirname, fname)
+    metadata = load_index(filename, index_filename, limits)
+    if metadata is None:
+        metadata = build_index(filename, index_filename, limits)
+    return metadata
+
+def is_index_file(index_filename):
+    try:
+        f = open(index_filename, 'r')
+        data = json.load(f)
+        f.close()
+    except (IOError, OSError, ValueError):
+        return False
+    return type(data) == dict and data.get('format') == INDEX_FORMAT
+
+# Remove the index files of g-code files that no longer exist
+def prune_index(index_dirname, fnames):
+    valid = set([get_index_filename(index_dirname, fname)
+                 for fname in fnames])
+    for root, dirs, files in os.walk(index_dirname):
+        for name in files:
+            index_filename = os.path.join(root, name)
+            if (name.endswith(".index") and index_filename not in valid
+                and is_index_file(index_filename)):
+                os.remove(index_filename)
+
+# Main loop of the background indexing process
+def index_process(dirname, index_dirname, limits, conn):
+    import queuelogger
+    queuelogger.clear_bg_logging()
+    pending = []
+    while 1:
+        if not pending or conn.poll():
+            msg = conn.recv()
+            if msg is None:
+                break
+            cmd, fnames = msg
+            if cmd == 'scan':
+                pending = list(fnames)
+                if not os.path.isdir(dirname):
+                    # Don't remove the index of an unmounted directory
+                    continue
+                try:
+                    prune_index(index_dirname, fnames)
+                except OSError:
+                    logging.exception("gcode_metadata prune")
+                continue
+            # Explicit request for the metadata of a file
+            fname = fnames
+            try:
+                res = get_metadata(dirname, index_dirname, fname, limits)
+            except:
+                logging.exception("gcode_metadata index %s", fname)
+                res = None
+            conn.send((fname, res))
+            continue
+        fname = pending.pop(0)
+        try:
+            get_metadata(dirname, index_dirname, fname, limits)
+        except:
+            logging.exception("gcode_metadata index %s", fname)
+    conn.close()
+
+
+######################################################################
+# Host side helper
+######################################################################
+
+class GCodeMetadataIndexer:
+    def __init__(self, printer, dirname, index_dirname, get_file_list,
+                 metadata_cb):
+        self.printer = printer
+        self.reactor = printer.get_reactor()
+        self.dirname = dirname
+        self.index_dirname = index_dirname
+        self.get_file_list = get_file_list
+        self.metadata_cb = metadata_cb
+        self.conn = self.index_proc = self.fd_handle = None
+        self.scan_timer = None
+        self.last_file_list = None
+        printer.register_event_handler("klippy:ready", self._handle_ready)
+        printer.register_event_handler("klippy:disconnect",
+                                       self._handle_disconnect)
+    def _handle_ready(self):
+        limits = get_printer_limits(self.printer)
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self.index_proc = multiprocessing.Process(
+            target=index_process,
+            args=(self.dirname, self.index_dirname, limits, child_conn))
+        self.index_proc.daemon = True
+        self.index_proc.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.fd_handle = self.reactor.register_fd(self.conn.fileno(),
+                                                  self._handle_response)
+        self.scan_timer = self.reactor.register_timer(self._scan_files,
+                                                      self.reactor.NOW)
+    def _handle_disconnect(self):
+        if self.conn is None:
+            return
+        self.reactor.unregister_timer(self.scan_timer)
+        self.reactor.unregister_fd(self.fd_handle)
+        try:
+            self.conn.send(None)
+        except (IOError, OSError):
+            pass
+        self.index_proc.join(1.)
+        self.conn.close()
+        self.conn = None
+    def _send(self, msg):
+        try:
+            self.conn.send(msg)
+        except (IOError, OSError):
+            logging.exception("gcode_metadata send")
+    def _scan_files(self, eventtime):
+        if not os.path.isdir(self.dirname):
+            return eventtime + SCAN_INTERVAL
+        try:
+            flist = self.get_file_list(check_subdirs=True)
+        except self.printer.command_error:
+            return eventtime + SCAN_INTERVAL
+        if flist != self.last_file_list:
+            self.last_file_list = flist
+            self._send(('scan', [fname for fname, fsize in flist]))
+        return eventtime + SCAN_INTERVAL
+    def _handle_response(self, eventtime):
+        try:
+            fname, metadata = self.conn.recv()
+        except (EOFError, IOError, OSError):
+            logging.info("gcode_metadata indexing process exited")
+            self.reactor.unregister_fd(self.fd_handle)
+            self.reactor.unregister_timer(self.scan_timer)
+            self.conn.close()
+            self.conn = None
+            return
+        if metadata is not None:
+            self.metadata_cb(fname, metadata)
+    def request_metadata(self, fname):
+        # Results are reported via the metadata callback
+        if self.conn is not None:
+            self._send(('index', fname))
@@ -141,6 +141,20 @@ class GCodeMove:
             raise gcmd.error("Unable to parse move '%s'"
                              % (gcmd.get_commandline(),))
         self.move_with_transform(self.last_position, self.speed)
+    def move_to(self, coord, e=None, gcode_speed=None):
+        # Move to an absolute X, Y, Z position (e and gcode_speed are
+        # handled like the E and F parameters of a G1 command)
+        for pos in range(3):
+            self.last_position[pos] = coord[pos] + self.base_position[pos]
+        if e is not None:
+            v = e * self.extrude_factor
+            if not self.absolute_extrude:
+                self.last_position[3] += v
+            else:
+                self.last_position[3] = v + self.base_position[3]
+        if gcode_speed is not None:
+            self.speed = gcode_speed * self.speed_factor
+        self.move_with_transform(self.last_position, self.speed)
     # G-Code coordinate manipulation
     def cmd_G20(self, gcmd):
         # Set units to inches
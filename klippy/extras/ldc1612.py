@@ -161,6 +161,20 @@ class LDC1612:
                 self.last_error_count += 1
             samples[count] = (round(ptime, 6), round(freq_conv * mv, 3), 999.9)
             count += 1
+        if self.calibration is not None:
+            self.calibration.apply_calibration(samples)
+    def _convert_sample_arrays(self, ptimes, raw):
+        np = bulk_sensor.get_numpy()
+        vals = raw[:, 0]
+        mvs = vals & 0x0fffffff
+        self.last_error_count += int((mvs != vals).sum())
+        samples = np.empty((len(ptimes), 3))
+        samples[:, 0] = np.round(ptimes, 6)
+        samples[:, 1] = np.round(mvs * (float(LDC1612_FREQ) / (1<<28)), 3)
+        samples[:, 2] = 999.9
+        if self.calibration is not None:
+            self.calibration.apply_calibration_array(samples)
+        return samples.tolist()
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing LDC1612 device ID prevents treating
@@ -196,11 +210,9 @@ class LDC1612:
         self.ffreader.note_end()
         logging.info("LDC1612 finished '%s' measurements", self.name)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        samples = self.ffreader.pull_converted_samples(
+            self._convert_samples, self._convert_sample_arrays)
         if not samples:
             return {}
-        if self.calibration is not None:
-            self.calibration.apply_calibration(samples)
         return {'data': samples, 'errors': self.last_error_count,
                 'overflows': self.ffreader.get_last_overflows()}
@@ -96,6 +96,8 @@ class LIS2DW:
             z = round(raw_xyz[z_pos] * z_scale, 6)
             samples[count] = (round(ptime, 6), x, y, z)
             count += 1
+    def _convert_sample_arrays(self, ptimes, raw_xyz):
+        return adxl345.convert_accel_arrays(self.axes_map, ptimes, raw_xyz)
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing LIS2DW device ID prevents treating
@@ -134,8 +136,8 @@ class LIS2DW:
         logging.info("LIS2DW finished '%s' measurements", self.name)
         self.set_reg(REG_LIS2DW_FIFO_CTRL, 0x00)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        samples = self.ffreader.pull_converted_samples(
+            self._convert_samples, self._convert_sample_arrays)
         if not samples:
             return {}
         return {'data': samples, 'errors': self.last_error_count,
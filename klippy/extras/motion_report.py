@@ -3,34 +3,76 @@
 # Copyright (C) 2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging
+import logging, struct, base64
 import chelper
 from . import bulk_sensor
 
+# Helper to extract history from the C code into a reusable buffer
+class HistoryBuffer:
+    def __init__(self, ctype, fields, fmt, extract_cb):
+        self.ctype = ctype
+        self.fields = fields
+        self.extract_cb = extract_cb
+        self.ffi_main, ffi_lib = chelper.get_ffi()
+        self.item_size = self.ffi_main.sizeof(ctype)
+        # Struct format of raw buffer (including any trailing padding)
+        pad = self.item_size - struct.calcsize('<' + fmt)
+        self.format = '<' + fmt + 'x' * pad
+        self.data = self.ffi_main.new(ctype + '[]', 128)
+        self.dtype = None
+    def extract(self, start, end):
+        # Fill buffer (in chronological order) with entries in range.
+        # Results are only valid until the next call to extract().
+        while 1:
+            count = self.extract_cb(self.data, start, end)
+            if count <= len(self.data):
+                return self.data, count
+            self.data = self.ffi_main.new(self.ctype + '[]', count * 2)
+    def get_buffer(self, count):
+        # Zero-copy view of the first 'count' entries
+        return self.ffi_main.buffer(self.data, count * self.item_size)
+    def get_numpy(self, count):
+        # Zero-copy numpy structured array of the first 'count' entries
+        # (or None if numpy is not available)
+        np = bulk_sensor.get_numpy()
+        if np is None:
+            return None
+        if self.dtype is None:
+            codes = self.format[1:].rstrip('x')
+            offsets = [struct.calcsize('<' + codes[:i])
+                       for i in range(len(codes))]
+            self.dtype = np.dtype({
+                'names': list(self.fields),
+                'formats': ['<' + c for c in codes],
+                'offsets': offsets, 'itemsize': self.item_size})
+        return np.frombuffer(self.get_buffer(count), dtype=self.dtype)
+    def get_packed_header(self):
+        return {'header': self.fields, 'format': self.format}
+
 # Extract stepper queue_step messages
 class DumpStepper:
     def __init__(self, printer, mcu_stepper):
         self.printer = printer
         self.mcu_stepper = mcu_stepper
-        self.last_batch_clock = 0
+        self.last_batch_clock = self.last_packed_clock = 0
+        self.history = HistoryBuffer(
+            'struct pull_history_steps',
+            ('first_clock', 'last_clock', 'start_position',
+             'step_count', 'interval', 'add'), 'QQqiii',
+            mcu_stepper.extract_step_history)
         self.batch_bulk = bulk_sensor.BatchBulkHelper(printer,
                                                       self._process_batch)
         api_resp = {'header': ('interval', 'count', 'add')}
         self.batch_bulk.add_mux_endpoint("motion_report/dump_stepper", "name",
                                          mcu_stepper.get_name(), api_resp)
+        self.packed_bulk = bulk_sensor.BatchBulkHelper(
+            printer, self._process_packed_batch)
+        self.packed_bulk.add_mux_endpoint(
+            "motion_report/dump_stepper_packed", "name",
+            mcu_stepper.get_name(), self.history.get_packed_header())
     def get_step_queue(self, start_clock, end_clock):
-        mcu_stepper = self.mcu_stepper
-        res = []
-        while 1:
-            data, count = mcu_stepper.dump_steps(128, start_clock, end_clock)
-            if not count:
-                break
-            res.append((data, count))
-            if count < len(data):
-                break
-            end_clock = data[count-1].first_clock
-        res.reverse()
-        return ([d[i] for d, cnt in res for i in range(cnt-1, -1, -1)], res)
+        data, count = self.history.extract(start_clock, end_clock)
+        return ([data[i] for i in range(count)], (data, count))
     def log_steps(self, data):
         if not data:
             return
@@ -43,24 +85,39 @@ class DumpStepper:
                        % (i, s.first_clock, s.start_position, s.interval,
                           s.step_count, s.add))
         logging.info('\n'.join(out))
-    def _process_batch(self, eventtime):
-        data, cdata = self.get_step_queue(self.last_batch_clock, 1<<63)
-        if not data:
-            return {}
+    def _batch_info(self, data, count):
         clock_to_print_time = self.mcu_stepper.get_mcu().clock_to_print_time
         first = data[0]
         first_clock = first.first_clock
-        first_time = clock_to_print_time(first_clock)
-        self.last_batch_clock = last_clock = data[-1].last_clock
-        last_time = clock_to_print_time(last_clock)
+        last_clock = data[count-1].last_clock
         mcu_pos = first.start_position
         start_position = self.mcu_stepper.mcu_to_commanded_position(mcu_pos)
         step_dist = self.mcu_stepper.get_step_dist()
-        d = [(s.interval, s.step_count, s.add) for s in data]
-        return {"data": d, "start_position": start_position,
+        return {"start_position": start_position,
                 "start_mcu_position": mcu_pos, "step_distance": step_dist,
-                "first_clock": first_clock, "first_step_time": first_time,
-                "last_clock": last_clock, "last_step_time": last_time}
+                "first_clock": first_clock,
+                "first_step_time": clock_to_print_time(first_clock),
+                "last_clock": last_clock,
+                "last_step_time": clock_to_print_time(last_clock)}
+    def _process_batch(self, eventtime):
+        data, count = self.history.extract(self.last_batch_clock, 1<<63)
+        if not count:
+            return {}
+        msg = self._batch_info(data, count)
+        self.last_batch_clock = msg["last_clock"]
+        msg["data"] = [(s.interval, s.step_count, s.add)
+                       for s in data[0:count]]
+        return msg
+    def _process_packed_batch(self, eventtime):
+        data, count = self.history.extract(self.last_packed_clock, 1<<63)
+        if not count:
+            return {}
+        msg = self._batch_info(data, count)
+        self.last_packed_clock = msg["last_clock"]
+        msg["count"] = count
+        msg["packed_data"] = base64.b64encode(
+            self.history.get_buffer(count)).decode()
+        return msg
 
 NEVER_TIME = 9999999999999999.
 
@@ -71,27 +128,29 @@ class DumpTrapQ:
         self.name = name
         self.trapq = trapq
         self.last_batch_msg = (0., 0.)
+        self.last_packed_msg = (0., 0.)
+        ffi_main, ffi_lib = chelper.get_ffi()
+        self.history = HistoryBuffer(
+            'struct pull_move',
+            ('print_time', 'move_t', 'start_v', 'accel',
+             'start_x', 'start_y', 'start_z', 'x_r', 'y_r', 'z_r'),
+            'dddddddddd',
+            (lambda data, start, end: ffi_lib.trapq_extract_history(
+                trapq, data, len(data), start, end)))
         self.batch_bulk = bulk_sensor.BatchBulkHelper(printer,
                                                       self._process_batch)
         api_resp = {'header': ('time', 'duration', 'start_velocity',
                                'acceleration', 'start_position', 'direction')}
         self.batch_bulk.add_mux_endpoint("motion_report/dump_trapq",
                                          "name", name, api_resp)
+        self.packed_bulk = bulk_sensor.BatchBulkHelper(
+            printer, self._process_packed_batch)
+        self.packed_bulk.add_mux_endpoint(
+            "motion_report/dump_trapq_packed", "name", name,
+            self.history.get_packed_header())
     def extract_trapq(self, start_time, end_time):
-        ffi_main, ffi_lib = chelper.get_ffi()
-        res = []
-        while 1:
-            data = ffi_main.new('struct pull_move[128]')
-            count = ffi_lib.trapq_extract_old(self.trapq, data, len(data),
-                                              start_time, end_time)
-            if not count:
-                break
-            res.append((data, count))
-            if count < len(data):
-                break
-            end_time = data[count-1].print_time
-        res.reverse()
-        return ([d[i] for d, cnt in res for i in range(cnt-1, -1, -1)], res)
+        data, count = self.history.extract(start_time, end_time)
+        return ([data[i] for i in range(count)], (data, count))
     def log_trapq(self, data):
         if not data:
             return
@@ -117,16 +176,31 @@ class DumpTrapQ:
         return pos, velocity
     def _process_batch(self, eventtime):
         qtime = self.last_batch_msg[0] + min(self.last_batch_msg[1], 0.100)
-        data, cdata = self.extract_trapq(qtime, NEVER_TIME)
+        data, count = self.history.extract(qtime, NEVER_TIME)
         d = [(m.print_time, m.move_t, m.start_v, m.accel,
               (m.start_x, m.start_y, m.start_z), (m.x_r, m.y_r, m.z_r))
-             for m in data]
+             for m in data[0:count]]
         if d and d[0] == self.last_batch_msg:
             d.pop(0)
         if not d:
             return {}
         self.last_batch_msg = d[-1]
         return {"data": d}
+    def _process_packed_batch(self, eventtime):
+        last_time, last_move_t = self.last_packed_msg
+        qtime = last_time + min(last_move_t, 0.100)
+        data, count = self.history.extract(qtime, NEVER_TIME)
+        first = 0
+        if (count and data[0].print_time == last_time
+            and data[0].move_t == last_move_t):
+            first = 1
+        if first >= count:
+            return {}
+        last = data[count-1]
+        self.last_packed_msg = (last.print_time, last.move_t)
+        buf = self.history.get_buffer(count)[first * self.history.item_size:]
+        return {"count": count - first,
+                "packed_data": base64.b64encode(buf).decode()}
 
 STATUS_REFRESH_TIME = 0.250
 
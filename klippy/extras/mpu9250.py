@@ -113,6 +113,8 @@ class MPU9250:
             z = round(raw_xyz[z_pos] * z_scale, 6)
             samples[count] = (round(ptime, 6), x, y, z)
             count += 1
+    def _convert_sample_arrays(self, ptimes, raw_xyz):
+        return adxl345.convert_accel_arrays(self.axes_map, ptimes, raw_xyz)
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing MPU9250 device ID prevents treating
@@ -161,8 +163,8 @@ class MPU9250:
         self.set_reg(REG_PWR_MGMT_1, SET_PWR_MGMT_1_SLEEP)
         self.set_reg(REG_PWR_MGMT_2, SET_PWR_MGMT_2_OFF)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        samples = self.ffreader.pull_converted_samples(
+            self._convert_samples, self._convert_sample_arrays)
         if not samples:
             return {}
         return {'data': samples, 'errors': self.last_error_count,
@@ -3,6 +3,7 @@
 # Copyright (C) 2020  Eric Callahan <arksine.code@gmail.com>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
+import bisect
 
 class PrintStats:
     def __init__(self, config):
@@ -24,6 +25,14 @@ class PrintStats:
     def set_current_file(self, filename):
         self.reset()
         self.filename = filename
+    def set_file_metadata(self, metadata, file_position_cb):
+        self.file_metadata = {
+            'layer_count': len(metadata['layers']),
+            'estimated_time': metadata['estimated_time'],
+            'filament_total': metadata['filament_total'],
+            'objects': metadata['objects']}
+        self.layer_offsets = metadata['layers']
+        self.file_position_cb = file_position_cb
     def note_start(self):
         curtime = self.reactor.monotonic()
         if self.print_start_time is None:
@@ -91,6 +100,16 @@ class PrintStats:
         self.init_duration = 0.
         self.info_total_layer = None
         self.info_current_layer = None
+        self.file_metadata = {}
+        self.layer_offsets = []
+        self.file_position_cb = None
+    def _get_metadata_status(self):
+        if not self.file_metadata:
+            return self.file_metadata
+        status = dict(self.file_metadata)
+        status['current_layer'] = bisect.bisect_right(
+            self.layer_offsets, self.file_position_cb())
+        return status
     def get_status(self, eventtime):
         time_paused = self.prev_pause_duration
         if self.print_start_time is not None:
@@ -113,7 +132,8 @@ class PrintStats:
             'state': self.state,
             'message': self.error_message,
             'info': {'total_layer': self.info_total_layer,
-                     'current_layer': self.info_current_layer}
+                     'current_layer': self.info_current_layer},
+            'metadata': self._get_metadata_status()
         }
 
 def load_config(config):
@@ -0,0 +1,145 @@
+# Estimate the duration of gcode files using the toolhead move planner
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import os, math, logging, multiprocessing, traceback
+from . import gcode_metadata
+
+LIMIT_NAMES = [
+    'max_velocity', 'max_accel', 'minimum_cruise_ratio',
+    'square_corner_velocity', 'max_z_velocity', 'max_z_accel',
+    'instantaneous_corner_velocity', 'max_extrude_only_velocity',
+    'max_extrude_only_accel']
+
+
+######################################################################
+# Estimation
+######################################################################
+
+def estimate_file(filename, limits):
+    estimator = gcode_metadata.GCodeEstimator(limits)
+    f = open(filename, 'rb')
+    estimator.scan(f)
+    f.close()
+    return {'estimated_time': estimator.get_estimated_time(),
+            'move_count': estimator.toolhead.move_count}
+
+# Determine the printer limits from the sections of a config file
+# (the defaults match those used by the printer and extruder sections)
+def get_config_limits(fileconfig):
+    def getfloat(section, option, default):
+        if fileconfig.has_option(section, option):
+            return float(fileconfig.get(section, option))
+        return default
+    max_velocity = getfloat('printer', 'max_velocity', None)
+    max_accel = getfloat('printer', 'max_accel', None)
+    if max_velocity is None or max_accel is None:
+        raise ValueError("Config must specify max_velocity and max_accel")
+    limits = {
+        'max_velocity': max_velocity, 'max_accel': max_accel,
+        'minimum_cruise_ratio': getfloat('printer', 'minimum_cruise_ratio',
+                                         .5),
+        'square_corner_velocity': getfloat(
+            'printer', 'square_corner_velocity', 5.),
+        'max_z_velocity': getfloat('printer', 'max_z_velocity', max_velocity),
+        'max_z_accel': getfloat('printer', 'max_z_accel', max_accel)}
+    nozzle_diameter = getfloat('extruder', 'nozzle_diameter', .4)
+    filament_diameter = getfloat('extruder', 'filament_diameter', 1.75)
+    filament_area = math.pi * (filament_diameter * .5)**2
+    def_max_extrude_ratio = 4. * nozzle_diameter**2 / filament_area
+    limits.update({
+        'instantaneous_corner_velocity': getfloat(
+            'extruder', 'instantaneous_corner_velocity', 1.),
+        'max_extrude_only_velocity': getfloat(
+            'extruder', 'max_extrude_only_velocity',
+            max_velocity * def_max_extrude_ratio),
+        'max_extrude_only_accel': getfloat(
+            'extruder', 'max_extrude_only_accel',
+            max_accel * def_max_extrude_ratio)})
+    return limits
+
+
+######################################################################
+# Webhooks interface
+######################################################################
+
+class PrintTimeEstimator:
+    def __init__(self, config):
+        self.printer = config.get_printer()
+        self.sdcard = None
+        self.printer.register_event_handler("klippy:connect",
+                                            self._handle_connect)
+        webhooks = self.printer.lookup_object('webhooks')
+        webhooks.register_endpoint("print_time_estimator/estimate",
+                                   self._handle_estimate_request)
+    def _handle_connect(self):
+        self.sdcard = self.printer.lookup_object('virtual_sdcard', None)
+    def _lookup_file(self, web_request):
+        # Only files in the virtual_sdcard file list may be estimated
+        if self.sdcard is None:
+            raise web_request.error("virtual_sdcard not configured")
+        filename = os.path.normpath(web_request.get_str('filename'))
+        filename = filename.lstrip('/')
+        try:
+            files = self.sdcard.get_file_list(check_subdirs=True)
+        except self.printer.command_error as e:
+            raise web_request.error(str(e))
+        flist = [fname for fname, fsize in files]
+        if filename not in flist:
+            files_by_lower = {fname.lower(): fname for fname in flist}
+            if filename.lower() not in files_by_lower:
+                raise web_request.error("Unknown file '%s'" % (filename,))
+            filename = files_by_lower[filename.lower()]
+        return os.path.join(self.sdcard.sdcard_dirname, filename)
+    def _run_background(self, filename, limits):
+        import queuelogger
+        parent_conn, child_conn = multiprocessing.Pipe()
+        def wrapper():
+            queuelogger.clear_bg_logging()
+            try:
+                res = estimate_file(filename, limits)
+            except:
+                child_conn.send((True, traceback.format_exc()))
+                child_conn.close()
+                return
+            child_conn.send((False, res))
+            child_conn.close()
+        calc_proc = multiprocessing.Process(target=wrapper)
+        calc_proc.daemon = True
+        calc_proc.start()
+        # Wait for the estimate without blocking other work
+        reactor = self.printer.get_reactor()
+        eventtime = reactor.monotonic()
+        while not parent_conn.poll():
+            if not calc_proc.is_alive() and not parent_conn.poll():
+                calc_proc.join()
+                raise self.printer.command_error(
+                    "Estimation process exited with code %s"
+                    % (calc_proc.exitcode,))
+            eventtime = reactor.pause(eventtime + .1)
+        is_err, res = parent_conn.recv()
+        calc_proc.join()
+        parent_conn.close()
+        if is_err:
+            logging.info("print_time_estimator error: %s", res)
+            raise self.printer.command_error("Unable to estimate '%s'"
+                                             % (filename,))
+        return res
+    def _handle_estimate_request(self, web_request):
+        filename = self._lookup_file(web_request)
+        limits = gcode_metadata.get_printer_limits(self.printer)
+        overrides = web_request.get_dict('limits', {})
+        for name, value in overrides.items():
+            if name not in LIMIT_NAMES:
+                raise web_request.error("Unknown limit '%s'" % (name,))
+            try:
+                limits[name] = float(value)
+            except (TypeError, ValueError):
+                raise web_request.error("Invalid limit '%s'" % (name,))
+        res = self._run_background(filename, limits)
+        res['limits'] = limits
+        web_request.send(res)
+
+def load_config(config):
+    return PrintTimeEstimator(config)
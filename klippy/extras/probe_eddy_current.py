@@ -5,9 +5,30 @@
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import logging, math, bisect
 import mcu
-from . import ldc1612, probe, manual_probe
+from . import bulk_sensor, ldc1612, probe, manual_probe
 
 OUT_OF_RANGE = 99.9
+MAD_TO_STDDEV = 1.4826
+
+# Return the average of a list of sensor frequencies, ignoring those
+# further than outlier_limit (scaled) median absolute deviations from
+# the median
+def reduce_freqs(freqs, outlier_limit):
+    count = len(freqs)
+    if count < 3 or not outlier_limit:
+        return sum(freqs) / count
+    freqs = sorted(freqs)
+    mid = count // 2
+    median = freqs[mid]
+    if not count & 1:
+        median = (freqs[mid - 1] + median) * .5
+    devs = sorted([abs(f - median) for f in freqs])
+    if not devs[mid]:
+        # Most samples are identical - there is no spread to compare with
+        return sum(freqs) / count
+    limit = devs[mid] * MAD_TO_STDDEV * outlier_limit
+    freqs = [f for f in freqs if abs(f - median) <= limit]
+    return sum(freqs) / len(freqs)
 
 # Tool for calibrating the sensor Z detection and applying that calibration
 class EddyCalibration:
@@ -17,6 +38,10 @@ class EddyCalibration:
         # Current calibration data
         self.cal_freqs = []
         self.cal_zpos = []
+        self.cal_segments = []
+        self.rev_zpos = []
+        self.rev_segments = []
+        self.cal_arrays = None
         cal = config.get('calibrate', None)
         if cal is not None:
             cal = [list(map(float, d.strip().split(':', 1)))
@@ -36,41 +61,62 @@ class EddyCalibration:
         cal = sorted([(c[1], c[0]) for c in cal])
         self.cal_freqs = [c[0] for c in cal]
         self.cal_zpos = [c[1] for c in cal]
+        # Precompute the piecewise linear segments of the lookup tables
+        self.cal_segments = self._calc_segments(self.cal_freqs, self.cal_zpos)
+        self.rev_zpos = list(reversed(self.cal_zpos))
+        self.rev_segments = self._calc_segments(
+            self.rev_zpos, list(reversed(self.cal_freqs)))
+        self.cal_arrays = None
+    def _calc_segments(self, xs, ys):
+        # Return (gain, offset) of the line ending at each point
+        segments = [None]
+        for pos in range(1, len(xs)):
+            this_x, prev_x = xs[pos], xs[pos - 1]
+            this_y, prev_y = ys[pos], ys[pos - 1]
+            if this_x == prev_x:
+                gain = 0.
+            else:
+                gain = (this_y - prev_y) / (this_x - prev_x)
+            segments.append((gain, prev_y - prev_x * gain))
+        return segments
+    def _lookup_height(self, freq):
+        pos = bisect.bisect(self.cal_freqs, freq)
+        if pos >= len(self.cal_zpos):
+            return -OUT_OF_RANGE
+        elif pos == 0:
+            return OUT_OF_RANGE
+        gain, offset = self.cal_segments[pos]
+        return freq * gain + offset
     def apply_calibration(self, samples):
+        lookup_height = self._lookup_height
         for i, (samp_time, freq, dummy_z) in enumerate(samples):
-            pos = bisect.bisect(self.cal_freqs, freq)
-            if pos >= len(self.cal_zpos):
-                zpos = -OUT_OF_RANGE
-            elif pos == 0:
-                zpos = OUT_OF_RANGE
-            else:
-                # XXX - could further optimize and avoid div by zero
-                this_freq = self.cal_freqs[pos]
-                prev_freq = self.cal_freqs[pos - 1]
-                this_zpos = self.cal_zpos[pos]
-                prev_zpos = self.cal_zpos[pos - 1]
-                gain = (this_zpos - prev_zpos) / (this_freq - prev_freq)
-                offset = prev_zpos - prev_freq * gain
-                zpos = freq * gain + offset
-            samples[i] = (samp_time, freq, round(zpos, 6))
+            samples[i] = (samp_time, freq, round(lookup_height(freq), 6))
+    def apply_calibration_array(self, samples):
+        # Fill in the height column of an array of (time, freq, z) rows
+        np = bulk_sensor.get_numpy()
+        if self.cal_arrays is None:
+            # Out of range frequencies map to a constant height
+            segments = self.cal_segments[1:]
+            gains = [0.] + [g for g, o in segments] + [0.]
+            offsets = ([OUT_OF_RANGE] + [o for g, o in segments]
+                       + [-OUT_OF_RANGE])
+            if not self.cal_freqs:
+                # Without a calibration all frequencies are out of range
+                gains, offsets = [0.], [-OUT_OF_RANGE]
+            self.cal_arrays = (np.array(self.cal_freqs), np.array(gains),
+                               np.array(offsets))
+        cal_freqs, gains, offsets = self.cal_arrays
+        freqs = samples[:, 1]
+        pos = np.searchsorted(cal_freqs, freqs, side='right')
+        samples[:, 2] = np.round(freqs * gains[pos] + offsets[pos], 6)
     def freq_to_height(self, freq):
-        dummy_sample = [(0., freq, 0.)]
-        self.apply_calibration(dummy_sample)
-        return dummy_sample[0][2]
+        return round(self._lookup_height(freq), 6)
     def height_to_freq(self, height):
-        # XXX - could optimize lookup
-        rev_zpos = list(reversed(self.cal_zpos))
-        rev_freqs = list(reversed(self.cal_freqs))
-        pos = bisect.bisect(rev_zpos, height)
-        if pos == 0 or pos >= len(rev_zpos):
+        pos = bisect.bisect(self.rev_zpos, height)
+        if pos == 0 or pos >= len(self.rev_zpos):
             raise self.printer.command_error(
                 "Invalid probe_eddy_current height")
-        this_freq = rev_freqs[pos]
-        prev_freq = rev_freqs[pos - 1]
-        this_zpos = rev_zpos[pos]
-        prev_zpos = rev_zpos[pos - 1]
-        gain = (this_freq - prev_freq) / (this_zpos - prev_zpos)
-        offset = prev_freq - prev_zpos * gain
+        gain, offset = self.rev_segments[pos]
         return height * gain + offset
     def do_calibration_moves(self, move_speed):
         toolhead = self.printer.lookup_object('toolhead')
@@ -191,11 +237,13 @@ class EddyCalibration:
 
 # Tool to gather samples and convert them to probe positions
 class EddyGatherSamples:
-    def __init__(self, printer, sensor_helper, calibration, z_offset):
+    def __init__(self, printer, sensor_helper, calibration, z_offset,
+                 outlier_limit):
         self._printer = printer
         self._sensor_helper = sensor_helper
         self._calibration = calibration
         self._z_offset = z_offset
+        self._outlier_limit = outlier_limit
         # Results storage
         self._samples = []
         self._probe_times = []
@@ -230,8 +278,7 @@ class EddyGatherSamples:
     def _pull_freq(self, start_time, end_time):
         # Find average sensor frequency between time range
         msg_num = discard_msgs = 0
-        samp_sum = 0.
-        samp_count = 0
+        freqs = []
         while msg_num < len(self._samples):
             msg = self._samples[msg_num]
             msg_num += 1
@@ -241,15 +288,13 @@ class EddyGatherSamples:
             if data[-1][0] < start_time:
                 discard_msgs = msg_num
                 continue
-            for time, freq, z in data:
-                if time >= start_time and time <= end_time:
-                    samp_sum += freq
-                    samp_count += 1
+            freqs.extend([freq for time, freq, z in data
+                          if time >= start_time and time <= end_time])
         del self._samples[:discard_msgs]
-        if not samp_count:
+        if not freqs:
             # No sensor readings - raise error in pull_probed()
             return 0.
-        return samp_sum / samp_count
+        return reduce_freqs(freqs, self._outlier_limit)
     def _lookup_toolhead_pos(self, pos_time):
         toolhead = self._printer.lookup_object('toolhead')
         kin = toolhead.get_kinematics()
@@ -265,16 +310,18 @@ class EddyGatherSamples:
             freq = self._pull_freq(start_time, end_time)
             if pos_time is not None:
                 toolhead_pos = self._lookup_toolhead_pos(pos_time)
-            self._probe_results.append((freq, toolhead_pos))
+            sensor_z = None
+            if freq:
+                sensor_z = self._calibration.freq_to_height(freq)
+            self._probe_results.append((sensor_z, toolhead_pos))
             self._probe_times.pop(0)
     def pull_probed(self):
         self._await_samples()
         results = []
-        for freq, toolhead_pos in self._probe_results:
-            if not freq:
+        for sensor_z, toolhead_pos in self._probe_results:
+            if sensor_z is None:
                 raise self._printer.command_error(
                     "Unable to obtain probe_eddy_current sensor readings")
-            sensor_z = self._calibration.freq_to_height(freq)
             if sensor_z <= -OUT_OF_RANGE or sensor_z >= OUT_OF_RANGE:
                 raise self._printer.command_error(
                     "probe_eddy_current sensor not in valid range")
@@ -294,12 +341,13 @@ class EddyGatherSamples:
 # Helper for implementing PROBE style commands (descend until trigger)
 class EddyEndstopWrapper:
     REASON_SENSOR_ERROR = mcu.MCU_trsync.REASON_COMMS_TIMEOUT + 1
-    def __init__(self, config, sensor_helper, calibration):
+    def __init__(self, config, sensor_helper, calibration, outlier_limit):
         self._printer = config.get_printer()
         self._sensor_helper = sensor_helper
         self._mcu = sensor_helper.get_mcu()
         self._calibration = calibration
         self._z_offset = config.getfloat('z_offset', minval=0.)
+        self._outlier_limit = outlier_limit
         self._dispatch = mcu.TriggerDispatch(self._mcu)
         self._trigger_time = 0.
         self._gather = None
@@ -352,7 +400,8 @@ class EddyEndstopWrapper:
         return self._gather.pull_probed()[0]
     def multi_probe_begin(self):
         self._gather = EddyGatherSamples(self._printer, self._sensor_helper,
-                                         self._calibration, self._z_offset)
+                                         self._calibration, self._z_offset,
+                                         self._outlier_limit)
     def multi_probe_end(self):
         self._gather.finish()
         self._gather = None
@@ -365,13 +414,14 @@ class EddyEndstopWrapper:
 
 # Implementing probing with "METHOD=scan"
 class EddyScanningProbe:
-    def __init__(self, printer, sensor_helper, calibration, z_offset, gcmd):
+    def __init__(self, printer, sensor_helper, calibration, z_offset,
+                 outlier_limit, gcmd):
         self._printer = printer
         self._sensor_helper = sensor_helper
         self._calibration = calibration
         self._z_offset = z_offset
         self._gather = EddyGatherSamples(printer, sensor_helper,
-                                         calibration, z_offset)
+                                         calibration, z_offset, outlier_limit)
         self._sample_time_delay = 0.050
         self._sample_time = gcmd.get_float("SAMPLE_TIME", 0.100, above=0.0)
         self._is_rapid = gcmd.get("METHOD", "scan") == 'rapid_scan'
@@ -413,8 +463,10 @@ class PrinterEddyProbe:
         sensor_type = config.getchoice('sensor_type', {s: s for s in sensors})
         self.sensor_helper = sensors[sensor_type](config, self.calibration)
         # Probe interface
+        self.outlier_limit = config.getfloat('outlier_limit', 3., minval=0.)
         self.mcu_probe = EddyEndstopWrapper(config, self.sensor_helper,
-                                            self.calibration)
+                                            self.calibration,
+                                            self.outlier_limit)
         self.cmd_helper = probe.ProbeCommandHelper(
             config, self, self.mcu_probe.query_endstop)
         self.probe_offsets = probe.ProbeOffsetsHelper(config)
@@ -433,7 +485,8 @@ class PrinterEddyProbe:
         if method in ('scan', 'rapid_scan'):
             z_offset = self.get_offsets()[2]
             return EddyScanningProbe(self.printer, self.sensor_helper,
-                                     self.calibration, z_offset, gcmd)
+                                     self.calibration, z_offset,
+                                     self.outlier_limit, gcmd)
         return self.probe_session.start_probe_session(gcmd)
 
 def load_config_prefix(config):
@@ -4,7 +4,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import logging, math, os, time
-from . import shaper_calibrate
+from . import adxl345, shaper_calibrate
 
 class TestAxis:
     def __init__(self, axis=None, vib_dir=None):
@@ -150,7 +150,7 @@ class ResonanceTester:
                 for chip_axis, chip_name in self.accel_chip_names]
 
     def _run_test(self, gcmd, axes, helper, raw_name_suffix=None,
-                  accel_chips=None, test_point=None):
+                  accel_chips=None, test_point=None, raw_format='csv'):
         toolhead = self.printer.lookup_object('toolhead')
         calibration_data = {axis: None for axis in axes}
 
@@ -182,28 +182,44 @@ class ResonanceTester:
                     for chip in accel_chips:
                         aclient = chip.start_internal_client()
                         raw_values.append((axis, aclient, chip.name))
-
-                # Generate moves
-                self.test.run_test(axis, gcmd)
+                writers = []
+                psds = []
                 for chip_axis, aclient, chip_name in raw_values:
-                    aclient.finish_measurements()
                     if raw_name_suffix is not None:
+                        # Write raw data to a file during the test
                         raw_name = self.get_filename(
                                 'raw_data', raw_name_suffix, axis,
                                 point if len(test_points) > 1 else None,
-                                chip_name if accel_chips is not None else None,)
-                        aclient.write_to_file(raw_name)
+                                chip_name if accel_chips is not None else None,
+                                ext=raw_format)
+                        writer = adxl345.AccelDataWriter(raw_name)
+                        aclient.add_sample_processor(writer)
+                        writers.append(writer)
                         gcmd.respond_info(
                                 "Writing raw accelerometer data to "
                                 "%s file" % (raw_name,))
+                    psd = None
+                    if helper is not None:
+                        # Calculate the frequency response during the test
+                        psd = helper.create_psd_accumulator()
+                        aclient.add_sample_processor(psd)
+                    psds.append(psd)
+
+                # Generate moves
+                self.test.run_test(axis, gcmd)
+                for chip_axis, aclient, chip_name in raw_values:
+                    aclient.finish_measurements()
+                for writer in writers:
+                    writer.finish()
                 if helper is None:
                     continue
-                for chip_axis, aclient, chip_name in raw_values:
+                for (chip_axis, aclient, chip_name), psd in zip(raw_values,
+                                                                 psds):
                     if not aclient.has_valid_samples():
                         raise gcmd.error(
                             "accelerometer '%s' measured no data" % (
                                 chip_name,))
-                    new_data = helper.process_accelerometer_data(aclient)
+                    new_data = helper.process_accelerometer_data(psd)
                     if calibration_data[axis] is None:
                         calibration_data[axis] = new_data
                     else:
@@ -251,6 +267,9 @@ class ResonanceTester:
         name_suffix = gcmd.get("NAME", time.strftime("%Y%m%d_%H%M%S"))
         if not self.is_valid_name_suffix(name_suffix):
             raise gcmd.error("Invalid NAME parameter")
+        raw_format = gcmd.get("FORMAT", "csv").lower()
+        if raw_format not in adxl345.RAW_DATA_FORMATS:
+            raise gcmd.error("Invalid FORMAT parameter")
         csv_output = 'resonances' in outputs
         raw_output = 'raw_data' in outputs
 
@@ -263,7 +282,8 @@ class ResonanceTester:
         data = self._run_test(
                 gcmd, [axis], helper,
                 raw_name_suffix=name_suffix if raw_output else None,
-                accel_chips=accel_chips, test_point=test_point)[axis]
+                accel_chips=accel_chips, test_point=test_point,
+                raw_format=raw_format)[axis]
         if csv_output:
             csv_name = self.save_calibration_data(
                     'resonances', name_suffix, helper, axis, data,
@@ -358,7 +378,7 @@ class ResonanceTester:
         return name_suffix.replace('-', '').replace('_', '').isalnum()
 
     def get_filename(self, base, name_suffix, axis=None,
-                     point=None, chip_name=None):
+                     point=None, chip_name=None, ext='csv'):
         name = base
         if axis:
             name += '_' + axis.get_name()
@@ -367,7 +387,7 @@ class ResonanceTester:
         if point:
             name += "_%.3f_%.3f_%.3f" % (point[0], point[1], point[2])
         name += '_' + name_suffix
-        return os.path.join("/tmp", name + ".csv")
+        return os.path.join("/tmp", name + "." + ext)
 
     def save_calibration_data(self, base_name, name_suffix, shaper_calibrate,
                               axis, calibration_data,
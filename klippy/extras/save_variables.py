@@ -4,7 +4,7 @@
 # Copyright (C) 2016-2020  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import os, logging, ast, configparser
+import os, logging, ast, configparser, io, threading
 
 class SaveVariables:
     def __init__(self, config):
@@ -17,9 +17,20 @@ class SaveVariables:
             self.loadVariables()
         except self.printer.command_error as e:
             raise config.error(str(e))
+        # Background writing of the variable file
+        self.lock = threading.Condition()
+        self.pending_variables = None
+        self.is_stopping = False
+        self.write_error = None
+        self.need_raise_error = False
+        self.write_thread = None
+        self.printer.register_event_handler("klippy:disconnect",
+                                            self._handle_disconnect)
         gcode = self.printer.lookup_object('gcode')
         gcode.register_command('SAVE_VARIABLE', self.cmd_SAVE_VARIABLE,
                                desc=self.cmd_SAVE_VARIABLE_help)
+        gcode.register_command('SAVE_VARIABLES', self.cmd_SAVE_VARIABLES,
+                               desc=self.cmd_SAVE_VARIABLES_help)
     def loadVariables(self):
         allvars = {}
         varfile = configparser.ConfigParser()
@@ -33,32 +44,110 @@ class SaveVariables:
             logging.exception(msg)
             raise self.printer.command_error(msg)
         self.allVariables = allvars
-    cmd_SAVE_VARIABLE_help = "Save arbitrary variables to disk"
-    def cmd_SAVE_VARIABLE(self, gcmd):
-        varname = gcmd.get('VARIABLE')
-        value = gcmd.get('VALUE')
-        try:
-            value = ast.literal_eval(value)
-        except ValueError as e:
-            raise gcmd.error("Unable to parse '%s' as a literal" % (value,))
-        newvars = dict(self.allVariables)
-        newvars[varname] = value
-        # Write file
+    # File writing (from a background thread)
+    def _write_file(self, variables):
         varfile = configparser.ConfigParser()
         varfile.add_section('Variables')
-        for name, val in sorted(newvars.items()):
+        for name, val in sorted(variables.items()):
             varfile.set('Variables', name, repr(val))
+        data = io.StringIO()
+        varfile.write(data)
+        # Write to a temporary file and rename it over the old file so
+        # that a crash or power loss never leaves a partial file
+        tmpname = self.filename + ".tmp"
         try:
-            f = open(self.filename, "w")
-            varfile.write(f)
-            f.close()
+            f = open(tmpname, "w")
+            try:
+                f.write(data.getvalue())
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                f.close()
+            os.rename(tmpname, self.filename)
         except:
-            msg = "Unable to save variable"
-            logging.exception(msg)
-            raise gcmd.error(msg)
-        self.loadVariables()
+            # Don't leave a partial temporary file behind
+            try:
+                os.remove(tmpname)
+            except OSError:
+                pass
+            raise
+    def _report_error(self, msg):
+        gcode = self.printer.lookup_object('gcode')
+        gcode.respond_raw("!! %s" % (msg,))
+    def _write_thread(self):
+        while 1:
+            with self.lock:
+                while self.pending_variables is None and not self.is_stopping:
+                    self.lock.wait()
+                variables = self.pending_variables
+                self.pending_variables = None
+            if variables is None:
+                return
+            try:
+                self._write_file(variables)
+            except Exception as e:
+                logging.exception("Unable to save variable")
+                msg = "Unable to save variables to %s: %s" % (
+                    self.filename, str(e))
+                with self.lock:
+                    self.write_error = msg
+                    self.need_raise_error = True
+                reactor = self.printer.get_reactor()
+                reactor.register_async_callback(
+                    (lambda e: self._report_error(msg)))
+            else:
+                with self.lock:
+                    self.write_error = None
+                    self.need_raise_error = False
+    def _queue_write(self):
+        # Writes are coalesced - only the latest state is written
+        with self.lock:
+            self.pending_variables = self.allVariables
+            self.lock.notify()
+        if self.write_thread is None:
+            self.write_thread = threading.Thread(target=self._write_thread)
+            self.write_thread.daemon = True
+            self.write_thread.start()
+    def _handle_disconnect(self):
+        # Flush any pending write
+        if self.write_thread is None:
+            return
+        with self.lock:
+            self.is_stopping = True
+            self.lock.notify()
+        self.write_thread.join()
+    # G-Code commands
+    def _parse_value(self, gcmd, value):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            raise gcmd.error("Unable to parse '%s' as a literal" % (value,))
+    def _save_variables(self, gcmd, updates):
+        # Report a failed background write to the next save request
+        with self.lock:
+            need_raise_error = self.need_raise_error
+            self.need_raise_error = False
+        if need_raise_error:
+            raise gcmd.error(self.write_error)
+        newvars = dict(self.allVariables)
+        newvars.update(updates)
+        self.allVariables = newvars
+        self._queue_write()
+    cmd_SAVE_VARIABLE_help = "Save arbitrary variables to disk"
+    def cmd_SAVE_VARIABLE(self, gcmd):
+        varname = gcmd.get('VARIABLE').lower()
+        value = self._parse_value(gcmd, gcmd.get('VALUE'))
+        self._save_variables(gcmd, {varname: value})
+    cmd_SAVE_VARIABLES_help = "Save several variables to disk"
+    def cmd_SAVE_VARIABLES(self, gcmd):
+        params = gcmd.get_command_parameters()
+        if not params:
+            raise gcmd.error("SAVE_VARIABLES requires at least one variable")
+        self._save_variables(gcmd, {name.lower(): self._parse_value(gcmd, value)
+                                    for name, value in params.items()})
     def get_status(self, eventtime):
-        return {'variables': self.allVariables}
+        return {'variables': self.allVariables,
+                'write_error': self.write_error}
 
 def load_config(config):
     return SaveVariables(config)
@@ -9,12 +9,20 @@ shaper_defs = importlib.import_module('.shaper_defs', 'extras')
 MIN_FREQ = 5.
 MAX_FREQ = 200.
 WINDOW_T_SEC = 0.5
+# Amount of data used to choose the window size of a PSDAccumulator
+RATE_ESTIMATE_T_SEC = 1.
 MAX_SHAPER_FREQ = 150.
 
 TEST_DAMPING_RATIOS=[0.075, 0.1, 0.15]
 
 AUTOTUNE_SHAPERS = ['zv', 'mzv', 'ei', '2hump_ei', '3hump_ei']
 
+# Just some empirically chosen value which produces good projections
+# for max_accel without much smoothing
+TARGET_SMOOTHING = 0.12
+# Number of shaper frequencies evaluated at once
+FIT_CHUNK_SIZE = 64
+
 ######################################################################
 # Frequency response calculation and shaper auto-tuning
 ######################################################################
@@ -53,6 +61,80 @@ class CalibrationData:
         return self._psd_map[axis]
 
 
+# Calculate the power spectral density (PSD) of accelerometer samples as
+# they arrive (Welch's algorithm keeping only the running sums)
+class PSDAccumulator:
+    def __init__(self, numpy):
+        self.numpy = numpy
+        self.first_time = self.last_time = None
+        self.sample_count = 0
+        self.pending = numpy.zeros((0, 3))
+        self.nfft = self.step = 0
+        self.window = self.psd_sum = None
+        self.window_count = 0
+    def _get_sampling_freq(self):
+        return self.sample_count / (self.last_time - self.first_time)
+    def _setup_windows(self, sampling_freq):
+        np = self.numpy
+        # Round up to the nearest power of 2 for faster FFT
+        nfft = 1 << int(sampling_freq * WINDOW_T_SEC - 1).bit_length()
+        self.nfft = nfft
+        self.step = nfft - nfft // 2
+        self.window = np.kaiser(nfft, 6.)
+        self.psd_sum = np.zeros((nfft // 2 + 1, 3))
+    def _process_windows(self):
+        np = self.numpy
+        pending = self.pending
+        pos = 0
+        while pos + self.nfft <= pending.shape[0]:
+            # Detrend, apply windowing function, and sum the FFT power
+            x = pending[pos:pos + self.nfft]
+            x = self.window[:, None] * (x - np.mean(x, axis=0))
+            result = np.fft.rfft(x, axis=0)
+            self.psd_sum += (np.conjugate(result) * result).real
+            self.window_count += 1
+            pos += self.step
+        self.pending = pending[pos:].copy()
+    def add_samples(self, samples):
+        # Samples are (time, accel_x, accel_y, accel_z) tuples
+        if not samples:
+            return
+        np = self.numpy
+        data = np.array(samples, dtype=float)
+        if self.first_time is None:
+            self.first_time = data[0, 0]
+        self.last_time = data[-1, 0]
+        self.sample_count += data.shape[0]
+        self.pending = np.concatenate((self.pending, data[:, 1:]))
+        if not self.nfft:
+            if self.last_time - self.first_time < RATE_ESTIMATE_T_SEC:
+                return
+            self._setup_windows(self._get_sampling_freq())
+        self._process_windows()
+    def get_sample_count(self):
+        return self.sample_count
+    def get_calibration_data(self):
+        if self.sample_count < 2 or self.last_time <= self.first_time:
+            return None
+        np = self.numpy
+        sampling_freq = self._get_sampling_freq()
+        if not self.nfft:
+            self._setup_windows(sampling_freq)
+            self._process_windows()
+        if self.sample_count <= self.nfft:
+            return None
+        # Compensation for windowing loss
+        scale = 1.0 / (self.window**2).sum()
+        psd = self.psd_sum * (scale / sampling_freq / self.window_count)
+        # For one-sided FFT output the response must be doubled, except
+        # the last point for unpaired Nyquist frequency (assuming even nfft)
+        # and the 'DC' term (0 Hz)
+        psd[1:-1,:] *= 2.
+        freqs = np.fft.rfftfreq(self.nfft, 1. / sampling_freq)
+        px, py, pz = [psd[:, i].copy() for i in range(3)]
+        return CalibrationData(freqs, px+py+pz, px, py, pz)
+
+
 CalibrationResult = collections.namedtuple(
         'CalibrationResult',
         ('name', 'freq', 'vals', 'vibrs', 'smoothing', 'score', 'max_accel'))
@@ -69,9 +151,7 @@ class ShaperCalibrate:
                     "installed via `~/klippy-env/bin/pip install` (refer to "
                     "docs/Measuring_Resonances.md for more details).")
 
-    def background_process_exec(self, method, args):
-        if self.printer is None:
-            return method(*args)
+    def _start_background_process(self, method, args):
         import queuelogger
         parent_conn, child_conn = multiprocessing.Pipe()
         def wrapper():
@@ -84,27 +164,66 @@ class ShaperCalibrate:
                 return
             child_conn.send((False, res))
             child_conn.close()
-        # Start a process to perform the calculation
         calc_proc = multiprocessing.Process(target=wrapper)
         calc_proc.daemon = True
         calc_proc.start()
-        # Wait for the process to finish
-        reactor = self.printer.get_reactor()
-        gcode = self.printer.lookup_object("gcode")
-        eventtime = last_report_time = reactor.monotonic()
-        while calc_proc.is_alive():
-            if eventtime > last_report_time + 5.:
-                last_report_time = eventtime
-                gcode.respond_info("Wait for calculations..", log=False)
-            eventtime = reactor.pause(eventtime + .1)
-        # Return results
-        is_err, res = parent_conn.recv()
-        if is_err:
-            raise self.error("Error in remote calculation: %s" % (res,))
+        return calc_proc, parent_conn
+
+    def _finish_background_process(self, calc_proc, parent_conn):
+        try:
+            is_err, res = parent_conn.recv()
+        except EOFError:
+            is_err, res = True, "Process exited with code %s" % (
+                calc_proc.exitcode,)
         calc_proc.join()
         parent_conn.close()
+        if is_err:
+            raise self.error("Error in remote calculation: %s" % (res,))
         return res
 
+    def background_process_exec_all(self, method, args_list):
+        # Run method(*args) for each entry of args_list using a pool of
+        # processes (one less than the number of cpus, but at least one)
+        if self.printer is None:
+            return [method(*args) for args in args_list]
+        max_procs = max(1, multiprocessing.cpu_count() - 1)
+        pending = list(enumerate(args_list))
+        running = []
+        results = [None] * len(args_list)
+        reactor = self.printer.get_reactor()
+        gcode = self.printer.lookup_object("gcode")
+        eventtime = last_report_time = reactor.monotonic()
+        try:
+            while pending or running:
+                # Start new processes
+                while pending and len(running) < max_procs:
+                    idx, args = pending.pop(0)
+                    calc_proc, conn = self._start_background_process(
+                        method, args)
+                    running.append((idx, calc_proc, conn))
+                # Collect results (reading the result before waiting for
+                # the process, as a large result may not fit in the pipe)
+                for entry in list(running):
+                    idx, calc_proc, conn = entry
+                    if conn.poll() or not calc_proc.is_alive():
+                        running.remove(entry)
+                        results[idx] = self._finish_background_process(
+                            calc_proc, conn)
+                if not running:
+                    continue
+                if eventtime > last_report_time + 5.:
+                    last_report_time = eventtime
+                    gcode.respond_info("Wait for calculations..", log=False)
+                eventtime = reactor.pause(eventtime + .1)
+        finally:
+            for idx, calc_proc, conn in running:
+                calc_proc.terminate()
+                conn.close()
+        return results
+
+    def background_process_exec(self, method, args):
+        return self.background_process_exec_all(method, [args])[0]
+
     def _split_into_windows(self, x, window_size, overlap):
         # Memory-efficient algorithm to split an input 'x' into a series
         # of overlapping windows
@@ -152,10 +271,9 @@ class ShaperCalibrate:
         if isinstance(raw_values, np.ndarray):
             data = raw_values
         else:
-            samples = raw_values.get_samples()
-            if not samples:
+            data = raw_values.get_sample_array()
+            if not data.shape[0]:
                 return None
-            data = np.array(samples)
 
         N = data.shape[0]
         T = data[-1,0] - data[0,0]
@@ -172,28 +290,47 @@ class ShaperCalibrate:
         fz, pz = self._psd(data[:,3], SAMPLING_FREQ, M)
         return CalibrationData(fx, px+py+pz, px, py, pz)
 
+    def create_psd_accumulator(self):
+        return PSDAccumulator(self.numpy)
+
     def process_accelerometer_data(self, data):
-        calibration_data = self.background_process_exec(
-                self.calc_freq_response, (data,))
+        if isinstance(data, PSDAccumulator):
+            # The windows were already processed as the samples arrived
+            calibration_data = data.get_calibration_data()
+        else:
+            calibration_data = self.background_process_exec(
+                    self.calc_freq_response, (data,))
         if calibration_data is None:
             raise self.error(
                     "Internal error processing accelerometer data %s" % (data,))
         calibration_data.set_numpy(self.numpy)
         return calibration_data
 
+    def _get_shapers(self, shaper_cfg, shaper_freqs, damping_ratio):
+        # Return the shaper amplitudes and times (one row per frequency)
+        np = self.numpy
+        shapers = [shaper_cfg.init_func(shaper_freq, damping_ratio)
+                   for shaper_freq in shaper_freqs]
+        return (np.array([A for A, T in shapers]),
+                np.array([T for A, T in shapers]))
+
     def _estimate_shaper(self, shaper, test_damping_ratio, test_freqs):
+        # The shaper amplitudes and times may have an extra leading
+        # dimension to evaluate several shapers at once
         np = self.numpy
 
         A, T = np.array(shaper[0]), np.array(shaper[1])
-        inv_D = 1. / A.sum()
+        inv_D = 1. / A.sum(axis=-1)
 
         omega = 2. * math.pi * test_freqs
         damping = test_damping_ratio * omega
         omega_d = omega * math.sqrt(1. - test_damping_ratio**2)
-        W = A * np.exp(np.outer(-damping, (T[-1] - T)))
-        S = W * np.sin(np.outer(omega_d, T))
-        C = W * np.cos(np.outer(omega_d, T))
-        return np.sqrt(S.sum(axis=1)**2 + C.sum(axis=1)**2) * inv_D
+        A, T = A[..., None, :], T[..., None, :]
+        W = A * np.exp(-damping[:, None] * (T[..., -1:] - T))
+        S = W * np.sin(omega_d[:, None] * T)
+        C = W * np.cos(omega_d[:, None] * T)
+        return (np.sqrt(S.sum(axis=-1)**2 + C.sum(axis=-1)**2)
+                * np.asarray(inv_D)[..., None])
 
     def _estimate_remaining_vibrations(self, shaper, test_damping_ratio,
                                        freq_bins, psd):
@@ -203,29 +340,40 @@ class ShaperCalibrate:
         # threshold can be igonred
         vibr_threshold = psd.max() / shaper_defs.SHAPER_VIBRATION_REDUCTION
         remaining_vibrations = self.numpy.maximum(
-                vals * psd - vibr_threshold, 0).sum()
+                vals * psd - vibr_threshold, 0).sum(axis=-1)
         all_vibrations = self.numpy.maximum(psd - vibr_threshold, 0).sum()
         return (remaining_vibrations / all_vibrations, vals)
 
+    def _get_shaper_smoothing_coeffs(self, shaper, scv):
+        # The smoothing is max(offset_90, offset_180), where the offsets
+        # for 90 and 180 degrees turns are linear functions of the
+        # acceleration: offset_90 = c90 + k90 * accel and
+        # offset_180 = k180 * accel.  Return (c90, k90, k180).
+        np = self.numpy
+        A, T = np.array(shaper[0]), np.array(shaper[1])
+        inv_D = 1. / A.sum(axis=-1)
+        # Calculate input shaper shift
+        ts = (A * T).sum(axis=-1) * inv_D
+        dt = T - np.asarray(ts)[..., None]
+        # Only the impulses after the shift contribute to offset_90
+        A_90 = np.where(dt >= 0., A, 0.)
+        c90 = (A_90 * scv * dt).sum(axis=-1) * inv_D * math.sqrt(2.)
+        k90 = (A_90 * .5 * dt**2).sum(axis=-1) * inv_D * math.sqrt(2.)
+        k180 = (A * .5 * dt**2).sum(axis=-1) * inv_D
+        return c90, k90, k180
+
     def _get_shaper_smoothing(self, shaper, accel=5000, scv=5.):
-        half_accel = accel * .5
+        c90, k90, k180 = self._get_shaper_smoothing_coeffs(shaper, scv)
+        return self.numpy.maximum(c90 + k90 * accel, k180 * accel)
 
-        A, T = shaper
-        inv_D = 1. / sum(A)
-        n = len(T)
-        # Calculate input shaper shift
-        ts = sum([A[i] * T[i] for i in range(n)]) * inv_D
-
-        # Calculate offset for 90 and 180 degrees turn
-        offset_90 = offset_180 = 0.
-        for i in range(n):
-            if T[i] >= ts:
-                # Calculate offset for one of the axes
-                offset_90 += A[i] * (scv + half_accel * (T[i]-ts)) * (T[i]-ts)
-            offset_180 += A[i] * half_accel * (T[i]-ts)**2
-        offset_90 *= inv_D * math.sqrt(2.)
-        offset_180 *= inv_D
-        return max(offset_90, offset_180)
+    def _find_max_accel(self, smoothing_coeffs, target_smoothing):
+        # Find the largest acceleration with smoothing <= target_smoothing
+        np = self.numpy
+        c90, k90, k180 = smoothing_coeffs
+        with np.errstate(divide='ignore'):
+            max_accel = np.minimum((target_smoothing - c90) / k90,
+                                   target_smoothing / k180)
+        return np.where(c90 < target_smoothing, max_accel, 0.)
 
     def fit_shaper(self, shaper_cfg, calibration_data, shaper_freqs,
                    damping_ratio, scv, max_smoothing, test_damping_ratios,
@@ -252,70 +400,62 @@ class ShaperCalibrate:
         psd = calibration_data.psd_sum[freq_bins <= max_freq]
         freq_bins = freq_bins[freq_bins <= max_freq]
 
-        best_res = None
-        results = []
-        for test_freq in test_freqs[::-1]:
-            shaper_vibrations = 0.
-            shaper_vals = np.zeros(shape=freq_bins.shape)
-            shaper = shaper_cfg.init_func(test_freq, damping_ratio)
-            shaper_smoothing = self._get_shaper_smoothing(shaper, scv=scv)
-            if max_smoothing and shaper_smoothing > max_smoothing and best_res:
-                return best_res
-            # Exact damping ratio of the printer is unknown, pessimizing
-            # remaining vibrations over possible damping values
+        # Evaluate all test frequencies at once, from highest to lowest
+        test_freqs = test_freqs[::-1]
+        A, T = self._get_shapers(shaper_cfg, test_freqs, damping_ratio)
+        smoothing_coeffs = self._get_shaper_smoothing_coeffs((A, T), scv)
+        shaper_smoothing = self._get_shaper_smoothing((A, T), scv=scv)
+        # The smoothing grows as the shaper frequency decreases - stop at
+        # the first (but not the highest) frequency that exceeds the limit
+        stop_early = False
+        if max_smoothing:
+            over = np.nonzero(shaper_smoothing[1:] > max_smoothing)[0]
+            if len(over):
+                stop_early = True
+                count = over[0] + 1
+                test_freqs, A, T = test_freqs[:count], A[:count], T[:count]
+                shaper_smoothing = shaper_smoothing[:count]
+                smoothing_coeffs = [c[:count] for c in smoothing_coeffs]
+        # Exact damping ratio of the printer is unknown, pessimizing
+        # remaining vibrations over possible damping values
+        shaper_vibrations = np.zeros(shape=test_freqs.shape)
+        shaper_vals = np.zeros(shape=test_freqs.shape + freq_bins.shape)
+        for i in range(0, len(test_freqs), FIT_CHUNK_SIZE):
+            chunk = slice(i, i + FIT_CHUNK_SIZE)
             for dr in test_damping_ratios:
                 vibrations, vals = self._estimate_remaining_vibrations(
-                        shaper, dr, freq_bins, psd)
-                shaper_vals = np.maximum(shaper_vals, vals)
-                if vibrations > shaper_vibrations:
-                    shaper_vibrations = vibrations
-            max_accel = self.find_shaper_max_accel(shaper, scv)
-            # The score trying to minimize vibrations, but also accounting
-            # the growth of smoothing. The formula itself does not have any
-            # special meaning, it simply shows good results on real user data
-            shaper_score = shaper_smoothing * (shaper_vibrations**1.5 +
-                                               shaper_vibrations * .2 + .01)
-            results.append(
-                    CalibrationResult(
-                        name=shaper_cfg.name, freq=test_freq, vals=shaper_vals,
-                        vibrs=shaper_vibrations, smoothing=shaper_smoothing,
-                        score=shaper_score, max_accel=max_accel))
-            if best_res is None or best_res.vibrs > results[-1].vibrs:
-                # The current frequency is better for the shaper.
-                best_res = results[-1]
+                        (A[chunk], T[chunk]), dr, freq_bins, psd)
+                shaper_vals[chunk] = np.maximum(shaper_vals[chunk], vals)
+                shaper_vibrations[chunk] = np.maximum(
+                        shaper_vibrations[chunk], vibrations)
+        max_accel = self._find_max_accel(smoothing_coeffs, TARGET_SMOOTHING)
+        # The score trying to minimize vibrations, but also accounting
+        # the growth of smoothing. The formula itself does not have any
+        # special meaning, it simply shows good results on real user data
+        shaper_score = shaper_smoothing * (shaper_vibrations**1.5 +
+                                           shaper_vibrations * .2 + .01)
+        def get_result(i):
+            return CalibrationResult(
+                    name=shaper_cfg.name, freq=test_freqs[i],
+                    vals=shaper_vals[i], vibrs=shaper_vibrations[i],
+                    smoothing=shaper_smoothing[i], score=shaper_score[i],
+                    max_accel=max_accel[i])
+        # The best frequency for the shaper has the least vibrations
+        best = np.argmin(shaper_vibrations)
+        if stop_early:
+            return get_result(best)
         # Try to find an 'optimal' shapper configuration: the one that is not
         # much worse than the 'best' one, but gives much less smoothing
-        selected = best_res
-        for res in results[::-1]:
-            if res.vibrs < best_res.vibrs * 1.1 and res.score < selected.score:
-                selected = res
-        return selected
-
-    def _bisect(self, func):
-        left = right = 1.
-        if not func(1e-9):
-            return 0.
-        while not func(left):
-            right = left
-            left *= .5
-        if right == left:
-            while func(right):
-                right *= 2.
-        while right - left > 1e-8:
-            middle = (left + right) * .5
-            if func(middle):
-                left = middle
-            else:
-                right = middle
-        return left
+        selected = best
+        for i in range(len(test_freqs) - 1, -1, -1):
+            if (shaper_vibrations[i] < shaper_vibrations[best] * 1.1
+                    and shaper_score[i] < shaper_score[selected]):
+                selected = i
+        return get_result(selected)
 
     def find_shaper_max_accel(self, shaper, scv):
-        # Just some empirically chosen value which produces good projections
-        # for max_accel without much smoothing
-        TARGET_SMOOTHING = 0.12
-        max_accel = self._bisect(lambda test_accel: self._get_shaper_smoothing(
-            shaper, test_accel, scv) <= TARGET_SMOOTHING)
-        return max_accel
+        smoothing_coeffs = self._get_shaper_smoothing_coeffs(shaper, scv)
+        return float(self._find_max_accel(smoothing_coeffs, TARGET_SMOOTHING))
 
     def find_best_shaper(self, calibration_data, shapers=None,
                          damping_ratio=None, scv=None, shaper_freqs=None,
@@ -324,12 +464,13 @@ class ShaperCalibrate:
         best_shaper = None
         all_shapers = []
         shapers = shapers or AUTOTUNE_SHAPERS
-        for shaper_cfg in shaper_defs.INPUT_SHAPERS:
-            if shaper_cfg.name not in shapers:
-                continue
-            shaper = self.background_process_exec(self.fit_shaper, (
-                shaper_cfg, calibration_data, shaper_freqs, damping_ratio,
-                scv, max_smoothing, test_damping_ratios, max_freq))
+        # Fit the shapers in parallel
+        fit_args = [(shaper_cfg, calibration_data, shaper_freqs, damping_ratio,
+                     scv, max_smoothing, test_damping_ratios, max_freq)
+                    for shaper_cfg in shaper_defs.INPUT_SHAPERS
+                    if shaper_cfg.name in shapers]
+        fitted = self.background_process_exec_all(self.fit_shaper, fit_args)
+        for shaper in fitted:
             if logger is not None:
                 logger("Fitted shaper '%s' frequency = %.1f Hz "
                        "(vibrations = %.1f%%, smoothing ~= %.3f)" % (
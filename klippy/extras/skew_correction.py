@@ -24,6 +24,7 @@ class PrinterSkew:
         self.xy_factor = 0.
         self.xz_factor = 0.
         self.yz_factor = 0.
+        self.is_skewed = False
         self.skew_profiles = {}
         self._load_storage(config)
         self.printer.register_event_handler("klippy:connect",
@@ -65,14 +66,21 @@ class PrinterSkew:
         skewed_y = pos[1] + pos[2] * self.yz_factor
         return [skewed_x, skewed_y, pos[2], pos[3]]
     def get_position(self):
+        if not self.is_skewed:
+            return self.next_transform.get_position()
         return self.calc_unskew(self.next_transform.get_position())
     def move(self, newpos, speed):
+        if not self.is_skewed:
+            # Pass moves through unmodified when no skew is set
+            self.next_transform.move(newpos, speed)
+            return
         corrected_pos = self.calc_skew(newpos)
         self.next_transform.move(corrected_pos, speed)
     def _update_skew(self, xy_factor, xz_factor, yz_factor):
         self.xy_factor = xy_factor
         self.xz_factor = xz_factor
         self.yz_factor = yz_factor
+        self.is_skewed = bool(xy_factor or xz_factor or yz_factor)
         gcode_move = self.printer.lookup_object('gcode_move')
         gcode_move.reset_last_position()
     cmd_GET_CURRENT_SKEW_help = "Report current printer skew"
@@ -113,6 +121,8 @@ class PrinterSkew:
                         "plane [%s]\n%s" % (plane, gcmd.get_commandline()))
                 factor = plane.lower() + '_factor'
                 setattr(self, factor, calc_skew_factor(*lengths))
+        self.is_skewed = bool(self.xy_factor or self.xz_factor
+                              or self.yz_factor)
     cmd_SKEW_PROFILE_help = "Profile management for skew_correction"
     def cmd_SKEW_PROFILE(self, gcmd):
         if gcmd.get('LOAD', None) is not None:
@@ -0,0 +1,158 @@
+# Step message bandwidth accounting
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import logging
+
+# Ratio of transmitted bytes to message content (64 byte message
+# blocks with 5 bytes of header and trailer)
+MESSAGE_BLOCK_RATIO = 64. / (64. - 5.)
+MIN_SPEED_HINT = 0.1
+
+# Track the link usage of a single mcu
+class MCUBandwidth:
+    def __init__(self, mcu, link_capacity):
+        self.mcu = mcu
+        self.link_capacity = link_capacity
+        self.last_time = self.last_stats = None
+        self.status = {}
+        self.warned = False
+    def _rate(self, stats, name, dt):
+        # Stats counters are 32bit values
+        diff = (stats.get(name, 0) - self.last_stats.get(name, 0)) & 0xffffffff
+        return diff / dt
+    def _pending(self, stats):
+        # Bytes queued in the host that have not yet been transmitted
+        return ((stats.get('ready_bytes', 0) + stats.get('upcoming_bytes', 0))
+                * MESSAGE_BLOCK_RATIO)
+    def update(self, eventtime, buffer_time):
+        stats = self.mcu.get_link_stats(eventtime)
+        last_time = self.last_time
+        if last_time is None or eventtime <= last_time:
+            self.last_time, self.last_stats = eventtime, stats
+            return None
+        dt = eventtime - last_time
+        step_msgs = self._rate(stats, 'step_msgs', dt)
+        step_bytes = self._rate(stats, 'step_bytes', dt) * MESSAGE_BLOCK_RATIO
+        link_bytes = self._rate(stats, 'bytes_write', dt)
+        # The rate data is generated is the rate it is transmitted plus
+        # the growth of the host queue
+        pending = self._pending(stats)
+        queue_growth = (pending - self._pending(self.last_stats)) / dt
+        demand_bytes = max(step_bytes, link_bytes + queue_growth)
+        self.last_time, self.last_stats = eventtime, stats
+        status = {'step_msgs_per_sec': step_msgs,
+                  'step_bytes_per_sec': step_bytes,
+                  'link_bytes_per_sec': link_bytes,
+                  'demand_bytes_per_sec': demand_bytes}
+        capacity = self.mcu.get_wire_capacity() or self.link_capacity
+        if capacity:
+            utilization = demand_bytes / capacity
+            # Time to transmit messages that are already queued
+            send_time = pending / capacity
+            buffer_time = max(0., buffer_time - send_time)
+            underrun_time = None
+            if utilization > 1.:
+                # Moves are generated faster than they can be transmitted
+                underrun_time = buffer_time / (utilization - 1.)
+            status.update({'capacity': capacity, 'utilization': utilization,
+                           'step_utilization': step_bytes / capacity,
+                           'buffer_time': buffer_time,
+                           'underrun_time': underrun_time})
+        self.status = status
+        return status
+
+class PrinterStepBandwidth:
+    def __init__(self, config):
+        self.printer = config.get_printer()
+        self.warn_utilization = config.getfloat('warn_utilization', 0.90,
+                                                above=0.)
+        self.target_utilization = config.getfloat(
+            'target_utilization', 0.75, above=0., maxval=self.warn_utilization)
+        self.link_capacity = config.getfloat('link_capacity', None, above=0.)
+        self.mcus = {}
+        self.toolhead = None
+        self.speed_hint = 1.
+        self.printer.register_event_handler("klippy:connect",
+                                            self._handle_connect)
+        gcode = self.printer.lookup_object('gcode')
+        gcode.register_command("STEP_BANDWIDTH_STATUS",
+                               self.cmd_STEP_BANDWIDTH_STATUS,
+                               desc=self.cmd_STEP_BANDWIDTH_STATUS_help)
+    def _handle_connect(self):
+        self.toolhead = self.printer.lookup_object('toolhead')
+        for name, mcu in self.printer.lookup_objects('mcu'):
+            self.mcus[mcu.get_name()] = MCUBandwidth(mcu, self.link_capacity)
+    def _check_warning(self, name, mb, status):
+        utilization = status.get('utilization')
+        if utilization is None:
+            return
+        if utilization < self.target_utilization:
+            mb.warned = False
+            return
+        if utilization < self.warn_utilization or mb.warned:
+            return
+        mb.warned = True
+        msg = ("mcu '%s' link at %.0f%% of capacity (%.0f bytes/sec) with"
+               " step messages using %.0f%%" % (
+                   name, utilization * 100., status['capacity'],
+                   status['step_utilization'] * 100.))
+        if status['underrun_time'] is not None:
+            msg += "; predicted underrun in %.1f seconds" % (
+                status['underrun_time'],)
+        logging.warning("step_bandwidth: %s", msg)
+        gcode = self.printer.lookup_object('gcode')
+        gcode.respond_info("Warning: " + msg)
+    def _calc_speed_hint(self, status):
+        capacity = status.get('capacity')
+        step_bytes = status['step_bytes_per_sec']
+        if not capacity or not step_bytes:
+            return 1.
+        # Scale step traffic so that total link usage meets the target
+        other_bytes = max(0., status['demand_bytes_per_sec'] - step_bytes)
+        avail = self.target_utilization * capacity - other_bytes
+        return max(MIN_SPEED_HINT, min(1., avail / step_bytes))
+    def _update(self, eventtime):
+        print_time, est_print_time, lookahead_empty = self.toolhead.check_busy(
+            eventtime)
+        buffer_time = max(0., print_time - est_print_time)
+        msgs = []
+        speed_hint = 1.
+        for name, mb in sorted(self.mcus.items()):
+            status = mb.update(eventtime, buffer_time)
+            if status is None:
+                continue
+            self._check_warning(name, mb, status)
+            status['warning'] = mb.warned
+            speed_hint = min(speed_hint, self._calc_speed_hint(status))
+            msg = "step_bandwidth_%s: step_msgs=%.0f step_bytes=%.0f" % (
+                name, status['step_msgs_per_sec'],
+                status['step_bytes_per_sec'])
+            if 'capacity' in status:
+                msg += " utilization=%.3f step_utilization=%.3f" % (
+                    status['utilization'], status['step_utilization'])
+            msgs.append(msg)
+        if (speed_hint < 1.) != (self.speed_hint < 1.):
+            logging.info("step_bandwidth: speed hint %.3f", speed_hint)
+        self.speed_hint = speed_hint
+        self.toolhead.note_speed_hint('step_bandwidth', speed_hint)
+        return msgs
+    def stats(self, eventtime):
+        if self.toolhead is None:
+            return False, ""
+        return False, ' '.join(self._update(eventtime))
+    cmd_STEP_BANDWIDTH_STATUS_help = "Report step message bandwidth"
+    def cmd_STEP_BANDWIDTH_STATUS(self, gcmd):
+        eventtime = self.printer.get_reactor().monotonic()
+        msgs = self._update(eventtime)
+        if not msgs:
+            msgs = ["step_bandwidth: no data available"]
+        gcmd.respond_info('\n'.join(msgs))
+    def get_status(self, eventtime):
+        return {'mcus': {name: dict(mb.status)
+                         for name, mb in self.mcus.items()},
+                'speed_hint': self.speed_hint}
+
+def load_config(config):
+    return PrinterStepBandwidth(config)
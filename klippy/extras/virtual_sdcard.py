@@ -3,7 +3,8 @@
 # Copyright (C) 2018-2024  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import os, sys, logging, io
+import os, time, logging, io, mmap
+from . import gcode_metadata
 
 VALID_GCODE_EXTS = ['gcode', 'g', 'gco']
 
@@ -13,6 +14,194 @@ DEFAULT_ERROR_GCODE = """
 {% endif %}
 """
 
+# Directory contents are only rescanned if the directory mtime changes.
+# Changes within this many seconds of a scan may share the same mtime,
+# so such directories are always rescanned on the next request. File
+# sizes are not cached as writing to a file does not change the mtime
+# of its directory.
+RACY_MTIME_TIME = 2.
+
+# Cached contents of a single directory
+class DirectoryEntry:
+    def __init__(self, mtime, scan_time, files, subdirs):
+        self.mtime = mtime
+        self.is_racy = scan_time - mtime < RACY_MTIME_TIME
+        self.files = files
+        self.subdirs = subdirs
+
+# Cache of the files in the sdcard directory (and its subdirectories)
+class FileIndex:
+    def __init__(self, dirname):
+        self.dirname = dirname
+        self.dirs = {}
+        self.file_lists = {}
+    def _scan_dir(self, path, st):
+        files = []
+        subdirs = []
+        scan_time = time.time()
+        for entry in os.scandir(path):
+            try:
+                if entry.is_dir():
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+            except OSError:
+                continue
+        return DirectoryEntry(st.st_mtime, scan_time, files, subdirs)
+    def _update_dir(self, rel_path, st, new_dirs):
+        path = os.path.join(self.dirname, rel_path)
+        entry = self.dirs.get(rel_path)
+        if entry is None or entry.is_racy or entry.mtime != st.st_mtime:
+            entry = self._scan_dir(path, st)
+            self.file_lists.clear()
+        new_dirs[rel_path] = entry
+        return entry
+    def _update_tree(self, rel_path, new_dirs, parents):
+        try:
+            st = os.stat(os.path.join(self.dirname, rel_path))
+            dir_id = (st.st_dev, st.st_ino)
+            if dir_id in parents:
+                # Avoid symlink loops
+                return
+            entry = self._update_dir(rel_path, st, new_dirs)
+        except OSError:
+            return
+        parents.add(dir_id)
+        for subdir in entry.subdirs:
+            self._update_tree(os.path.join(rel_path, subdir), new_dirs,
+                              parents)
+        parents.discard(dir_id)
+    def _build_file_list(self, check_subdirs):
+        if not check_subdirs:
+            entry = self.dirs['']
+            return sorted([fname for fname in entry.files
+                           if not fname.startswith('.')], key=str.lower)
+        flist = []
+        for rel_path, entry in self.dirs.items():
+            for fname in entry.files:
+                ext = fname[fname.rfind('.')+1:]
+                if ext in VALID_GCODE_EXTS:
+                    flist.append(os.path.join(rel_path, fname))
+        return sorted(flist, key=str.lower)
+    def get_file_list(self, check_subdirs=False):
+        new_dirs = {}
+        if check_subdirs:
+            self._update_tree('', new_dirs, set())
+            if '' not in new_dirs:
+                return []
+        else:
+            self._update_dir('', os.stat(self.dirname), new_dirs)
+            # Keep cached subdirectories for the next recursive request
+            for rel_path, entry in self.dirs.items():
+                new_dirs.setdefault(rel_path, entry)
+        if set(new_dirs) != set(self.dirs):
+            self.file_lists.clear()
+        self.dirs = new_dirs
+        flist = self.file_lists.get(check_subdirs)
+        if flist is None:
+            flist = self.file_lists[check_subdirs] = self._build_file_list(
+                check_subdirs)
+        files = []
+        for fname in flist:
+            try:
+                size = os.path.getsize(os.path.join(self.dirname, fname))
+            except OSError:
+                continue
+            files.append((fname, size))
+        return files
+
+# Read-ahead sizes used when reading the gcode file (the read size
+# doubles on each read, starting from the minimum after a seek)
+READ_SIZE_MIN = 8192
+READ_SIZE_MAX = 256 * 1024
+
+# Line reader for gcode files (uses mmap when available)
+class GCodeFileReader:
+    def __init__(self, filename):
+        self.name = filename
+        self.file = io.open(filename, 'rb')
+        self.file.seek(0, os.SEEK_END)
+        self.size = self.file.tell()
+        self.file.seek(0)
+        self.mmap = None
+        if self.size:
+            try:
+                self.mmap = mmap.mmap(self.file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                logging.exception("virtual_sdcard mmap")
+        # Reversed list of complete lines not yet returned
+        self.lines = []
+        self.is_ascii = True
+        self.partial_input = b""
+        self.position = self.read_position = 0
+        self.read_size = READ_SIZE_MIN
+    def close(self):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        self.file.close()
+    def seek(self, pos):
+        self.lines = []
+        self.partial_input = b""
+        self.position = self.read_position = pos
+        self.read_size = READ_SIZE_MIN
+        if self.mmap is None:
+            self.file.seek(pos)
+    def read_data(self, pos, count):
+        # Read raw data without changing the line reading position
+        if self.mmap is not None:
+            return self.mmap[pos:pos+count]
+        self.file.seek(pos)
+        data = self.file.read(count)
+        self.file.seek(self.read_position)
+        return data
+    def _read(self):
+        pos = self.read_position
+        read_size = self.read_size
+        self.read_size = min(2 * read_size, READ_SIZE_MAX)
+        if self.mmap is None:
+            return self.file.read(read_size)
+        # Accessing a truncated region of an mmap is fatal - check first
+        if os.fstat(self.file.fileno()).st_size < len(self.mmap):
+            raise IOError("File %s was truncated" % (self.name,))
+        data = self.mmap[pos:pos+read_size]
+        next_pos = pos + len(data)
+        if next_pos < len(self.mmap):
+            # Ask the kernel to start reading the next block
+            length = min(self.read_size, len(self.mmap) - next_pos)
+            start = next_pos - next_pos % mmap.PAGESIZE
+            try:
+                self.mmap.madvise(mmap.MADV_WILLNEED, start,
+                                  next_pos + length - start)
+            except (AttributeError, OSError):
+                pass
+        return data
+    def read_lines(self):
+        # Buffer more lines from the file - returns False at end of file
+        data = self._read()
+        if not data:
+            return False
+        self.read_position += len(data)
+        data = self.partial_input + data
+        split_pos = data.rfind(b'\n') + 1
+        self.partial_input = data[split_pos:]
+        data = data[:split_pos]
+        # Byte offsets of ascii lines can be tracked using the line length
+        self.is_ascii = data.isascii()
+        lines = data.decode().split('\n')
+        lines.pop()
+        lines.reverse()
+        self.lines = lines
+        return True
+    def next_line(self):
+        line = self.lines.pop()
+        if self.is_ascii:
+            self.position += len(line) + 1
+        else:
+            self.position += len(line.encode()) + 1
+        return line
+
 class VirtualSD:
     def __init__(self, config):
         self.printer = config.get_printer()
@@ -21,10 +210,26 @@ class VirtualSD:
         # sdcard state
         sd = config.get('path')
         self.sdcard_dirname = os.path.normpath(os.path.expanduser(sd))
+        self.file_index = FileIndex(self.sdcard_dirname)
         self.current_file = None
         self.file_position = self.file_size = 0
         # Print Stat Tracking
         self.print_stats = self.printer.load_object(config, 'print_stats')
+        # Background indexing of print files
+        self.metadata_fname = None
+        self.metadata_indexer = None
+        index_path = config.get('index_path', None)
+        if index_path is not None:
+            index_dirname = os.path.normpath(os.path.expanduser(index_path))
+            # Index files must not change the sdcard directory contents
+            idir = os.path.join(index_dirname, '')
+            sdir = os.path.join(self.sdcard_dirname, '')
+            if idir.startswith(sdir) or sdir.startswith(idir):
+                raise config.error("index_path must not contain or be"
+                                   " inside of the virtual_sdcard path")
+            self.metadata_indexer = gcode_metadata.GCodeMetadataIndexer(
+                self.printer, self.sdcard_dirname, index_dirname,
+                self.get_file_list, self._handle_metadata)
         # Work timer
         self.reactor = self.printer.get_reactor()
         self.must_pause_work = self.cmd_from_sd = False
@@ -52,8 +257,8 @@ class VirtualSD:
             try:
                 readpos = max(self.file_position - 1024, 0)
                 readcount = self.file_position - readpos
-                self.current_file.seek(readpos)
-                data = self.current_file.read(readcount + 128)
+                data = self.current_file.read_data(readpos, readcount + 128)
+                data = data.decode(errors='replace')
             except:
                 logging.exception("virtual_sdcard shutdown read")
                 return
@@ -65,30 +270,11 @@ class VirtualSD:
             return False, ""
         return True, "sd_pos=%d" % (self.file_position,)
     def get_file_list(self, check_subdirs=False):
-        if check_subdirs:
-            flist = []
-            for root, dirs, files in os.walk(
-                    self.sdcard_dirname, followlinks=True):
-                for name in files:
-                    ext = name[name.rfind('.')+1:]
-                    if ext not in VALID_GCODE_EXTS:
-                        continue
-                    full_path = os.path.join(root, name)
-                    r_path = full_path[len(self.sdcard_dirname) + 1:]
-                    size = os.path.getsize(full_path)
-                    flist.append((r_path, size))
-            return sorted(flist, key=lambda f: f[0].lower())
-        else:
-            dname = self.sdcard_dirname
-            try:
-                filenames = os.listdir(self.sdcard_dirname)
-                return [(fname, os.path.getsize(os.path.join(dname, fname)))
-                        for fname in sorted(filenames, key=str.lower)
-                        if not fname.startswith('.')
-                        and os.path.isfile((os.path.join(dname, fname)))]
-            except:
-                logging.exception("virtual_sdcard get_file_list")
-                raise self.gcode.error("Unable to get file list")
+        try:
+            return self.file_index.get_file_list(check_subdirs)
+        except:
+            logging.exception("virtual_sdcard get_file_list")
+            raise self.gcode.error("Unable to get file list")
     def get_status(self, eventtime):
         return {
             'file_path': self.file_path(),
@@ -157,7 +343,11 @@ class VirtualSD:
         self.do_resume()
     def cmd_M20(self, gcmd):
         # List SD card
-        files = self.get_file_list()
+        start = gcmd.get_int('R', 0, minval=0)
+        count = gcmd.get_int('C', None, minval=1)
+        files = self.get_file_list()[start:]
+        if count is not None:
+            files = files[:count]
         gcmd.respond_raw("Begin file list")
         for fname, fsize in files:
             gcmd.respond_raw("%s %d" % (fname, fsize))
@@ -183,10 +373,8 @@ class VirtualSD:
             if fname not in flist:
                 fname = files_by_lower[fname.lower()]
             fname = os.path.join(self.sdcard_dirname, fname)
-            f = io.open(fname, 'r', newline='')
-            f.seek(0, os.SEEK_END)
-            fsize = f.tell()
-            f.seek(0)
+            f = GCodeFileReader(fname)
+            fsize = f.size
         except:
             logging.exception("virtual_sdcard file open")
             raise gcmd.error("Unable to open file")
@@ -196,6 +384,13 @@ class VirtualSD:
         self.file_position = 0
         self.file_size = fsize
         self.print_stats.set_current_file(filename)
+        if self.metadata_indexer is not None:
+            self.metadata_fname = os.path.relpath(fname, self.sdcard_dirname)
+            self.metadata_indexer.request_metadata(self.metadata_fname)
+    def _handle_metadata(self, fname, metadata):
+        if self.current_file is None or fname != self.metadata_fname:
+            return
+        self.print_stats.set_file_metadata(metadata, self.get_file_position)
     def cmd_M24(self, gcmd):
         # Start/resume SD print
         self.do_resume()
@@ -225,36 +420,31 @@ class VirtualSD:
     def work_handler(self, eventtime):
         logging.info("Starting SD card print (position %d)", self.file_position)
         self.reactor.unregister_timer(self.work_timer)
+        reader = self.current_file
         try:
-            self.current_file.seek(self.file_position)
+            reader.seek(self.file_position)
         except:
             logging.exception("virtual_sdcard seek")
             self.work_timer = None
             return self.reactor.NEVER
         self.print_stats.note_start()
         gcode_mutex = self.gcode.get_mutex()
-        partial_input = ""
-        lines = []
         error_message = None
         while not self.must_pause_work:
-            if not lines:
+            if not reader.lines:
                 # Read more data
                 try:
-                    data = self.current_file.read(8192)
+                    have_data = reader.read_lines()
                 except:
                     logging.exception("virtual_sdcard read")
                     break
-                if not data:
+                if not have_data:
                     # End of file
-                    self.current_file.close()
+                    reader.close()
                     self.current_file = None
                     logging.info("Finished SD card print")
                     self.gcode.respond_raw("Done printing file")
                     break
-                lines = data.split('\n')
-                lines[0] = partial_input + lines[0]
-                partial_input = lines.pop()
-                lines.reverse()
                 self.reactor.pause(self.reactor.NOW)
                 continue
             # Pause if any other request is pending in the gcode class
@@ -263,11 +453,8 @@ class VirtualSD:
                 continue
             # Dispatch command
             self.cmd_from_sd = True
-            line = lines.pop()
-            if sys.version_info.major >= 3:
-                next_file_position = self.file_position + len(line.encode()) + 1
-            else:
-                next_file_position = self.file_position + len(line) + 1
+            line = reader.next_line()
+            next_file_position = reader.position
             self.next_file_position = next_file_position
             try:
                 self.gcode.run_script(line)
@@ -286,13 +473,11 @@ class VirtualSD:
             # Do we need to skip around?
             if self.next_file_position != next_file_position:
                 try:
-                    self.current_file.seek(self.file_position)
+                    reader.seek(self.file_position)
                 except:
                     logging.exception("virtual_sdcard seek")
                     self.work_timer = None
                     return self.reactor.NEVER
-                lines = []
-                partial_input = ""
         logging.info("Exiting SD card print (position %d)", self.file_position)
         self.work_timer = None
         self.cmd_from_sd = False
@@ -123,15 +123,17 @@ class ZThermalAdjuster:
         return position
 
     def move(self, newpos, speed):
+        last_position = self.last_position
         # don't apply to extrude only moves or when disabled
-        if (newpos[0:2] == self.last_position[0:2]) or not self.adjust_enable:
+        if ((newpos[0] == last_position[0] and newpos[1] == last_position[1])
+            or not self.adjust_enable):
             z = newpos[2] + self.last_z_adjust_mm
             adjusted_pos = [newpos[0], newpos[1], z, newpos[3]]
             self.next_transform.move(adjusted_pos, speed)
         else:
             adjusted_pos = self.calc_adjust(newpos)
             self.next_transform.move(adjusted_pos, speed)
-        self.last_position[:] = newpos
+        last_position[:] = newpos
 
     def temperature_callback(self, read_time, temp):
         'Called everytime the Z adjust thermistor is read'
@@ -5,7 +5,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import sys, os, gc, optparse, logging, time, collections, importlib
-import util, reactor, queuelogger, msgproto
+import util, reactor, queuelogger, msgproto, startup_trace
 import gcode, configfile, pins, mcu, toolhead, webhooks
 
 message_ready = "Printer is ready"
@@ -28,6 +28,10 @@ class Printer:
     def __init__(self, main_reactor, bglogger, start_args):
         self.bglogger = bglogger
         self.start_args = start_args
+        self.startup_trace = None
+        if start_args.get('startup_trace') is not None:
+            self.startup_trace = startup_trace.StartupTrace(
+                start_args['startup_trace'])
         self.reactor = main_reactor
         self.reactor.register_callback(self._connect)
         self.state_message = message_startup
@@ -100,7 +104,8 @@ class Printer:
             if default is not configfile.sentinel:
                 return default
             raise self.config_error("Unable to load module '%s'" % (section,))
-        mod = importlib.import_module('extras.' + module_name)
+        with self.startup_span("import extras." + module_name):
+            mod = importlib.import_module('extras.' + module_name)
         init_func = 'load_config'
         if len(module_parts) > 1:
             init_func = 'load_config_prefix'
@@ -109,11 +114,18 @@ class Printer:
             if default is not configfile.sentinel:
                 return default
             raise self.config_error("Unable to load module '%s'" % (section,))
-        self.objects[section] = init_func(config.getsection(section))
+        with self.startup_span("load_config " + section):
+            self.objects[section] = init_func(config.getsection(section))
         return self.objects[section]
+    def startup_span(self, name):
+        # Context manager recording the time of a startup phase
+        if self.startup_trace is None:
+            return startup_trace.null_span()
+        return self.startup_trace.span(name)
     def _read_config(self):
         self.objects['configfile'] = pconfig = configfile.PrinterConfig(self)
-        config = pconfig.read_main_config()
+        with self.startup_span("parse_config"):
+            config = pconfig.read_main_config()
         if self.bglogger is not None:
             pconfig.log_config(config)
         # Create printer components
@@ -127,12 +139,23 @@ class Printer:
         pconfig.check_unused_options(config)
     def _connect(self, eventtime):
         try:
-            self._read_config()
-            self.send_event("klippy:mcu_identify")
-            for cb in self.event_handlers.get("klippy:connect", []):
-                if self.state_message is not message_startup:
-                    return
-                cb()
+            self._connect_and_ready()
+        finally:
+            if self.startup_trace is not None:
+                self.startup_trace.finish()
+                self.startup_trace = None
+    def _connect_and_ready(self):
+        try:
+            with self.startup_span("read_config"):
+                self._read_config()
+            with self.startup_span("klippy:mcu_identify"):
+                self.send_event("klippy:mcu_identify")
+            with self.startup_span("klippy:connect"):
+                for cb in self.event_handlers.get("klippy:connect", []):
+                    if self.state_message is not message_startup:
+                        return
+                    with self.startup_span(startup_trace.get_handler_name(cb)):
+                        cb()
         except (self.config_error, pins.error) as e:
             logging.exception("Config error")
             self._set_state("%s\n%s" % (str(e), message_restart))
@@ -158,10 +181,12 @@ class Printer:
             return
         try:
             self._set_state(message_ready)
-            for cb in self.event_handlers.get("klippy:ready", []):
-                if self.state_message is not message_ready:
-                    return
-                cb()
+            with self.startup_span("klippy:ready"):
+                for cb in self.event_handlers.get("klippy:ready", []):
+                    if self.state_message is not message_ready:
+                        return
+                    with self.startup_span(startup_trace.get_handler_name(cb)):
+                        cb()
         except Exception as e:
             logging.exception("Unhandled exception during ready callback")
             self.invoke_shutdown("Internal error during ready callback: %s"
@@ -220,6 +245,12 @@ class Printer:
     def register_event_handler(self, event, callback):
         self.event_handlers.setdefault(event, []).append(callback)
     def send_event(self, event, *params):
+        if self.startup_trace is not None:
+            res = []
+            for cb in self.event_handlers.get(event, []):
+                with self.startup_span(startup_trace.get_handler_name(cb)):
+                    res.append(cb(*params))
+            return res
         return [cb(*params) for cb in self.event_handlers.get(event, [])]
     def request_exit(self, result):
         if self.run_result is None:
@@ -276,13 +307,16 @@ def main():
                     help="file to read for mcu protocol dictionary")
     opts.add_option("--import-test", action="store_true",
                     help="perform an import module test")
+    opts.add_option("--startup-trace", dest="startup_trace",
+                    help="write startup timing (flamegraph format) to file")
     options, args = opts.parse_args()
     if options.import_test:
         import_test()
     if len(args) != 1:
         opts.error("Incorrect number of arguments")
     start_args = {'config_file': args[0], 'apiserver': options.apiserver,
-                  'start_reason': 'startup'}
+                  'start_reason': 'startup',
+                  'startup_trace': options.startup_trace}
 
     debuglevel = logging.INFO
     if options.verbose:
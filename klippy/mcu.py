@@ -600,6 +600,7 @@ class MCU:
         self._flush_callbacks = []
         # Stats
         self._get_status_info = {}
+        self._stats_buf = ffi_main.new('char[4096]')
         self._stats_sumsq_base = 0.
         self._mcu_tick_avg = 0.
         self._mcu_tick_stddev = 0.
@@ -608,9 +609,6 @@ class MCU:
         printer.load_object(config, "error_mcu")
         printer.register_event_handler("klippy:firmware_restart",
                                        self._firmware_restart)
-        printer.register_event_handler("klippy:mcu_identify",
-                                       self._mcu_identify)
-        printer.register_event_handler("klippy:connect", self._connect)
         printer.register_event_handler("klippy:shutdown", self._shutdown)
         printer.register_event_handler("klippy:disconnect", self._disconnect)
         printer.register_event_handler("klippy:ready", self._ready)
@@ -653,6 +651,8 @@ class MCU:
         self._printer.request_exit('firmware_restart')
         self._reactor.pause(self._reactor.monotonic() + 2.000)
         raise error("Attempt MCU '%s' restart failed" % (self._name,))
+    def _startup_span(self, phase):
+        return self._printer.startup_span("%s %s" % (phase, self._name))
     def _connect_file(self, pace=False):
         # In a debugging mode.  Open debug output file and read data dictionary
         start_args = self._printer.get_start_args()
@@ -739,14 +739,18 @@ class MCU:
                 ["%s=%s" % (k, v) for k, v in self.get_constants().items()]))]
         return "\n".join(log_info)
     def _connect(self):
-        config_params = self._send_get_config()
+        span = self._startup_span
+        with span("get_config"):
+            config_params = self._send_get_config()
         if not config_params['is_config']:
             if self._restart_method == 'rpi_usb':
                 # Only configure mcu after usb power reset
                 self._check_restart("full reset before config")
             # Not configured - send config and issue get_config again
-            self._send_config(None)
-            config_params = self._send_get_config()
+            with span("send_config"):
+                self._send_config(None)
+            with span("get_config"):
+                config_params = self._send_get_config()
             if not config_params['is_config'] and not self.is_fileoutput():
                 raise error("Unable to configure MCU '%s'" % (self._name,))
         else:
@@ -755,7 +759,8 @@ class MCU:
                 raise error("Failed automated reset of MCU '%s'"
                             % (self._name,))
             # Already configured - send init commands
-            self._send_config(config_params['crc'])
+            with span("send_config"):
+                self._send_config(config_params['crc'])
         # Setup steppersync with the move_count returned by get_config
         move_count = config_params['move_count']
         if move_count < self._reserved_move_slots:
@@ -772,28 +777,39 @@ class MCU:
         logging.info(move_msg)
         log_info = self._log_info() + "\n" + move_msg
         self._printer.set_rollover_info(self._name, log_info, log=False)
+    def _serial_connect(self):
+        if self._canbus_iface is not None:
+            cbid = self._printer.lookup_object('canbus_ids')
+            nodeid = cbid.get_nodeid(self._serialport)
+            self._serial.connect_canbus(self._serialport, nodeid,
+                                        self._canbus_iface)
+        elif self._baud:
+            # Cheetah boards require RTS to be deasserted
+            # else a reset will trigger the built-in bootloader.
+            rts = (self._restart_method != "cheetah")
+            self._serial.connect_uart(self._serialport, self._baud, rts)
+        else:
+            self._serial.connect_pipe(self._serialport)
+    def _mcu_connect(self):
+        # Open the mcu connection and load its data dictionary
+        if self.is_fileoutput():
+            return
+        resmeth = self._restart_method
+        if resmeth == 'rpi_usb' and not os.path.exists(self._serialport):
+            # Try toggling usb power
+            self._check_restart("enable power")
+        try:
+            with self._startup_span("serial_connect"):
+                self._serial_connect()
+        except serialhdl.error as e:
+            raise error(str(e))
     def _mcu_identify(self):
         if self.is_fileoutput():
             self._connect_file()
         else:
-            resmeth = self._restart_method
-            if resmeth == 'rpi_usb' and not os.path.exists(self._serialport):
-                # Try toggling usb power
-                self._check_restart("enable power")
             try:
-                if self._canbus_iface is not None:
-                    cbid = self._printer.lookup_object('canbus_ids')
-                    nodeid = cbid.get_nodeid(self._serialport)
-                    self._serial.connect_canbus(self._serialport, nodeid,
-                                                self._canbus_iface)
-                elif self._baud:
-                    # Cheetah boards require RTS to be deasserted
-                    # else a reset will trigger the built-in bootloader.
-                    rts = (resmeth != "cheetah")
-                    self._serial.connect_uart(self._serialport, self._baud, rts)
-                else:
-                    self._serial.connect_pipe(self._serialport)
-                self._clocksync.connect(self._serial)
+                with self._startup_span("clocksync"):
+                    self._clocksync.connect(self._serial)
             except serialhdl.error as e:
                 raise error(str(e))
         logging.info(self._log_info())
@@ -997,26 +1013,85 @@ class MCU:
         return self._is_shutdown
     def get_shutdown_clock(self):
         return self._shutdown_clock
+    def setup_clock_history(self, size):
+        self._clocksync.setup_history(size)
+    def get_clock_history(self):
+        return self._clocksync.get_history()
+    def get_wire_capacity(self):
+        return self._serial.get_wire_capacity()
+    def _steppersync_stats(self):
+        if self._steppersync is None:
+            return ""
+        ffi_main, ffi_lib = chelper.get_ffi()
+        ffi_lib.steppersync_get_stats(self._steppersync, self._stats_buf,
+                                      len(self._stats_buf))
+        return str(ffi_main.string(self._stats_buf).decode())
+    def _parse_stats(self, stats):
+        parts = [s.split('=', 1) for s in stats.split()]
+        return {k:(float(v) if '.' in v else int(v)) for k, v in parts}
+    def get_link_stats(self, eventtime):
+        stats = ' '.join([self._serial.stats(eventtime),
+                          self._steppersync_stats()])
+        return self._parse_stats(stats)
     def get_status(self, eventtime=None):
         return dict(self._get_status_info)
     def stats(self, eventtime):
         load = "mcu_awake=%.03f mcu_task_avg=%.06f mcu_task_stddev=%.06f" % (
             self._mcu_tick_awake, self._mcu_tick_avg, self._mcu_tick_stddev)
         stats = ' '.join([load, self._serial.stats(eventtime),
+                          self._steppersync_stats(),
                           self._clocksync.stats(eventtime)])
-        parts = [s.split('=', 1) for s in stats.split()]
-        last_stats = {k:(float(v) if '.' in v else int(v)) for k, v in parts}
-        self._get_status_info['last_stats'] = last_stats
+        self._get_status_info['last_stats'] = self._parse_stats(stats)
         return False, '%s: %s' % (self._name, stats)
 
+# Connect to and configure all mcus concurrently
+class MCUConnectGroup:
+    def __init__(self, printer, mcus):
+        self._printer = printer
+        self._mcus = mcus
+        printer.register_event_handler("klippy:mcu_identify",
+                                       self._mcu_identify)
+        printer.register_event_handler("klippy:connect", self._connect)
+    def _run_parallel(self, mcus, method):
+        # Run the given method of each mcu in its own reactor greenlet
+        if len(mcus) <= 1:
+            for m in mcus:
+                getattr(m, method)()
+            return
+        def make_callback(func):
+            def callback(eventtime):
+                try:
+                    func()
+                except Exception as e:
+                    return e
+                return None
+            return callback
+        reactor = self._printer.get_reactor()
+        completions = [reactor.register_callback(
+                           make_callback(getattr(m, method))) for m in mcus]
+        errors = [c.wait() for c in completions]
+        for e in errors:
+            if e is not None:
+                raise e
+    def _mcu_identify(self):
+        self._run_parallel(self._mcus, '_mcu_connect')
+        # Secondary mcus synchronize their clock to the primary mcu
+        self._mcus[0]._mcu_identify()
+        self._run_parallel(self._mcus[1:], '_mcu_identify')
+    def _connect(self):
+        self._run_parallel(self._mcus, '_connect')
+
 def add_printer_objects(config):
     printer = config.get_printer()
     reactor = printer.get_reactor()
     mainsync = clocksync.ClockSync(reactor)
-    printer.add_object('mcu', MCU(config.getsection('mcu'), mainsync))
+    mcus = [MCU(config.getsection('mcu'), mainsync)]
+    printer.add_object('mcu', mcus[0])
     for s in config.get_prefix_sections('mcu '):
-        printer.add_object(s.section, MCU(
-            s, clocksync.SecondarySync(reactor, mainsync)))
+        m = MCU(s, clocksync.SecondarySync(reactor, mainsync))
+        printer.add_object(s.section, m)
+        mcus.append(m)
+    MCUConnectGroup(printer, mcus)
 
 def get_printer_mcu(printer, name):
     if name == 'mcu':
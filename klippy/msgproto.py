@@ -122,14 +122,20 @@ MessageTypes = {
 }
 
 # Lookup the message types for a format string
-def lookup_params(msgformat, enumerations={}):
+def lookup_params(msgformat, enumerations={}, enum_types=None):
+    if enum_types is None:
+        enum_types = {}
     out = []
     argparts = [arg.split('=') for arg in msgformat.split()[1:]]
     for name, fmt in argparts:
         pt = MessageTypes[fmt]
         for enum_name, enums in enumerations.items():
             if name == enum_name or name.endswith('_' + enum_name):
-                pt = Enumeration(pt, enum_name, enums)
+                # Share Enumeration instances (and their reverse lookups)
+                key = (fmt, enum_name)
+                if key not in enum_types:
+                    enum_types[key] = Enumeration(pt, enum_name, enums)
+                pt = enum_types[key]
                 break
         out.append((name, pt))
     return out
@@ -160,12 +166,13 @@ def convert_msg_format(msgformat):
     return msgformat
 
 class MessageFormat:
-    def __init__(self, msgid_bytes, msgformat, enumerations={}):
+    def __init__(self, msgid_bytes, msgformat, enumerations={},
+                 enum_types=None):
         self.msgid_bytes = msgid_bytes
         self.msgformat = msgformat
         self.debugformat = convert_msg_format(msgformat)
         self.name = msgformat.split()[0]
-        self.param_names = lookup_params(msgformat, enumerations)
+        self.param_names = lookup_params(msgformat, enumerations, enum_types)
         self.param_types = [t for name, t in self.param_names]
         self.name_to_type = dict(self.param_names)
     def encode(self, params):
@@ -223,6 +230,12 @@ class UnknownFormat:
     def format_params(self, params):
         return "#unknown %s" % (repr(params['#msg']),)
 
+# Parsed data dictionaries (shared by reconnects and by mcus running
+# the same firmware). Parsing takes only a few milliseconds, so the
+# parsed tables are not stored on disk.
+IDENTIFY_CACHE_SIZE = 8
+identify_cache = {}
+
 class MessageParser:
     error = error
     def __init__(self, warn_prefix=""):
@@ -372,6 +385,7 @@ class MessageParser:
                 for i in range(count):
                     enums[enum_root + str(start_enum + i)] = start_value + i
     def _init_messages(self, messages, command_ids=[], output_ids=[]):
+        enum_types = {}
         for msgformat, msgid in messages.items():
             msgtype = 'response'
             if msgid in command_ids:
@@ -386,10 +400,34 @@ class MessageParser:
                 self.messages_by_id[msgid] = OutputFormat(msgid_bytes,
                                                           msgformat)
             else:
-                msg = MessageFormat(msgid_bytes, msgformat, self.enumerations)
+                msg = MessageFormat(msgid_bytes, msgformat, self.enumerations,
+                                    enum_types)
                 self.messages_by_id[msgid] = msg
                 self.messages_by_name[msg.name] = msg
+    def _get_tables(self):
+        return (self.enumerations, self.messages, self.messages_by_id,
+                self.messages_by_name, self.msgid_by_format, self.config,
+                self.version, self.build_versions, self.raw_identify_data)
+    def _set_tables(self, tables):
+        (enumerations, messages, messages_by_id, messages_by_name,
+         msgid_by_format, config, self.version, self.build_versions,
+         self.raw_identify_data) = tables
+        self.enumerations = dict(enumerations)
+        self.messages = list(messages)
+        self.messages_by_id = dict(messages_by_id)
+        self.messages_by_name = dict(messages_by_name)
+        self.msgid_by_format = dict(msgid_by_format)
+        self.config = dict(config)
     def process_identify(self, data, decompress=True):
+        cache_key = (decompress, data)
+        tables = identify_cache.get(cache_key)
+        if tables is None:
+            tables = self._parse_identify(data, decompress)
+            if len(identify_cache) >= IDENTIFY_CACHE_SIZE:
+                del identify_cache[next(iter(identify_cache))]
+            identify_cache[cache_key] = tables
+        self._set_tables(tables)
+    def _parse_identify(self, data, decompress):
         try:
             if decompress:
                 data = zlib.decompress(data)
@@ -412,6 +450,7 @@ class MessageParser:
         except Exception as e:
             logging.exception("process_identify error")
             self._error("Error during identify: %s", str(e))
+        return self._get_tables()
     def get_raw_data_dictionary(self):
         return self.raw_identify_data
     def get_version_info(self):
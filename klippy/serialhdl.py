@@ -8,6 +8,9 @@ import serial
 
 import msgproto, chelper, util
 
+# Overhead bits of a CAN frame (must match CANBUS_PACKET_BITS in serialqueue.c)
+CANBUS_FRAME_BITS = (1 + 11 + 3 + 4) + (16 + 2 + 7 + 3)
+
 class error(Exception):
     pass
 
@@ -23,6 +26,7 @@ class SerialReader:
         self.serialqueue = None
         self.default_cmd_queue = self.alloc_command_queue()
         self.stats_buf = self.ffi_main.new('char[4096]')
+        self.wire_capacity = None
         # Threading
         self.lock = threading.Lock()
         self.background_thread = None
@@ -103,6 +107,11 @@ class SerialReader:
         if wire_freq is not None:
             self.ffi_lib.serialqueue_set_wire_frequency(self.serialqueue,
                                                         wire_freq)
+            if serial_fd_type == b'c':
+                # Full 8 byte frames (see calculate_bittime in serialqueue.c)
+                self.wire_capacity = wire_freq * 8. / (8*8 + CANBUS_FRAME_BITS)
+            else:
+                self.wire_capacity = wire_freq / 10.
         receive_window = msgparser.get_constant_int('RECEIVE_WINDOW', None)
         if receive_window is not None:
             self.ffi_lib.serialqueue_set_receive_window(
@@ -229,6 +238,9 @@ class SerialReader:
         return self.msgparser
     def get_serialqueue(self):
         return self.serialqueue
+    def get_wire_capacity(self):
+        # Maximum data rate (in bytes per second) of the link (if known)
+        return self.wire_capacity
     def get_default_command_queue(self):
         return self.default_cmd_queue
     # Serial response callbacks
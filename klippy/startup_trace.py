@@ -0,0 +1,137 @@
+# Timing of host software startup phases
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, time, logging, threading, contextlib
+import greenlet
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+SUMMARY_COUNT = 5
+
+# Record nested timing spans and write them in the "folded stack"
+# format used by flamegraph tools (one "frame;frame;frame usecs" line
+# per unique stack, with the time spent in that frame itself).
+class StartupTrace:
+    def __init__(self, filename):
+        self.filename = filename
+        self.thread = threading.current_thread()
+        self.start_time = time.time()
+        # Stack of [name, start_time, child_time, owner] entries
+        self.stack = [['klippy', self.start_time, 0., None]]
+        self.self_times = {}
+        self.spans = []
+        self.orig_import = None
+        self.install_import_hook()
+    # Span tracking
+    def begin(self, name):
+        # Only track spans of the greenlet that owns the current span
+        # (work run concurrently in other greenlets is not nested)
+        if threading.current_thread() is not self.thread:
+            return False
+        owner = greenlet.getcurrent()
+        if self.stack[-1][3] not in (None, owner):
+            return False
+        self.stack.append([name.replace(';', ':'), time.time(), 0., owner])
+        return True
+    def end(self):
+        name, start_time, child_time, owner = self.stack.pop()
+        total = time.time() - start_time
+        path = ';'.join([s[0] for s in self.stack] + [name])
+        self.self_times[path] = (self.self_times.get(path, 0.)
+                                 + total - child_time)
+        is_outer_import = (name.startswith("import ")
+                           and not [s for s in self.stack
+                                    if s[0].startswith("import ")])
+        self.spans.append((len(self.stack), name, total, is_outer_import))
+        self.stack[-1][2] += total
+    @contextlib.contextmanager
+    def span(self, name):
+        is_traced = self.begin(name)
+        try:
+            yield
+        finally:
+            if is_traced:
+                self.end()
+    # Import timing
+    def _import_name(self, name, globals, fromlist, level):
+        # Return the name of a module that is about to be loaded (if any)
+        if level:
+            package = (globals or {}).get('__package__') or ''
+            parts = package.split('.')
+            base = '.'.join(parts[:len(parts) - level + 1])
+            name = base + '.' + name if name else base
+        mod = sys.modules.get(name)
+        if mod is None:
+            return name
+        for fname in fromlist or ():
+            if fname != '*' and not hasattr(mod, fname):
+                return name + '.' + fname
+        return None
+    def _traced_import(self, name, globals=None, locals=None, fromlist=(),
+                       level=0):
+        mname = self._import_name(name, globals, fromlist, level)
+        if mname is None:
+            return self.orig_import(name, globals, locals, fromlist, level)
+        with self.span("import " + mname):
+            return self.orig_import(name, globals, locals, fromlist, level)
+    def install_import_hook(self):
+        self.orig_import = builtins.__import__
+        builtins.__import__ = self._traced_import
+    def remove_import_hook(self):
+        if self.orig_import is not None:
+            builtins.__import__ = self.orig_import
+            self.orig_import = None
+    # Reporting
+    def _summarize(self, total):
+        phases = ["total=%.3f" % (total,)]
+        phases += ["%s=%.3f" % (name, t) for depth, name, t, oi in self.spans
+                   if depth == 1]
+        import_time = sum([t for depth, name, t, oi in self.spans if oi])
+        phases.append("imports=%.3f" % (import_time,))
+        slowest = sorted([(t, name) for depth, name, t, oi in self.spans
+                          if depth > 1], reverse=True)[:SUMMARY_COUNT]
+        phases.append("slowest: %s" % (", ".join(
+            ["%s=%.3f" % (name, t) for t, name in slowest]),))
+        return " ".join(phases)
+    def finish(self):
+        self.remove_import_hook()
+        while len(self.stack) > 1:
+            self.end()
+        total = time.time() - self.start_time
+        self.self_times['klippy'] = (self.self_times.get('klippy', 0.)
+                                     + total - self.stack[0][2])
+        try:
+            f = open(self.filename, 'w')
+            for path, t in sorted(self.self_times.items()):
+                usecs = int(t * 1000000. + .5)
+                if usecs > 0:
+                    f.write("%s %d\n" % (path, usecs))
+            f.close()
+        except (IOError, OSError) as e:
+            logging.warning("Unable to write startup trace '%s': %s",
+                            self.filename, str(e))
+        logging.info("Startup trace (%s): %s", self.filename,
+                     self._summarize(total))
+
+@contextlib.contextmanager
+def null_span():
+    yield
+
+# Return a descriptive name for an event handler callback
+def get_handler_name(cb):
+    name = getattr(cb, '__name__', str(cb))
+    obj = getattr(cb, '__self__', None)
+    if obj is None:
+        return name
+    name = "%s.%s" % (obj.__class__.__name__, name)
+    get_name = getattr(obj, 'get_name', None)
+    if get_name is not None:
+        try:
+            name = "%s (%s)" % (name, get_name())
+        except Exception:
+            pass
+    return name
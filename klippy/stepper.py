@@ -50,8 +50,12 @@ class MCU_stepper:
         self._itersolve_generate_steps = ffi_lib.itersolve_generate_steps
         self._itersolve_check_active = ffi_lib.itersolve_check_active
         self._trapq = ffi_main.NULL
-        self._mcu.get_printer().register_event_handler('klippy:connect',
-                                                       self._query_mcu_position)
+        self._stepgen_pool = None
+        printer = self._mcu.get_printer()
+        printer.register_event_handler('klippy:connect',
+                                       self._query_mcu_position)
+        printer.register_event_handler('klippy:connect',
+                                       self._lookup_stepgen_pool)
     def get_mcu(self):
         return self._mcu
     def get_name(self, short=False):
@@ -160,6 +164,10 @@ class MCU_stepper:
         count = ffi_lib.stepcompress_extract_old(self._stepqueue, data, count,
                                                  start_clock, end_clock)
         return (data, count)
+    def extract_step_history(self, data, start_clock, end_clock):
+        ffi_main, ffi_lib = chelper.get_ffi()
+        return ffi_lib.stepcompress_extract_history(
+            self._stepqueue, data, len(data), start_clock, end_clock)
     def get_stepper_kinematics(self):
         return self._stepper_kinematics
     def set_stepper_kinematics(self, sk):
@@ -209,6 +217,10 @@ class MCU_stepper:
         old_tq = self._trapq
         self._trapq = tq
         return old_tq
+    def _lookup_stepgen_pool(self):
+        toolhead = self._mcu.get_printer().lookup_object('toolhead', None)
+        if toolhead is not None:
+            self._stepgen_pool = toolhead.get_step_generation_pool()
     def add_active_callback(self, cb):
         self._active_callbacks.append(cb)
     def generate_steps(self, flush_time):
@@ -223,6 +235,9 @@ class MCU_stepper:
                     cb(ret)
         # Generate steps
         sk = self._stepper_kinematics
+        pool = self._stepgen_pool
+        if pool is not None and pool.queue_steps(sk):
+            return
         ret = self._itersolve_generate_steps(sk, flush_time)
         if ret:
             raise error("Internal error in stepcompress")
@@ -231,6 +246,32 @@ class MCU_stepper:
         a = axis.encode()
         return ffi_lib.itersolve_is_active_axis(self._stepper_kinematics, a)
 
+# Helper to generate the steps of several steppers in parallel
+class StepGenerationPool:
+    def __init__(self, num_threads):
+        ffi_main, ffi_lib = chelper.get_ffi()
+        self._pool = ffi_main.gc(ffi_lib.stepgen_pool_alloc(num_threads),
+                                 ffi_lib.stepgen_pool_free)
+        self._pool_add = ffi_lib.stepgen_pool_add
+        self._pool_generate = ffi_lib.stepgen_pool_generate
+        self._is_queuing = False
+    def queue_steps(self, sk):
+        # Returns true if the caller should defer step generation
+        if not self._is_queuing:
+            return False
+        self._pool_add(self._pool, sk)
+        return True
+    def generate_steps(self, step_generators, flush_time):
+        self._is_queuing = True
+        try:
+            for sg in step_generators:
+                sg(flush_time)
+        finally:
+            self._is_queuing = False
+        ret = self._pool_generate(self._pool, flush_time)
+        if ret:
+            raise error("Internal error in stepcompress")
+
 # Helper code to build a stepper object from a config section
 def PrinterStepper(config, units_in_radians=False):
     printer = config.get_printer()
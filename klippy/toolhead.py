@@ -4,7 +4,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import math, logging, importlib
-import mcu, chelper, kinematics.extruder
+import mcu, chelper, stepper, kinematics.extruder
 
 # Common suffixes: _d is distance (in mm), _v is velocity (in
 #   mm/second), _v2 is velocity squared (mm^2/s^2), _t is time (in
@@ -235,6 +235,8 @@ class ToolHead:
         # Input stall detection
         self.check_stall_time = 0.
         self.print_stall = 0
+        # Suggested velocity reductions (from diagnostic modules)
+        self.speed_hints = {}
         # Input pause tracking
         self.can_pause = True
         if self.mcu.is_fileoutput():
@@ -259,6 +261,12 @@ class ToolHead:
         self.trapq_append = ffi_lib.trapq_append
         self.trapq_finalize_moves = ffi_lib.trapq_finalize_moves
         self.step_generators = []
+        # Optional parallel step generation
+        self.stepgen_pool = None
+        stepgen_threads = config.getint('step_generation_threads', 0,
+                                        minval=0)
+        if stepgen_threads:
+            self.stepgen_pool = stepper.StepGenerationPool(stepgen_threads)
         # Create kinematics class
         gcode = self.printer.lookup_object('gcode')
         self.Coord = gcode.Coord
@@ -296,8 +304,12 @@ class ToolHead:
         sg_flush_want = min(flush_time + STEPCOMPRESS_FLUSH_TIME,
                             self.print_time - self.kin_flush_delay)
         sg_flush_time = max(sg_flush_want, flush_time)
-        for sg in self.step_generators:
-            sg(sg_flush_time)
+        if self.stepgen_pool is not None:
+            self.stepgen_pool.generate_steps(self.step_generators,
+                                             sg_flush_time)
+        else:
+            for sg in self.step_generators:
+                sg(sg_flush_time)
         self.min_restart_time = max(self.min_restart_time, sg_flush_time)
         # Free trapq entries that are no longer needed
         clear_history_time = self.clear_history_time
@@ -561,6 +573,7 @@ class ToolHead:
     def get_status(self, eventtime):
         print_time = self.print_time
         estimated_print_time = self.mcu.estimated_print_time(eventtime)
+        speed_hint = min([1.] + list(self.speed_hints.values()))
         res = dict(self.kin.get_status(eventtime))
         res.update({ 'print_time': print_time,
                      'stalls': self.print_stall,
@@ -570,7 +583,8 @@ class ToolHead:
                      'max_velocity': self.max_velocity,
                      'max_accel': self.max_accel,
                      'minimum_cruise_ratio': self.min_cruise_ratio,
-                     'square_corner_velocity': self.square_corner_velocity})
+                     'square_corner_velocity': self.square_corner_velocity,
+                     'speed_hint': speed_hint})
         return res
     def _handle_shutdown(self):
         self.can_pause = False
@@ -581,6 +595,8 @@ class ToolHead:
         return self.trapq
     def register_step_generator(self, handler):
         self.step_generators.append(handler)
+    def get_step_generation_pool(self):
+        return self.stepgen_pool
     def note_step_generation_scan_time(self, delay, old_delay=0.):
         self.flush_step_generation()
         if old_delay:
@@ -595,6 +611,12 @@ class ToolHead:
             callback(self.get_last_move_time())
             return
         last_move.timing_callbacks.append(callback)
+    def note_speed_hint(self, source, factor):
+        # Note a suggested velocity scale factor (1. for no reduction)
+        if factor >= 1.:
+            self.speed_hints.pop(source, None)
+        else:
+            self.speed_hints[source] = factor
     def note_mcu_movequeue_activity(self, mq_time, set_step_gen_time=False):
         self.need_flush_time = max(self.need_flush_time, mq_time)
         if set_step_gen_time:
@@ -0,0 +1,316 @@
+#define CONFIG_LOW_LEVEL_OPTIONS 0
+#define CONFIG_MACH_AVR 0
+#define CONFIG_MACH_ATSAM 0
+#define CONFIG_MACH_ATSAMD 0
+#define CONFIG_MACH_LPC176X 0
+#define CONFIG_MACH_STM32 0
+#define CONFIG_MACH_HC32F460 0
+#define CONFIG_MACH_RP2040 0
+#define CONFIG_MACH_PRU 0
+#define CONFIG_MACH_AR100 0
+#define CONFIG_MACH_LINUX 1
+#define CONFIG_MACH_SIMU 0
+#define CONFIG_AVR_SELECT 0
+#define CONFIG_BOARD_DIRECTORY "linux"
+#define CONFIG_MACH_atmega2560 0
+#define CONFIG_MACH_atmega1280 0
+#define CONFIG_MACH_at90usb1286 0
+#define CONFIG_MACH_at90usb646 0
+#define CONFIG_MACH_atmega32u4 0
+#define CONFIG_MACH_atmega1284p 0
+#define CONFIG_MACH_atmega644p 0
+#define CONFIG_MACH_atmega328p 0
+#define CONFIG_MACH_atmega328 0
+#define CONFIG_MACH_atmega168 0
+#define CONFIG_MCU ""
+#define CONFIG_AVRDUDE_PROTOCOL ""
+#define CONFIG_AVR_FREQ_16000000 0
+#define CONFIG_AVR_FREQ_20000000 0
+#define CONFIG_AVR_FREQ_8000000 0
+#define CONFIG_CLOCK_FREQ 50000000
+#define CONFIG_CLEAR_PRESCALER 0
+#define CONFIG_AVR_CLKPR 0
+#define CONFIG_AVR_STACK_SIZE 0
+#define CONFIG_AVR_WATCHDOG 0
+#define CONFIG_USBSERIAL 0
+#define CONFIG_SERIAL 0
+#define CONFIG_AVR_USB 0
+#define CONFIG_AVR_SERIAL_UART0 0
+#define CONFIG_AVR_SERIAL_UART1 0
+#define CONFIG_AVR_SERIAL_UART2 0
+#define CONFIG_AVR_SERIAL_UART3 0
+#define CONFIG_SERIAL_BAUD_U2X 0
+#define CONFIG_SERIAL_PORT 0
+#define CONFIG_SIMULAVR 0
+#define CONFIG_MAXPROUI_SERIAL 0
+#define CONFIG_AVR_MAXPROUI_SERIAL_UART0 0
+#define CONFIG_AVR_MAXPROUI_SERIAL_UART1 0
+#define CONFIG_AVR_MAXPROUI_SERIAL_UART2 0
+#define CONFIG_AVR_MAXPROUI_SERIAL_UART3 0
+#define CONFIG_MAXPROUI_SERIAL_PORT 0
+#define CONFIG_ATSAM_SELECT 0
+#define CONFIG_MACH_SAM3X8E 0
+#define CONFIG_MACH_SAM3X8C 0
+#define CONFIG_MACH_SAM4S8C 0
+#define CONFIG_MACH_SAM4E8E 0
+#define CONFIG_MACH_SAME70Q20B 0
+#define CONFIG_MACH_SAM3X 0
+#define CONFIG_MACH_SAM4 0
+#define CONFIG_MACH_SAM4S 0
+#define CONFIG_MACH_SAM4E 0
+#define CONFIG_MACH_SAME70 0
+#define CONFIG_HAVE_SAM_CANBUS 0
+#define CONFIG_FLASH_SIZE 0x
+#define CONFIG_FLASH_BOOT_ADDRESS 0x
+#define CONFIG_RAM_START 0x
+#define CONFIG_RAM_SIZE 0x
+#define CONFIG_STACK_SIZE 0
+#define CONFIG_FLASH_APPLICATION_ADDRESS 0x
+#define CONFIG_ATSAM_USB 0
+#define CONFIG_ATSAM_SERIAL 0
+#define CONFIG_ATSAM_MMENU_CANBUS_PC12_PD12 0
+#define CONFIG_ATSAM_MMENU_CANBUS_PB3_PB2 0
+#define CONFIG_ATSAM_USBCANBUS 0
+#define CONFIG_ATSAM_CMENU_CANBUS_PC12_PD12 0
+#define CONFIG_ATSAM_CMENU_CANBUS_PB3_PB2 0
+#define CONFIG_ATSAM_CANBUS_PC12_PD12 0
+#define CONFIG_ATSAM_CANBUS_PB3_PB2 0
+#define CONFIG_ATSAMD_SELECT 0
+#define CONFIG_HAVE_SERCOM 0
+#define CONFIG_MACH_SAMC21G18 0
+#define CONFIG_MACH_SAMD21G18 0
+#define CONFIG_MACH_SAMD21E18 0
+#define CONFIG_MACH_SAMD21J18 0
+#define CONFIG_MACH_SAMD21E15 0
+#define CONFIG_MACH_SAMD51G19 0
+#define CONFIG_MACH_SAMD51J19 0
+#define CONFIG_MACH_SAMD51N19 0
+#define CONFIG_MACH_SAMD51P20 0
+#define CONFIG_MACH_SAME51J19 0
+#define CONFIG_MACH_SAME54P20 0
+#define CONFIG_MACH_SAMX2 0
+#define CONFIG_MACH_SAMC21 0
+#define CONFIG_MACH_SAMD21 0
+#define CONFIG_MACH_SAMX5 0
+#define CONFIG_MACH_SAMD51 0
+#define CONFIG_MACH_SAME51 0
+#define CONFIG_MACH_SAME54 0
+#define CONFIG_HAVE_SAMD_CANBUS 0
+#define CONFIG_HAVE_SAMD_USB 0
+#define CONFIG_SAMD_FLASH_START_2000 0
+#define CONFIG_SAMD_FLASH_START_4000 0
+#define CONFIG_SAMD_FLASH_START_0000 0
+#define CONFIG_CLOCK_REF_X32K 0
+#define CONFIG_CLOCK_REF_X12M 0
+#define CONFIG_CLOCK_REF_X25M 0
+#define CONFIG_CLOCK_REF_INTERNAL 0
+#define CONFIG_SAMD51_FREQ_120 0
+#define CONFIG_SAMD51_FREQ_150 0
+#define CONFIG_SAMD51_FREQ_180 0
+#define CONFIG_SAMD51_FREQ_200 0
+#define CONFIG_ATSAMD_USB 0
+#define CONFIG_ATSAMD_SERIAL 0
+#define CONFIG_ATSAMD_MMENU_CANBUS_PA23_PA22 0
+#define CONFIG_ATSAMD_MMENU_CANBUS_PA25_PA24 0
+#define CONFIG_ATSAMD_MMENU_CANBUS_PB11_PB10 0
+#define CONFIG_ATSAMD_MMENU_CANBUS_PB13_PB12 0
+#define CONFIG_ATSAMD_MMENU_CANBUS_PB15_PB14 0
+#define CONFIG_ATSAMD_USBCANBUS 0
+#define CONFIG_ATSAMD_CMENU_CANBUS_PA23_PA22 0
+#define CONFIG_ATSAMD_CMENU_CANBUS_PB13_PB12 0
+#define CONFIG_ATSAMD_CMENU_CANBUS_PB15_PB14 0
+#define CONFIG_ATSAMD_CANBUS_PA23_PA22 0
+#define CONFIG_ATSAMD_CANBUS_PA25_PA24 0
+#define CONFIG_ATSAMD_CANBUS_PB11_PB10 0
+#define CONFIG_ATSAMD_CANBUS_PB13_PB12 0
+#define CONFIG_ATSAMD_CANBUS_PB15_PB14 0
+#define CONFIG_LPC_SELECT 0
+#define CONFIG_MACH_LPC1768 0
+#define CONFIG_MACH_LPC1769 0
+#define CONFIG_LPC_FLASH_START_4000 0
+#define CONFIG_LPC_FLASH_START_0000 0
+#define CONFIG_LPC_USB 0
+#define CONFIG_LPC_SERIAL_UART0_P03_P02 0
+#define CONFIG_LPC_SERIAL_UART3_P429_P428 0
+#define CONFIG_STM32_SELECT 0
+#define CONFIG_MACH_STM32F103 0
+#define CONFIG_MACH_STM32F207 0
+#define CONFIG_MACH_STM32F401 0
+#define CONFIG_MACH_STM32F405 0
+#define CONFIG_MACH_STM32F407 0
+#define CONFIG_MACH_STM32F429 0
+#define CONFIG_MACH_STM32F446 0
+#define CONFIG_MACH_STM32F765 0
+#define CONFIG_MACH_STM32F031 0
+#define CONFIG_MACH_STM32F042 0
+#define CONFIG_MACH_STM32F070 0
+#define CONFIG_MACH_STM32F072 0
+#define CONFIG_MACH_STM32G070 0
+#define CONFIG_MACH_STM32G071 0
+#define CONFIG_MACH_STM32G0B0 0
+#define CONFIG_MACH_STM32G0B1 0
+#define CONFIG_MACH_STM32G431 0
+#define CONFIG_MACH_STM32G474 0
+#define CONFIG_MACH_STM32H723 0
+#define CONFIG_MACH_STM32H743 0
+#define CONFIG_MACH_STM32H750 0
+#define CONFIG_MACH_STM32L412 0
+#define CONFIG_MACH_N32G452 0
+#define CONFIG_MACH_N32G455 0
+#define CONFIG_MACH_STM32F103x6 0
+#define CONFIG_MACH_STM32F0 0
+#define CONFIG_MACH_STM32F1 0
+#define CONFIG_MACH_STM32F2 0
+#define CONFIG_MACH_STM32F4 0
+#define CONFIG_MACH_STM32F7 0
+#define CONFIG_MACH_STM32G0 0
+#define CONFIG_MACH_STM32G07x 0
+#define CONFIG_MACH_STM32G0Bx 0
+#define CONFIG_MACH_STM32G4 0
+#define CONFIG_MACH_STM32H7 0
+#define CONFIG_MACH_STM32F0x2 0
+#define CONFIG_MACH_STM32F4x5 0
+#define CONFIG_MACH_STM32L4 0
+#define CONFIG_MACH_N32G45x 0
+#define CONFIG_HAVE_STM32_USBFS 0
+#define CONFIG_HAVE_STM32_USBOTG 0
+#define CONFIG_HAVE_STM32_CANBUS 0
+#define CONFIG_HAVE_STM32_FDCANBUS 0
+#define CONFIG_HAVE_STM32_USBCANBUS 0
+#define CONFIG_STM32F103GD_DISABLE_SWD 0
+#define CONFIG_STM32_DFU_ROM_ADDRESS 0x
+#define CONFIG_STM32_FLASH_START_2000 0
+#define CONFIG_STM32_FLASH_START_5000 0
+#define CONFIG_STM32_FLASH_START_7000 0
+#define CONFIG_STM32_FLASH_START_8000 0
+#define CONFIG_STM32_FLASH_START_8800 0
+#define CONFIG_STM32_FLASH_START_20200 0
+#define CONFIG_STM32_FLASH_START_9000 0
+#define CONFIG_STM32_FLASH_START_C000 0
+#define CONFIG_STM32_FLASH_START_10000 0
+#define CONFIG_STM32_FLASH_START_800 0
+#define CONFIG_STM32_FLASH_START_1000 0
+#define CONFIG_STM32_FLASH_START_4000 0
+#define CONFIG_STM32_FLASH_START_20000 0
+#define CONFIG_STM32_FLASH_START_0000 0
+#define CONFIG_ARMCM_RAM_VECTORTABLE 0
+#define CONFIG_STM32_CLOCK_REF_8M 0
+#define CONFIG_STM32_CLOCK_REF_12M 0
+#define CONFIG_STM32_CLOCK_REF_16M 0
+#define CONFIG_STM32_CLOCK_REF_20M 0
+#define CONFIG_STM32_CLOCK_REF_24M 0
+#define CONFIG_STM32_CLOCK_REF_25M 0
+#define CONFIG_STM32_CLOCK_REF_INTERNAL 0
+#define CONFIG_CLOCK_REF_FREQ 0
+#define CONFIG_STM32F0_TRIM 0
+#define CONFIG_STM32_USB_PA11_PA12 0
+#define CONFIG_STM32_USB_PA11_PA12_REMAP 0
+#define CONFIG_STM32_USB_PB14_PB15 0
+#define CONFIG_STM32_SERIAL_USART1 0
+#define CONFIG_STM32_SERIAL_USART1_ALT_PB7_PB6 0
+#define CONFIG_STM32_SERIAL_USART2 0
+#define CONFIG_STM32_SERIAL_USART2_ALT_PA15_PA14 0
+#define CONFIG_STM32_SERIAL_USART2_ALT_PB4_PB3 0
+#define CONFIG_STM32_SERIAL_USART2_ALT_PD6_PD5 0
+#define CONFIG_STM32_SERIAL_USART3 0
+#define CONFIG_STM32_SERIAL_USART3_ALT_PD9_PD8 0
+#define CONFIG_STM32_SERIAL_UART4 0
+#define CONFIG_STM32_SERIAL_USART5 0
+#define CONFIG_STM32_CANBUS_PA11_PA12 0
+#define CONFIG_STM32_CANBUS_PA11_PA12_REMAP 0
+#define CONFIG_STM32_CANBUS_PA11_PB9 0
+#define CONFIG_STM32_MMENU_CANBUS_PB8_PB9 0
+#define CONFIG_STM32_MMENU_CANBUS_PI9_PH13 0
+#define CONFIG_STM32_MMENU_CANBUS_PB5_PB6 0
+#define CONFIG_STM32_MMENU_CANBUS_PB12_PB13 0
+#define CONFIG_STM32_MMENU_CANBUS_PD0_PD1 0
+#define CONFIG_STM32_MMENU_CANBUS_PB0_PB1 0
+#define CONFIG_STM32_MMENU_CANBUS_PD12_PD13 0
+#define CONFIG_STM32_MMENU_CANBUS_PC2_PC3 0
+#define CONFIG_STM32_USBCANBUS_PA11_PA12 0
+#define CONFIG_STM32_CMENU_CANBUS_PB8_PB9 0
+#define CONFIG_STM32_CMENU_CANBUS_PI9_PH13 0
+#define CONFIG_STM32_CMENU_CANBUS_PB5_PB6 0
+#define CONFIG_STM32_CMENU_CANBUS_PB12_PB13 0
+#define CONFIG_STM32_CMENU_CANBUS_PD0_PD1 0
+#define CONFIG_STM32_CMENU_CANBUS_PB0_PB1 0
+#define CONFIG_STM32_CMENU_CANBUS_PD12_PD13 0
+#define CONFIG_STM32_CMENU_CANBUS_PC2_PC3 0
+#define CONFIG_STM32_CANBUS_PB8_PB9 0
+#define CONFIG_STM32_CANBUS_PI9_PH13 0
+#define CONFIG_STM32_CANBUS_PB5_PB6 0
+#define CONFIG_STM32_CANBUS_PB12_PB13 0
+#define CONFIG_STM32_CANBUS_PD0_PD1 0
+#define CONFIG_STM32_CANBUS_PB0_PB1 0
+#define CONFIG_STM32_CANBUS_PD12_PD13 0
+#define CONFIG_STM32_CANBUS_PC2_PC3 0
+#define CONFIG_HC32F460_SELECT 0
+#define CONFIG_HC32F460_SERIAL_PA7_PA8 0
+#define CONFIG_HC32F460_SERIAL_PA13_PA14 0
+#define CONFIG_HC32F460_SERIAL_PA3_PA2 0
+#define CONFIG_HC32F460_SERIAL_PH2_PB10 0
+#define CONFIG_HC32F460_SERIAL_PA15_PA9 0
+#define CONFIG_HC32F460_SERIAL_PC0_PC1 0
+#define CONFIG_HC32F460_FLASH_APPLICATION_ADDRESS_0x008000 0
+#define CONFIG_HC32F460_FLASH_APPLICATION_ADDRESS_0x00C000 0
+#define CONFIG_HC32F460_FLASH_APPLICATION_ADDRESS_0x010000 0
+#define CONFIG_HC32F460_CLOCK_SPEED_168M 0
+#define CONFIG_HC32F460_CLOCK_SPEED_200M 0
+#define CONFIG_RP2040_SELECT 0
+#define CONFIG_RP2040_HAVE_STAGE2 0
+#define CONFIG_RP2040_HAVE_BOOTLOADER 0
+#define CONFIG_RP2040_FLASH_START_0100 0
+#define CONFIG_RP2040_FLASH_START_4000 0
+#define CONFIG_RP2040_FLASH_W25Q080 0
+#define CONFIG_RP2040_FLASH_GENERIC_03 0
+#define CONFIG_RP2040_STAGE2_FILE ""
+#define CONFIG_RP2040_STAGE2_CLKDIV 0
+#define CONFIG_RP2040_USB 0
+#define CONFIG_RP2040_SERIAL_UART0_PINS_0_1 0
+#define CONFIG_RP2040_SERIAL_UART0_PINS_12_13 0
+#define CONFIG_RP2040_SERIAL_UART0_PINS_16_17 0
+#define CONFIG_RP2040_SERIAL_UART0_PINS_28_29 0
+#define CONFIG_RP2040_SERIAL_UART1_PINS_4_5 0
+#define CONFIG_RP2040_SERIAL_UART1_PINS_8_9 0
+#define CONFIG_RP2040_SERIAL_UART1_PINS_20_21 0
+#define CONFIG_RP2040_SERIAL_UART1_PINS_24_25 0
+#define CONFIG_RP2040_CANBUS 0
+#define CONFIG_RP2040_USBCANBUS 0
+#define CONFIG_RP2040_CANBUS_GPIO_RX 0
+#define CONFIG_RP2040_CANBUS_GPIO_TX 0
+#define CONFIG_PRU_SELECT 0
+#define CONFIG_AR100_SELECT 0
+#define CONFIG_LINUX_SELECT 1
+#define CONFIG_SIMULATOR_SELECT 0
+#define CONFIG_SERIAL_BAUD 0
+#define CONFIG_USBCANBUS 0
+#define CONFIG_USB 0
+#define CONFIG_USB_VENDOR_ID 0x1d50
+#define CONFIG_USB_DEVICE_ID 0x614e
+#define CONFIG_USB_SERIAL_NUMBER_CHIPID 0
+#define CONFIG_USB_SERIAL_NUMBER "12345"
+#define CONFIG_WANT_GPIO_BITBANGING 1
+#define CONFIG_WANT_DISPLAYS 1
+#define CONFIG_WANT_SENSORS 1
+#define CONFIG_WANT_LIS2DW 1
+#define CONFIG_WANT_LDC1612 1
+#define CONFIG_WANT_SOFTWARE_I2C 1
+#define CONFIG_WANT_SOFTWARE_SPI 1
+#define CONFIG_NEED_SENSOR_BULK 1
+#define CONFIG_CANSERIAL 0
+#define CONFIG_CANBUS 0
+#define CONFIG_CANBUS_FREQUENCY 1000000
+#define CONFIG_CANBUS_FILTER 0
+#define CONFIG_INITIAL_PINS ""
+#define CONFIG_HAVE_GPIO 1
+#define CONFIG_HAVE_GPIO_ADC 1
+#define CONFIG_HAVE_GPIO_SPI 1
+#define CONFIG_HAVE_GPIO_SDIO 0
+#define CONFIG_HAVE_GPIO_I2C 1
+#define CONFIG_HAVE_GPIO_HARD_PWM 1
+#define CONFIG_HAVE_STRICT_TIMING 0
+#define CONFIG_HAVE_CHIPID 0
+#define CONFIG_HAVE_STEPPER_BOTH_EDGE 0
+#define CONFIG_HAVE_BOOTLOADER_REQUEST 0
+#define CONFIG_HAVE_LIMITED_CODE_SIZE 0
+#define CONFIG_INLINE_STEPPER_HACK 1
@@ -0,0 +1,1847 @@
+
+/* DO NOT EDIT! This is an autogenerated file. See scripts/buildcommands.py. */
+
+#include "board/irq.h"
+#include "board/pgm.h"
+#include "command.h"
+#include "compiler.h"
+#include "initial_pins.h"
+
+void
+ctr_run_initfuncs(void)
+{
+    extern void alloc_init(void);
+    alloc_init();
+    extern void initial_pins_setup(void);
+    initial_pins_setup();
+    extern void timer_init(void);
+    timer_init();
+}
+
+void
+ctr_run_shutdownfuncs(void)
+{
+    extern void sendf_shutdown(void);
+    sendf_shutdown();
+    extern void move_reset(void);
+    move_reset();
+    extern void digital_out_shutdown(void);
+    digital_out_shutdown();
+    extern void stepper_shutdown(void);
+    stepper_shutdown();
+    extern void trsync_shutdown(void);
+    trsync_shutdown();
+    extern void analog_in_shutdown(void);
+    analog_in_shutdown();
+    extern void spidev_shutdown(void);
+    spidev_shutdown();
+    extern void pwm_shutdown(void);
+    pwm_shutdown();
+    extern void tmcuart_shutdown(void);
+    tmcuart_shutdown();
+    extern void st7920_shutdown(void);
+    st7920_shutdown();
+    extern void hd44780_shutdown(void);
+    hd44780_shutdown();
+    extern void pca9685_shutdown(void);
+    pca9685_shutdown();
+}
+
+void
+ctr_run_taskfuncs(void)
+{
+    irq_poll();
+    extern void trsync_task(void);
+    trsync_task();
+    irq_poll();
+    extern void analog_in_task(void);
+    analog_in_task();
+    irq_poll();
+    extern void buttons_task(void);
+    buttons_task();
+    irq_poll();
+    extern void tmcuart_task(void);
+    tmcuart_task();
+    irq_poll();
+    extern void counter_task(void);
+    counter_task();
+    irq_poll();
+    extern void thermocouple_task(void);
+    thermocouple_task();
+    irq_poll();
+    extern void adxl345_task(void);
+    adxl345_task();
+    irq_poll();
+    extern void spi_angle_task(void);
+    spi_angle_task();
+    irq_poll();
+    extern void mpu9250_task(void);
+    mpu9250_task();
+    irq_poll();
+    extern void lis2dw_task(void);
+    lis2dw_task();
+    irq_poll();
+    extern void ldc1612_task(void);
+    ldc1612_task();
+    irq_poll();
+    extern void console_task(void);
+    console_task();
+    irq_poll();
+    extern void watchdog_task(void);
+    watchdog_task();
+    irq_poll();
+    extern void ds18_task(void);
+    ds18_task();
+    irq_poll();
+}
+
+uint8_t __always_inline
+ctr_lookup_static_string(const char *str)
+{
+    if (__builtin_strcmp(str, "Shutdown cleared when not shutdown") == 0)
+        return 2;
+    if (__builtin_strcmp(str, "Timer too close") == 0)
+        return 3;
+    if (__builtin_strcmp(str, "sentinel timer called") == 0)
+        return 4;
+    if (__builtin_strcmp(str, "Invalid command") == 0)
+        return 5;
+    if (__builtin_strcmp(str, "Message encode error") == 0)
+        return 6;
+    if (__builtin_strcmp(str, "Command parser error") == 0)
+        return 7;
+    if (__builtin_strcmp(str, "Command request") == 0)
+        return 8;
+    if (__builtin_strcmp(str, "config_reset only available when shutdown") == 0)
+        return 9;
+    if (__builtin_strcmp(str, "oids already allocated") == 0)
+        return 10;
+    if (__builtin_strcmp(str, "Can't assign oid") == 0)
+        return 11;
+    if (__builtin_strcmp(str, "Invalid oid type") == 0)
+        return 12;
+    if (__builtin_strcmp(str, "Already finalized") == 0)
+        return 13;
+    if (__builtin_strcmp(str, "Invalid move request size") == 0)
+        return 14;
+    if (__builtin_strcmp(str, "Move queue overflow") == 0)
+        return 15;
+    if (__builtin_strcmp(str, "alloc_chunks failed") == 0)
+        return 16;
+    if (__builtin_strcmp(str, "alloc_chunk failed") == 0)
+        return 17;
+    if (__builtin_strcmp(str, "update_digital_out not valid with active queue") == 0)
+        return 18;
+    if (__builtin_strcmp(str, "Scheduled digital out event will exceed max_duration") == 0)
+        return 19;
+    if (__builtin_strcmp(str, "Can not set soft pwm cycle ticks while updates pending") == 0)
+        return 20;
+    if (__builtin_strcmp(str, "Missed scheduling of next digital out event") == 0)
+        return 21;
+    if (__builtin_strcmp(str, "Can't reset time when stepper active") == 0)
+        return 22;
+    if (__builtin_strcmp(str, "Invalid count parameter") == 0)
+        return 23;
+    if (__builtin_strcmp(str, "Stepper too far in past") == 0)
+        return 24;
+    if (__builtin_strcmp(str, "Can't add signal that is already active") == 0)
+        return 25;
+    if (__builtin_strcmp(str, "ADC out of range") == 0)
+        return 26;
+    if (__builtin_strcmp(str, "Invalid spi config") == 0)
+        return 27;
+    if (__builtin_strcmp(str, "i2c_modify_bits: Odd number of bits!") == 0)
+        return 28;
+    if (__builtin_strcmp(str, "Scheduled pwm event will exceed max_duration") == 0)
+        return 29;
+    if (__builtin_strcmp(str, "Missed scheduling of next hard pwm event") == 0)
+        return 30;
+    if (__builtin_strcmp(str, "Invalid buttons retransmit count") == 0)
+        return 31;
+    if (__builtin_strcmp(str, "Set button past maximum button count") == 0)
+        return 32;
+    if (__builtin_strcmp(str, "Max of 8 buttons") == 0)
+        return 33;
+    if (__builtin_strcmp(str, "tmcuart data too large") == 0)
+        return 34;
+    if (__builtin_strcmp(str, "Invalid neopixel update command") == 0)
+        return 35;
+    if (__builtin_strcmp(str, "Invalid neopixel data_size") == 0)
+        return 36;
+    if (__builtin_strcmp(str, "soft_i2c NACK") == 0)
+        return 37;
+    if (__builtin_strcmp(str, "Thermocouple reader fault") == 0)
+        return 38;
+    if (__builtin_strcmp(str, "Invalid thermocouple chip type") == 0)
+        return 39;
+    if (__builtin_strcmp(str, "angle sensor requires cs pin") == 0)
+        return 40;
+    if (__builtin_strcmp(str, "Invalid spi_angle chip type") == 0)
+        return 41;
+    if (__builtin_strcmp(str, "Rescheduled timer in the past") == 0)
+        return 42;
+    if (__builtin_strcmp(str, "Force shutdown command") == 0)
+        return 43;
+    if (__builtin_strcmp(str, "Invalid pca9685 channel or value") == 0)
+        return 44;
+    if (__builtin_strcmp(str, "Scheduled pca9685 event will exceed max_duration") == 0)
+        return 45;
+    if (__builtin_strcmp(str, "Invalid pca9685 value") == 0)
+        return 46;
+    if (__builtin_strcmp(str, "Missed scheduling of next pca9685 event") == 0)
+        return 47;
+    if (__builtin_strcmp(str, "Unable to open and init PCA9685 device") == 0)
+        return 48;
+    if (__builtin_strcmp(str, "Too many i2c devices") == 0)
+        return 49;
+    if (__builtin_strcmp(str, "All PCA9685 channels must have the same cycle_ticks") == 0)
+        return 50;
+    if (__builtin_strcmp(str, "Unable to update PCA9685 value") == 0)
+        return 51;
+    if (__builtin_strcmp(str, "Unable to write to spi") == 0)
+        return 52;
+    if (__builtin_strcmp(str, "Unable to issue spi ioctl") == 0)
+        return 53;
+    if (__builtin_strcmp(str, "Unable to set SPI mode") == 0)
+        return 54;
+    if (__builtin_strcmp(str, "Unable to set SPI speed") == 0)
+        return 55;
+    if (__builtin_strcmp(str, "Unable to set non-blocking on spi device") == 0)
+        return 56;
+    if (__builtin_strcmp(str, "Unable to open spi device") == 0)
+        return 57;
+    if (__builtin_strcmp(str, "Too many spi devices") == 0)
+        return 58;
+    if (__builtin_strcmp(str, "Error on analog read") == 0)
+        return 59;
+    if (__builtin_strcmp(str, "Unable to open adc device") == 0)
+        return 60;
+    if (__builtin_strcmp(str, "Unable to config pwm device") == 0)
+        return 61;
+    if (__builtin_strcmp(str, "Unable to read i2c device") == 0)
+        return 62;
+    if (__builtin_strcmp(str, "Unable write i2c device") == 0)
+        return 63;
+    if (__builtin_strcmp(str, "Unable to open i2c device") == 0)
+        return 64;
+    if (__builtin_strcmp(str, "Unable to open in GPIO chip line") == 0)
+        return 65;
+    if (__builtin_strcmp(str, "Unable to open out GPIO chip line") == 0)
+        return 66;
+    if (__builtin_strcmp(str, "Unable to open GPIO chip device") == 0)
+        return 67;
+    if (__builtin_strcmp(str, "GPIO chip device not found") == 0)
+        return 68;
+    if (__builtin_strcmp(str, "DS18B20 sensor didn't respond in time") == 0)
+        return 69;
+    if (__builtin_strcmp(str, "DS18B20 out of range") == 0)
+        return 70;
+    if (__builtin_strcmp(str, "Error reading DS18B20 sensor") == 0)
+        return 71;
+    if (__builtin_strcmp(str, "Error getting monotonic clock time") == 0)
+        return 72;
+    if (__builtin_strcmp(str, "Could not start DS18B20 reader thread") == 0)
+        return 73;
+    if (__builtin_strcmp(str, "Could not start DS18B20 reader thread (cond init)") == 0)
+        return 74;
+    if (__builtin_strcmp(str, "Could not start DS18B20 reader thread (mutex init)") == 0)
+        return 75;
+    if (__builtin_strcmp(str, "Invalid DS18B20 serial id, could not open for reading") == 0)
+        return 76;
+    if (__builtin_strcmp(str, "Invalid DS18B20 serial id, must not contain '/'") == 0)
+        return 77;
+    return 0xff;
+}
+
+const struct initial_pin_s initial_pins[] PROGMEM = {
+};
+const int initial_pins_size PROGMEM = ARRAY_SIZE(initial_pins);
+
+static const uint8_t command_parameters0[] PROGMEM = {
+    PT_uint16 };
+static const uint8_t command_parameters1[] PROGMEM = {
+    PT_uint32, PT_uint16 };
+static const uint8_t command_parameters2[] PROGMEM = {
+    PT_uint32, PT_progmem_buffer };
+static const uint8_t command_parameters3[] PROGMEM = {
+    PT_uint32, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters4[] PROGMEM = {
+    PT_uint32, PT_uint32 };
+static const uint8_t command_parameters5[] PROGMEM = {
+    PT_uint32 };
+static const uint8_t command_parameters6[] PROGMEM = {
+    PT_byte, PT_uint32, PT_byte, PT_uint16 };
+static const uint8_t command_parameters7[] PROGMEM = {
+    PT_buffer };
+static const uint8_t command_parameters8[] PROGMEM = {
+    PT_byte, PT_int32 };
+static const uint8_t command_parameters9[] PROGMEM = {
+    PT_byte, PT_byte, PT_uint32, PT_byte };
+static const uint8_t command_parameters10[] PROGMEM = {
+    PT_byte, PT_byte, PT_byte, PT_uint32 };
+static const uint8_t command_parameters11[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint16 };
+static const uint8_t command_parameters12[] PROGMEM = {
+    PT_byte, PT_buffer };
+static const uint8_t command_parameters13[] PROGMEM = {
+    PT_byte, PT_byte, PT_buffer };
+static const uint8_t command_parameters14[] PROGMEM = {
+    PT_byte, PT_byte };
+static const uint8_t command_parameters15[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters16[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_byte };
+static const uint8_t command_parameters17[] PROGMEM = {
+    PT_byte, PT_uint32, PT_buffer };
+static const uint8_t command_parameters18[] PROGMEM = {
+    PT_byte, PT_byte, PT_uint32 };
+static const uint8_t command_parameters19[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint16, PT_uint32, PT_uint16 };
+static const uint8_t command_parameters20[] PROGMEM = {
+    PT_byte, PT_uint16, PT_buffer };
+static const uint8_t command_parameters21[] PROGMEM = {
+    PT_byte, PT_uint32, PT_int32, PT_uint32 };
+static const uint8_t command_parameters22[] PROGMEM = {
+    PT_uint32, PT_byte };
+static const uint8_t command_parameters23[] PROGMEM = {
+    PT_byte };
+static const uint8_t command_parameters24[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters25[] PROGMEM = {
+    PT_byte, PT_uint32 };
+static const uint8_t command_parameters26[] PROGMEM = {
+    PT_byte, PT_uint32, PT_byte, PT_byte, PT_uint32 };
+static const uint8_t command_parameters27[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint16, PT_int16 };
+static const uint8_t command_parameters28[] PROGMEM = {
+    PT_byte, PT_byte, PT_byte, PT_byte, PT_uint32 };
+static const uint8_t command_parameters29[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_byte, PT_uint32, PT_byte, PT_byte, PT_byte };
+static const uint8_t command_parameters30[] PROGMEM = {
+    PT_byte, PT_byte, PT_byte };
+static const uint8_t command_parameters31[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_byte, PT_uint32, PT_uint16, PT_uint16, PT_byte };
+static const uint8_t command_parameters32[] PROGMEM = {
+    PT_byte, PT_uint32, PT_byte };
+static const uint8_t command_parameters33[] PROGMEM = {
+    PT_byte, PT_buffer, PT_buffer };
+static const uint8_t command_parameters34[] PROGMEM = {
+    PT_byte, PT_buffer, PT_uint32 };
+static const uint8_t command_parameters35[] PROGMEM = {
+    PT_uint32, PT_uint32, PT_uint16 };
+static const uint8_t command_parameters36[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint16, PT_uint16, PT_uint32 };
+static const uint8_t command_parameters37[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_byte, PT_byte };
+static const uint8_t command_parameters38[] PROGMEM = {
+    PT_byte, PT_buffer, PT_byte };
+static const uint8_t command_parameters39[] PROGMEM = {
+    PT_byte, PT_uint32, PT_byte, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters40[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint16, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters41[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint32, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters42[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint32, PT_uint32, PT_uint32, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters43[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint32, PT_uint32 };
+static const uint8_t command_parameters44[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_uint32, PT_uint32, PT_byte };
+static const uint8_t command_parameters45[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_byte, PT_byte, PT_byte };
+static const uint8_t command_parameters46[] PROGMEM = {
+    PT_byte, PT_byte, PT_byte, PT_uint32, PT_uint16 };
+static const uint8_t command_parameters47[] PROGMEM = {
+    PT_byte, PT_byte, PT_byte, PT_byte, PT_uint32, PT_uint16, PT_uint16, PT_uint32 };
+static const uint8_t command_parameters48[] PROGMEM = {
+    PT_byte, PT_uint32, PT_uint32, PT_int32, PT_int32 };
+
+const struct command_encoder command_encoder_92 PROGMEM = {    
+    // starting
+    .encoded_msgid=92, // msgid=92
+    .num_params=0,
+    .param_types = 0,
+    .max_size=6,
+};
+const struct command_encoder command_encoder_93 PROGMEM = {    
+    // is_shutdown static_string_id=%hu
+    .encoded_msgid=93, // msgid=93
+    .num_params=1,
+    .param_types = command_parameters0,
+    .max_size=9,
+};
+const struct command_encoder command_encoder_94 PROGMEM = {    
+    // shutdown clock=%u static_string_id=%hu
+    .encoded_msgid=94, // msgid=94
+    .num_params=2,
+    .param_types = command_parameters1,
+    .max_size=14,
+};
+const struct command_encoder command_encoder_0 PROGMEM = {    
+    // identify_response offset=%u data=%.*s
+    .encoded_msgid=0, // msgid=0
+    .num_params=2,
+    .param_types = command_parameters2,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_95 PROGMEM = {    
+    // stats count=%u sum=%u sumsq=%u
+    .encoded_msgid=95, // msgid=95
+    .num_params=3,
+    .param_types = command_parameters3,
+    .max_size=21,
+};
+const struct command_encoder command_encoder_96 PROGMEM = {    
+    // uptime high=%u clock=%u
+    .encoded_msgid=96, // msgid=-32
+    .num_params=2,
+    .param_types = command_parameters4,
+    .max_size=16,
+};
+const struct command_encoder command_encoder_97 PROGMEM = {    
+    // clock clock=%u
+    .encoded_msgid=97, // msgid=-31
+    .num_params=1,
+    .param_types = command_parameters5,
+    .max_size=11,
+};
+const struct command_encoder command_encoder_98 PROGMEM = {    
+    // config is_config=%c crc=%u is_shutdown=%c move_count=%hu
+    .encoded_msgid=98, // msgid=-30
+    .num_params=4,
+    .param_types = command_parameters6,
+    .max_size=18,
+};
+const struct command_encoder command_encoder_99 PROGMEM = {    
+    // pong data=%*s
+    .encoded_msgid=99, // msgid=-29
+    .num_params=1,
+    .param_types = command_parameters7,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_100 PROGMEM = {    
+    // debug_result val=%u
+    .encoded_msgid=100, // msgid=-28
+    .num_params=1,
+    .param_types = command_parameters5,
+    .max_size=11,
+};
+const struct command_encoder command_encoder_101 PROGMEM = {    
+    // stepper_position oid=%c pos=%i
+    .encoded_msgid=101, // msgid=-27
+    .num_params=2,
+    .param_types = command_parameters8,
+    .max_size=13,
+};
+const struct command_encoder command_encoder_102 PROGMEM = {    
+    // endstop_state oid=%c homing=%c next_clock=%u pin_value=%c
+    .encoded_msgid=102, // msgid=-26
+    .num_params=4,
+    .param_types = command_parameters9,
+    .max_size=17,
+};
+const struct command_encoder command_encoder_103 PROGMEM = {    
+    // trsync_state oid=%c can_trigger=%c trigger_reason=%c clock=%u
+    .encoded_msgid=103, // msgid=-25
+    .num_params=4,
+    .param_types = command_parameters10,
+    .max_size=17,
+};
+const struct command_encoder command_encoder_104 PROGMEM = {    
+    // analog_in_state oid=%c next_clock=%u value=%hu
+    .encoded_msgid=104, // msgid=-24
+    .num_params=3,
+    .param_types = command_parameters11,
+    .max_size=16,
+};
+const struct command_encoder command_encoder_105 PROGMEM = {    
+    // spi_transfer_response oid=%c response=%*s
+    .encoded_msgid=105, // msgid=-23
+    .num_params=2,
+    .param_types = command_parameters12,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_106 PROGMEM = {    
+    // i2c_read_response oid=%c response=%*s
+    .encoded_msgid=106, // msgid=-22
+    .num_params=2,
+    .param_types = command_parameters12,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_107 PROGMEM = {    
+    // buttons_state oid=%c ack_count=%c state=%*s
+    .encoded_msgid=107, // msgid=-21
+    .num_params=3,
+    .param_types = command_parameters13,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_108 PROGMEM = {    
+    // tmcuart_response oid=%c read=%*s
+    .encoded_msgid=108, // msgid=-20
+    .num_params=2,
+    .param_types = command_parameters12,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_109 PROGMEM = {    
+    // neopixel_result oid=%c success=%c
+    .encoded_msgid=109, // msgid=-19
+    .num_params=2,
+    .param_types = command_parameters14,
+    .max_size=10,
+};
+const struct command_encoder command_encoder_110 PROGMEM = {    
+    // counter_state oid=%c next_clock=%u count=%u count_clock=%u
+    .encoded_msgid=110, // msgid=-18
+    .num_params=4,
+    .param_types = command_parameters15,
+    .max_size=23,
+};
+const struct command_encoder command_encoder_111 PROGMEM = {    
+    // thermocouple_result oid=%c next_clock=%u value=%u fault=%c
+    .encoded_msgid=111, // msgid=-17
+    .num_params=4,
+    .param_types = command_parameters16,
+    .max_size=20,
+};
+const struct command_encoder command_encoder_112 PROGMEM = {    
+    // spi_angle_transfer_response oid=%c clock=%u response=%*s
+    .encoded_msgid=112, // msgid=-16
+    .num_params=3,
+    .param_types = command_parameters17,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_113 PROGMEM = {    
+    // ldc1612_home_state oid=%c homing=%c trigger_clock=%u
+    .encoded_msgid=113, // msgid=-15
+    .num_params=3,
+    .param_types = command_parameters18,
+    .max_size=15,
+};
+const struct command_encoder command_encoder_114 PROGMEM = {    
+    // sensor_bulk_status oid=%c clock=%u query_ticks=%u next_sequence=%hu buffered=%u possible_overflows=%hu
+    .encoded_msgid=114, // msgid=-14
+    .num_params=6,
+    .param_types = command_parameters19,
+    .max_size=29,
+};
+const struct command_encoder command_encoder_115 PROGMEM = {    
+    // sensor_bulk_data oid=%c sequence=%hu data=%*s
+    .encoded_msgid=115, // msgid=-13
+    .num_params=3,
+    .param_types = command_parameters20,
+    .max_size=64,
+};
+const struct command_encoder command_encoder_116 PROGMEM = {    
+    // ds18b20_result oid=%c next_clock=%u value=%i fault=%u
+    .encoded_msgid=116, // msgid=-12
+    .num_params=4,
+    .param_types = command_parameters21,
+    .max_size=23,
+};
+
+const __always_inline struct command_encoder *
+ctr_lookup_encoder(const char *str)
+{
+    if (__builtin_strcmp(str, "starting") == 0)
+        return &command_encoder_92;
+    if (__builtin_strcmp(str, "is_shutdown static_string_id=%hu") == 0)
+        return &command_encoder_93;
+    if (__builtin_strcmp(str, "shutdown clock=%u static_string_id=%hu") == 0)
+        return &command_encoder_94;
+    if (__builtin_strcmp(str, "identify_response offset=%u data=%.*s") == 0)
+        return &command_encoder_0;
+    if (__builtin_strcmp(str, "stats count=%u sum=%u sumsq=%u") == 0)
+        return &command_encoder_95;
+    if (__builtin_strcmp(str, "uptime high=%u clock=%u") == 0)
+        return &command_encoder_96;
+    if (__builtin_strcmp(str, "clock clock=%u") == 0)
+        return &command_encoder_97;
+    if (__builtin_strcmp(str, "config is_config=%c crc=%u is_shutdown=%c move_count=%hu") == 0)
+        return &command_encoder_98;
+    if (__builtin_strcmp(str, "pong data=%*s") == 0)
+        return &command_encoder_99;
+    if (__builtin_strcmp(str, "debug_result val=%u") == 0)
+        return &command_encoder_100;
+    if (__builtin_strcmp(str, "stepper_position oid=%c pos=%i") == 0)
+        return &command_encoder_101;
+    if (__builtin_strcmp(str, "endstop_state oid=%c homing=%c next_clock=%u pin_value=%c") == 0)
+        return &command_encoder_102;
+    if (__builtin_strcmp(str, "trsync_state oid=%c can_trigger=%c trigger_reason=%c clock=%u") == 0)
+        return &command_encoder_103;
+    if (__builtin_strcmp(str, "analog_in_state oid=%c next_clock=%u value=%hu") == 0)
+        return &command_encoder_104;
+    if (__builtin_strcmp(str, "spi_transfer_response oid=%c response=%*s") == 0)
+        return &command_encoder_105;
+    if (__builtin_strcmp(str, "i2c_read_response oid=%c response=%*s") == 0)
+        return &command_encoder_106;
+    if (__builtin_strcmp(str, "buttons_state oid=%c ack_count=%c state=%*s") == 0)
+        return &command_encoder_107;
+    if (__builtin_strcmp(str, "tmcuart_response oid=%c read=%*s") == 0)
+        return &command_encoder_108;
+    if (__builtin_strcmp(str, "neopixel_result oid=%c success=%c") == 0)
+        return &command_encoder_109;
+    if (__builtin_strcmp(str, "counter_state oid=%c next_clock=%u count=%u count_clock=%u") == 0)
+        return &command_encoder_110;
+    if (__builtin_strcmp(str, "thermocouple_result oid=%c next_clock=%u value=%u fault=%c") == 0)
+        return &command_encoder_111;
+    if (__builtin_strcmp(str, "spi_angle_transfer_response oid=%c clock=%u response=%*s") == 0)
+        return &command_encoder_112;
+    if (__builtin_strcmp(str, "ldc1612_home_state oid=%c homing=%c trigger_clock=%u") == 0)
+        return &command_encoder_113;
+    if (__builtin_strcmp(str, "sensor_bulk_status oid=%c clock=%u query_ticks=%u next_sequence=%hu buffered=%u possible_overflows=%hu") == 0)
+        return &command_encoder_114;
+    if (__builtin_strcmp(str, "sensor_bulk_data oid=%c sequence=%hu data=%*s") == 0)
+        return &command_encoder_115;
+    if (__builtin_strcmp(str, "ds18b20_result oid=%c next_clock=%u value=%i fault=%u") == 0)
+        return &command_encoder_116;
+    return NULL;
+}
+
+const __always_inline struct command_encoder *
+ctr_lookup_output(const char *str)
+{
+    
+    return NULL;
+}
+
+extern void command_allocate_oids(uint32_t*);
+extern void command_buttons_ack(uint32_t*);
+extern void command_buttons_add(uint32_t*);
+extern void command_buttons_query(uint32_t*);
+extern void command_clear_shutdown(uint32_t*);
+extern void command_config_adxl345(uint32_t*);
+extern void command_config_analog_in(uint32_t*);
+extern void command_config_buttons(uint32_t*);
+extern void command_config_counter(uint32_t*);
+extern void command_config_digital_out(uint32_t*);
+extern void command_config_ds18b20(uint32_t*);
+extern void command_config_endstop(uint32_t*);
+extern void command_config_hd44780(uint32_t*);
+extern void command_config_i2c(uint32_t*);
+extern void command_config_ldc1612(uint32_t*);
+extern void command_config_ldc1612_with_intb(uint32_t*);
+extern void command_config_lis2dw(uint32_t*);
+extern void command_config_mpu9250(uint32_t*);
+extern void command_config_neopixel(uint32_t*);
+extern void command_config_pca9685(uint32_t*);
+extern void command_config_pwm_out(uint32_t*);
+extern void command_config_reset(uint32_t*);
+extern void command_config_spi(uint32_t*);
+extern void command_config_spi_angle(uint32_t*);
+extern void command_config_spi_shutdown(uint32_t*);
+extern void command_config_spi_without_cs(uint32_t*);
+extern void command_config_st7920(uint32_t*);
+extern void command_config_stepper(uint32_t*);
+extern void command_config_thermocouple(uint32_t*);
+extern void command_config_tmcuart(uint32_t*);
+extern void command_config_trsync(uint32_t*);
+extern void command_debug_nop(uint32_t*);
+extern void command_debug_ping(uint32_t*);
+extern void command_debug_read(uint32_t*);
+extern void command_debug_write(uint32_t*);
+extern void command_emergency_stop(uint32_t*);
+extern void command_endstop_home(uint32_t*);
+extern void command_endstop_query_state(uint32_t*);
+extern void command_finalize_config(uint32_t*);
+extern void command_get_clock(uint32_t*);
+extern void command_get_config(uint32_t*);
+extern void command_get_uptime(uint32_t*);
+extern void command_hd44780_send_cmds(uint32_t*);
+extern void command_hd44780_send_data(uint32_t*);
+extern void command_i2c_modify_bits(uint32_t*);
+extern void command_i2c_read(uint32_t*);
+extern void command_i2c_set_bus(uint32_t*);
+extern void command_i2c_set_software_bus(uint32_t*);
+extern void command_i2c_write(uint32_t*);
+extern void command_identify(uint32_t*);
+extern void command_ldc1612_setup_home(uint32_t*);
+extern void command_neopixel_send(uint32_t*);
+extern void command_neopixel_update(uint32_t*);
+extern void command_query_adxl345(uint32_t*);
+extern void command_query_adxl345_status(uint32_t*);
+extern void command_query_analog_in(uint32_t*);
+extern void command_query_counter(uint32_t*);
+extern void command_query_ds18b20(uint32_t*);
+extern void command_query_ldc1612(uint32_t*);
+extern void command_query_ldc1612_home_state(uint32_t*);
+extern void command_query_lis2dw(uint32_t*);
+extern void command_query_lis2dw_status(uint32_t*);
+extern void command_query_mpu9250(uint32_t*);
+extern void command_query_mpu9250_status(uint32_t*);
+extern void command_query_spi_angle(uint32_t*);
+extern void command_query_status_ldc1612(uint32_t*);
+extern void command_query_thermocouple(uint32_t*);
+extern void command_queue_digital_out(uint32_t*);
+extern void command_queue_pca9685_out(uint32_t*);
+extern void command_queue_pwm_out(uint32_t*);
+extern void command_queue_step(uint32_t*);
+extern void command_reset_step_clock(uint32_t*);
+extern void command_set_digital_out(uint32_t*);
+extern void command_set_digital_out_pwm_cycle(uint32_t*);
+extern void command_set_next_step_dir(uint32_t*);
+extern void command_set_pca9685_out(uint32_t*);
+extern void command_set_pwm_out(uint32_t*);
+extern void command_spi_angle_transfer(uint32_t*);
+extern void command_spi_send(uint32_t*);
+extern void command_spi_set_bus(uint32_t*);
+extern void command_spi_set_software_bus(uint32_t*);
+extern void command_spi_transfer(uint32_t*);
+extern void command_st7920_send_cmds(uint32_t*);
+extern void command_st7920_send_data(uint32_t*);
+extern void command_stepper_get_position(uint32_t*);
+extern void command_stepper_stop_on_trigger(uint32_t*);
+extern void command_tmcuart_send(uint32_t*);
+extern void command_trsync_set_timeout(uint32_t*);
+extern void command_trsync_start(uint32_t*);
+extern void command_trsync_trigger(uint32_t*);
+extern void command_update_digital_out(uint32_t*);
+
+const struct command_parser command_index[] PROGMEM = {
+{
+}, {
+    // identify offset=%u count=%c
+    .encoded_msgid=1, // msgid=1
+    .num_params=2,
+    .param_types = command_parameters22,
+    .num_args=2,
+    .flags=0x01,
+    .func=command_identify
+}, {
+    // clear_shutdown
+    .encoded_msgid=2, // msgid=2
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_clear_shutdown
+}, {
+    // emergency_stop
+    .encoded_msgid=3, // msgid=3
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_emergency_stop
+}, {
+    // get_uptime
+    .encoded_msgid=4, // msgid=4
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_get_uptime
+}, {
+    // get_clock
+    .encoded_msgid=5, // msgid=5
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_get_clock
+}, {
+    // finalize_config crc=%u
+    .encoded_msgid=6, // msgid=6
+    .num_params=1,
+    .param_types = command_parameters5,
+    .num_args=1,
+    .flags=0,
+    .func=command_finalize_config
+}, {
+    // get_config
+    .encoded_msgid=7, // msgid=7
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_get_config
+}, {
+    // allocate_oids count=%c
+    .encoded_msgid=8, // msgid=8
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_allocate_oids
+}, {
+    // debug_nop
+    .encoded_msgid=9, // msgid=9
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_debug_nop
+}, {
+    // debug_ping data=%*s
+    .encoded_msgid=10, // msgid=10
+    .num_params=1,
+    .param_types = command_parameters7,
+    .num_args=2,
+    .flags=0x01,
+    .func=command_debug_ping
+}, {
+    // debug_write order=%c addr=%u val=%u
+    .encoded_msgid=11, // msgid=11
+    .num_params=3,
+    .param_types = command_parameters24,
+    .num_args=3,
+    .flags=0x01,
+    .func=command_debug_write
+}, {
+    // debug_read order=%c addr=%u
+    .encoded_msgid=12, // msgid=12
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0x01,
+    .func=command_debug_read
+}, {
+    // set_digital_out pin=%u value=%c
+    .encoded_msgid=13, // msgid=13
+    .num_params=2,
+    .param_types = command_parameters22,
+    .num_args=2,
+    .flags=0,
+    .func=command_set_digital_out
+}, {
+    // update_digital_out oid=%c value=%c
+    .encoded_msgid=14, // msgid=14
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_update_digital_out
+}, {
+    // queue_digital_out oid=%c clock=%u on_ticks=%u
+    .encoded_msgid=15, // msgid=15
+    .num_params=3,
+    .param_types = command_parameters24,
+    .num_args=3,
+    .flags=0,
+    .func=command_queue_digital_out
+}, {
+    // set_digital_out_pwm_cycle oid=%c cycle_ticks=%u
+    .encoded_msgid=16, // msgid=16
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_set_digital_out_pwm_cycle
+}, {
+    // config_digital_out oid=%c pin=%u value=%c default_value=%c max_duration=%u
+    .encoded_msgid=17, // msgid=17
+    .num_params=5,
+    .param_types = command_parameters26,
+    .num_args=5,
+    .flags=0,
+    .func=command_config_digital_out
+}, {
+    // stepper_stop_on_trigger oid=%c trsync_oid=%c
+    .encoded_msgid=18, // msgid=18
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_stepper_stop_on_trigger
+}, {
+    // stepper_get_position oid=%c
+    .encoded_msgid=19, // msgid=19
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_stepper_get_position
+}, {
+    // reset_step_clock oid=%c clock=%u
+    .encoded_msgid=20, // msgid=20
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_reset_step_clock
+}, {
+    // set_next_step_dir oid=%c dir=%c
+    .encoded_msgid=21, // msgid=21
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_set_next_step_dir
+}, {
+    // queue_step oid=%c interval=%u count=%hu add=%hi
+    .encoded_msgid=22, // msgid=22
+    .num_params=4,
+    .param_types = command_parameters27,
+    .num_args=4,
+    .flags=0,
+    .func=command_queue_step
+}, {
+    // config_stepper oid=%c step_pin=%c dir_pin=%c invert_step=%c step_pulse_ticks=%u
+    .encoded_msgid=23, // msgid=23
+    .num_params=5,
+    .param_types = command_parameters28,
+    .num_args=5,
+    .flags=0,
+    .func=command_config_stepper
+}, {
+    // endstop_query_state oid=%c
+    .encoded_msgid=24, // msgid=24
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_endstop_query_state
+}, {
+    // endstop_home oid=%c clock=%u sample_ticks=%u sample_count=%c rest_ticks=%u pin_value=%c trsync_oid=%c trigger_reason=%c
+    .encoded_msgid=25, // msgid=25
+    .num_params=8,
+    .param_types = command_parameters29,
+    .num_args=8,
+    .flags=0,
+    .func=command_endstop_home
+}, {
+    // config_endstop oid=%c pin=%c pull_up=%c
+    .encoded_msgid=26, // msgid=26
+    .num_params=3,
+    .param_types = command_parameters30,
+    .num_args=3,
+    .flags=0,
+    .func=command_config_endstop
+}, {
+    // trsync_trigger oid=%c reason=%c
+    .encoded_msgid=27, // msgid=27
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_trsync_trigger
+}, {
+    // trsync_set_timeout oid=%c clock=%u
+    .encoded_msgid=28, // msgid=28
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_trsync_set_timeout
+}, {
+    // trsync_start oid=%c report_clock=%u report_ticks=%u expire_reason=%c
+    .encoded_msgid=29, // msgid=29
+    .num_params=4,
+    .param_types = command_parameters16,
+    .num_args=4,
+    .flags=0,
+    .func=command_trsync_start
+}, {
+    // config_trsync oid=%c
+    .encoded_msgid=30, // msgid=30
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_config_trsync
+}, {
+    // query_analog_in oid=%c clock=%u sample_ticks=%u sample_count=%c rest_ticks=%u min_value=%hu max_value=%hu range_check_count=%c
+    .encoded_msgid=31, // msgid=31
+    .num_params=8,
+    .param_types = command_parameters31,
+    .num_args=8,
+    .flags=0,
+    .func=command_query_analog_in
+}, {
+    // config_analog_in oid=%c pin=%u
+    .encoded_msgid=32, // msgid=32
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_config_analog_in
+}, {
+    // config_spi_shutdown oid=%c spi_oid=%c shutdown_msg=%*s
+    .encoded_msgid=33, // msgid=33
+    .num_params=3,
+    .param_types = command_parameters13,
+    .num_args=4,
+    .flags=0,
+    .func=command_config_spi_shutdown
+}, {
+    // spi_send oid=%c data=%*s
+    .encoded_msgid=34, // msgid=34
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_spi_send
+}, {
+    // spi_transfer oid=%c data=%*s
+    .encoded_msgid=35, // msgid=35
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_spi_transfer
+}, {
+    // spi_set_bus oid=%c spi_bus=%u mode=%u rate=%u
+    .encoded_msgid=36, // msgid=36
+    .num_params=4,
+    .param_types = command_parameters15,
+    .num_args=4,
+    .flags=0,
+    .func=command_spi_set_bus
+}, {
+    // config_spi_without_cs oid=%c
+    .encoded_msgid=37, // msgid=37
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_config_spi_without_cs
+}, {
+    // config_spi oid=%c pin=%u cs_active_high=%c
+    .encoded_msgid=38, // msgid=38
+    .num_params=3,
+    .param_types = command_parameters32,
+    .num_args=3,
+    .flags=0,
+    .func=command_config_spi
+}, {
+    // i2c_modify_bits oid=%c reg=%*s clear_set_bits=%*s
+    .encoded_msgid=39, // msgid=39
+    .num_params=3,
+    .param_types = command_parameters33,
+    .num_args=5,
+    .flags=0,
+    .func=command_i2c_modify_bits
+}, {
+    // i2c_read oid=%c reg=%*s read_len=%u
+    .encoded_msgid=40, // msgid=40
+    .num_params=3,
+    .param_types = command_parameters34,
+    .num_args=4,
+    .flags=0,
+    .func=command_i2c_read
+}, {
+    // i2c_write oid=%c data=%*s
+    .encoded_msgid=41, // msgid=41
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_i2c_write
+}, {
+    // i2c_set_bus oid=%c i2c_bus=%u rate=%u address=%u
+    .encoded_msgid=42, // msgid=42
+    .num_params=4,
+    .param_types = command_parameters15,
+    .num_args=4,
+    .flags=0,
+    .func=command_i2c_set_bus
+}, {
+    // config_i2c oid=%c
+    .encoded_msgid=43, // msgid=43
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_config_i2c
+}, {
+    // set_pwm_out pin=%u cycle_ticks=%u value=%hu
+    .encoded_msgid=44, // msgid=44
+    .num_params=3,
+    .param_types = command_parameters35,
+    .num_args=3,
+    .flags=0,
+    .func=command_set_pwm_out
+}, {
+    // queue_pwm_out oid=%c clock=%u value=%hu
+    .encoded_msgid=45, // msgid=45
+    .num_params=3,
+    .param_types = command_parameters11,
+    .num_args=3,
+    .flags=0,
+    .func=command_queue_pwm_out
+}, {
+    // config_pwm_out oid=%c pin=%u cycle_ticks=%u value=%hu default_value=%hu max_duration=%u
+    .encoded_msgid=46, // msgid=46
+    .num_params=6,
+    .param_types = command_parameters36,
+    .num_args=6,
+    .flags=0,
+    .func=command_config_pwm_out
+}, {
+    // buttons_ack oid=%c count=%c
+    .encoded_msgid=47, // msgid=47
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_buttons_ack
+}, {
+    // buttons_query oid=%c clock=%u rest_ticks=%u retransmit_count=%c invert=%c
+    .encoded_msgid=48, // msgid=48
+    .num_params=5,
+    .param_types = command_parameters37,
+    .num_args=5,
+    .flags=0,
+    .func=command_buttons_query
+}, {
+    // buttons_add oid=%c pos=%c pin=%u pull_up=%c
+    .encoded_msgid=49, // msgid=49
+    .num_params=4,
+    .param_types = command_parameters9,
+    .num_args=4,
+    .flags=0,
+    .func=command_buttons_add
+}, {
+    // config_buttons oid=%c button_count=%c
+    .encoded_msgid=50, // msgid=50
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_config_buttons
+}, {
+    // tmcuart_send oid=%c write=%*s read=%c
+    .encoded_msgid=51, // msgid=51
+    .num_params=3,
+    .param_types = command_parameters38,
+    .num_args=4,
+    .flags=0,
+    .func=command_tmcuart_send
+}, {
+    // config_tmcuart oid=%c rx_pin=%u pull_up=%c tx_pin=%u bit_time=%u
+    .encoded_msgid=52, // msgid=52
+    .num_params=5,
+    .param_types = command_parameters39,
+    .num_args=5,
+    .flags=0,
+    .func=command_config_tmcuart
+}, {
+    // neopixel_send oid=%c
+    .encoded_msgid=53, // msgid=53
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_neopixel_send
+}, {
+    // neopixel_update oid=%c pos=%hu data=%*s
+    .encoded_msgid=54, // msgid=54
+    .num_params=3,
+    .param_types = command_parameters20,
+    .num_args=4,
+    .flags=0,
+    .func=command_neopixel_update
+}, {
+    // config_neopixel oid=%c pin=%u data_size=%hu bit_max_ticks=%u reset_min_ticks=%u
+    .encoded_msgid=55, // msgid=55
+    .num_params=5,
+    .param_types = command_parameters40,
+    .num_args=5,
+    .flags=0,
+    .func=command_config_neopixel
+}, {
+    // query_counter oid=%c clock=%u poll_ticks=%u sample_ticks=%u
+    .encoded_msgid=56, // msgid=56
+    .num_params=4,
+    .param_types = command_parameters15,
+    .num_args=4,
+    .flags=0,
+    .func=command_query_counter
+}, {
+    // config_counter oid=%c pin=%u pull_up=%c
+    .encoded_msgid=57, // msgid=57
+    .num_params=3,
+    .param_types = command_parameters32,
+    .num_args=3,
+    .flags=0,
+    .func=command_config_counter
+}, {
+    // st7920_send_data oid=%c data=%*s
+    .encoded_msgid=58, // msgid=58
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_st7920_send_data
+}, {
+    // st7920_send_cmds oid=%c cmds=%*s
+    .encoded_msgid=59, // msgid=59
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_st7920_send_cmds
+}, {
+    // config_st7920 oid=%c cs_pin=%u sclk_pin=%u sid_pin=%u sync_delay_ticks=%u cmd_delay_ticks=%u
+    .encoded_msgid=60, // msgid=60
+    .num_params=6,
+    .param_types = command_parameters41,
+    .num_args=6,
+    .flags=0,
+    .func=command_config_st7920
+}, {
+    // hd44780_send_data oid=%c data=%*s
+    .encoded_msgid=61, // msgid=61
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_hd44780_send_data
+}, {
+    // hd44780_send_cmds oid=%c cmds=%*s
+    .encoded_msgid=62, // msgid=62
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_hd44780_send_cmds
+}, {
+    // config_hd44780 oid=%c rs_pin=%u e_pin=%u d4_pin=%u d5_pin=%u d6_pin=%u d7_pin=%u delay_ticks=%u
+    .encoded_msgid=63, // msgid=63
+    .num_params=8,
+    .param_types = command_parameters42,
+    .num_args=8,
+    .flags=0,
+    .func=command_config_hd44780
+}, {
+    // spi_set_software_bus oid=%c miso_pin=%u mosi_pin=%u sclk_pin=%u mode=%u rate=%u
+    .encoded_msgid=64, // msgid=64
+    .num_params=6,
+    .param_types = command_parameters41,
+    .num_args=6,
+    .flags=0,
+    .func=command_spi_set_software_bus
+}, {
+    // i2c_set_software_bus oid=%c scl_pin=%u sda_pin=%u rate=%u address=%u
+    .encoded_msgid=65, // msgid=65
+    .num_params=5,
+    .param_types = command_parameters43,
+    .num_args=5,
+    .flags=0,
+    .func=command_i2c_set_software_bus
+}, {
+    // query_thermocouple oid=%c clock=%u rest_ticks=%u min_value=%u max_value=%u max_invalid_count=%c
+    .encoded_msgid=66, // msgid=66
+    .num_params=6,
+    .param_types = command_parameters44,
+    .num_args=6,
+    .flags=0,
+    .func=command_query_thermocouple
+}, {
+    // config_thermocouple oid=%c spi_oid=%c thermocouple_type=%c
+    .encoded_msgid=67, // msgid=67
+    .num_params=3,
+    .param_types = command_parameters30,
+    .num_args=3,
+    .flags=0,
+    .func=command_config_thermocouple
+}, {
+    // query_adxl345_status oid=%c
+    .encoded_msgid=68, // msgid=68
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_query_adxl345_status
+}, {
+    // query_adxl345 oid=%c rest_ticks=%u
+    .encoded_msgid=69, // msgid=69
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_query_adxl345
+}, {
+    // config_adxl345 oid=%c spi_oid=%c
+    .encoded_msgid=70, // msgid=70
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_config_adxl345
+}, {
+    // spi_angle_transfer oid=%c data=%*s
+    .encoded_msgid=71, // msgid=71
+    .num_params=2,
+    .param_types = command_parameters12,
+    .num_args=3,
+    .flags=0,
+    .func=command_spi_angle_transfer
+}, {
+    // query_spi_angle oid=%c clock=%u rest_ticks=%u time_shift=%c
+    .encoded_msgid=72, // msgid=72
+    .num_params=4,
+    .param_types = command_parameters16,
+    .num_args=4,
+    .flags=0,
+    .func=command_query_spi_angle
+}, {
+    // config_spi_angle oid=%c spi_oid=%c spi_angle_type=%c
+    .encoded_msgid=73, // msgid=73
+    .num_params=3,
+    .param_types = command_parameters30,
+    .num_args=3,
+    .flags=0,
+    .func=command_config_spi_angle
+}, {
+    // query_mpu9250_status oid=%c
+    .encoded_msgid=74, // msgid=74
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_query_mpu9250_status
+}, {
+    // query_mpu9250 oid=%c rest_ticks=%u
+    .encoded_msgid=75, // msgid=75
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_query_mpu9250
+}, {
+    // config_mpu9250 oid=%c i2c_oid=%c
+    .encoded_msgid=76, // msgid=76
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_config_mpu9250
+}, {
+    // query_lis2dw_status oid=%c
+    .encoded_msgid=77, // msgid=77
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_query_lis2dw_status
+}, {
+    // query_lis2dw oid=%c rest_ticks=%u
+    .encoded_msgid=78, // msgid=78
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_query_lis2dw
+}, {
+    // config_lis2dw oid=%c spi_oid=%c
+    .encoded_msgid=79, // msgid=79
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_config_lis2dw
+}, {
+    // query_status_ldc1612 oid=%c
+    .encoded_msgid=80, // msgid=80
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_query_status_ldc1612
+}, {
+    // query_ldc1612 oid=%c rest_ticks=%u
+    .encoded_msgid=81, // msgid=81
+    .num_params=2,
+    .param_types = command_parameters25,
+    .num_args=2,
+    .flags=0,
+    .func=command_query_ldc1612
+}, {
+    // query_ldc1612_home_state oid=%c
+    .encoded_msgid=82, // msgid=82
+    .num_params=1,
+    .param_types = command_parameters23,
+    .num_args=1,
+    .flags=0,
+    .func=command_query_ldc1612_home_state
+}, {
+    // ldc1612_setup_home oid=%c clock=%u threshold=%u trsync_oid=%c trigger_reason=%c error_reason=%c
+    .encoded_msgid=83, // msgid=83
+    .num_params=6,
+    .param_types = command_parameters45,
+    .num_args=6,
+    .flags=0,
+    .func=command_ldc1612_setup_home
+}, {
+    // config_ldc1612_with_intb oid=%c i2c_oid=%c intb_pin=%c
+    .encoded_msgid=84, // msgid=84
+    .num_params=3,
+    .param_types = command_parameters30,
+    .num_args=3,
+    .flags=0,
+    .func=command_config_ldc1612_with_intb
+}, {
+    // config_ldc1612 oid=%c i2c_oid=%c
+    .encoded_msgid=85, // msgid=85
+    .num_params=2,
+    .param_types = command_parameters14,
+    .num_args=2,
+    .flags=0,
+    .func=command_config_ldc1612
+}, {
+    // config_reset
+    .encoded_msgid=86, // msgid=86
+    .num_params=0,
+    .param_types = 0,
+    .num_args=0,
+    .flags=0x01,
+    .func=command_config_reset
+}, {
+    // set_pca9685_out bus=%c addr=%c channel=%c cycle_ticks=%u value=%hu
+    .encoded_msgid=87, // msgid=87
+    .num_params=5,
+    .param_types = command_parameters46,
+    .num_args=5,
+    .flags=0,
+    .func=command_set_pca9685_out
+}, {
+    // queue_pca9685_out oid=%c clock=%u value=%hu
+    .encoded_msgid=88, // msgid=88
+    .num_params=3,
+    .param_types = command_parameters11,
+    .num_args=3,
+    .flags=0,
+    .func=command_queue_pca9685_out
+}, {
+    // config_pca9685 oid=%c bus=%c addr=%c channel=%c cycle_ticks=%u value=%hu default_value=%hu max_duration=%u
+    .encoded_msgid=89, // msgid=89
+    .num_params=8,
+    .param_types = command_parameters47,
+    .num_args=8,
+    .flags=0,
+    .func=command_config_pca9685
+}, {
+    // query_ds18b20 oid=%c clock=%u rest_ticks=%u min_value=%i max_value=%i
+    .encoded_msgid=90, // msgid=90
+    .num_params=5,
+    .param_types = command_parameters48,
+    .num_args=5,
+    .flags=0,
+    .func=command_query_ds18b20
+}, {
+    // config_ds18b20 oid=%c serial=%*s max_error_count=%c
+    .encoded_msgid=91, // msgid=91
+    .num_params=3,
+    .param_types = command_parameters38,
+    .num_args=4,
+    .flags=0,
+    .func=command_config_ds18b20
+},
+};
+
+const uint16_t command_index_size PROGMEM = ARRAY_SIZE(command_index);
+
+// version: ceb57d2
+// build_versions: gcc: (Debian 12.2.0-14+deb12u1) 12.2.0 binutils: (GNU Binutils for Debian) 2.40
+
+const uint8_t command_identify_data[] PROGMEM = {
+    0x78, 0xda, 0xa5, 0x1a, 0x6b, 0x6f, 0xe4, 0xb6,
+    0xf1, 0xaf, 0xb0, 0x0b, 0x04, 0xc9, 0xa5, 0xf6,
+    0x65, 0xf5, 0x5c, 0xad, 0x81, 0x7c, 0xf0, 0xf9,
+    0x2e, 0x87, 0x20, 0x71, 0x72, 0x89, 0xef, 0xd0,
+    0x02, 0x45, 0x20, 0xc8, 0x12, 0x77, 0x97, 0xb0,
+    0x5e, 0x11, 0x25, 0x3f, 0x1a, 0xdc, 0x7f, 0xef,
+    0x0c, 0x87, 0x2f, 0x69, 0xd7, 0x4e, 0xda, 0xfa,
+    0xcb, 0x8a, 0x9c, 0x19, 0x72, 0x38, 0x9c, 0x37,
+    0xfd, 0xc7, 0xaa, 0xe8, 0xfb, 0xd5, 0xc5, 0xea,
+    0x87, 0x5a, 0xf4, 0x3d, 0x1f, 0x56, 0x67, 0xab,
+    0xdb, 0x49, 0xd4, 0x55, 0x7e, 0xcf, 0x07, 0x29,
+    0xba, 0x56, 0x02, 0x68, 0x5f, 0x96, 0x17, 0xec,
+    0xab, 0xb7, 0xfc, 0x56, 0x14, 0x2d, 0x0b, 0xc2,
+    0xd7, 0xe1, 0xeb, 0xf5, 0x79, 0x10, 0xff, 0xbd,
+    0xe2, 0xb7, 0x41, 0x38, 0x05, 0xaf, 0xf4, 0x14,
+    0xbb, 0x15, 0xed, 0x34, 0x8a, 0x5a, 0x02, 0xee,
+    0xfb, 0x9f, 0x3e, 0xb1, 0x37, 0x7a, 0xc8, 0x76,
+    0xdd, 0xc0, 0x88, 0xf8, 0x15, 0x0b, 0x5f, 0xc7,
+    0x6b, 0xd8, 0xa2, 0xec, 0x9a, 0xa6, 0x68, 0x2b,
+    0x58, 0xfc, 0x8f, 0x55, 0x51, 0xd7, 0x5d, 0x59,
+    0x8c, 0x3c, 0xef, 0x44, 0x25, 0x59, 0xd9, 0x4d,
+    0xed, 0xf8, 0xed, 0x17, 0xe5, 0xea, 0x22, 0x43,
+    0x4e, 0xc6, 0x11, 0x58, 0xc8, 0x8b, 0xf2, 0x8e,
+    0x01, 0x14, 0xa6, 0x3d, 0x78, 0xbc, 0xf1, 0x10,
+    0xaa, 0xca, 0x20, 0xf4, 0x9d, 0x54, 0x3f, 0xa2,
+    0xfd, 0xf6, 0x8b, 0x89, 0xf5, 0x53, 0x5d, 0xe7,
+    0x53, 0x4f, 0x04, 0x5b, 0x47, 0xf0, 0xfb, 0xc4,
+    0x87, 0x27, 0xbb, 0x26, 0x30, 0x70, 0x87, 0xd8,
+    0x03, 0x97, 0x63, 0x3e, 0x8a, 0xf2, 0x4e, 0xd2,
+    0x68, 0x1c, 0x8a, 0x56, 0x36, 0x62, 0xcc, 0xcd,
+    0xae, 0x4c, 0xb4, 0x20, 0x17, 0xbd, 0x3f, 0x30,
+    0x58, 0xd6, 0xbc, 0x18, 0x72, 0x79, 0x98, 0xc6,
+    0xaa, 0x7b, 0x68, 0x57, 0x17, 0x21, 0x1e, 0xad,
+    0xdd, 0x89, 0x3d, 0x70, 0xf4, 0x58, 0x47, 0x71,
+    0x62, 0xb6, 0x90, 0xbd, 0xc8, 0xe9, 0x73, 0x75,
+    0xb1, 0x59, 0x3b, 0xac, 0xb6, 0xa8, 0xbb, 0x7d,
+    0x2e, 0x5a, 0xcb, 0xbd, 0x62, 0x7b, 0x75, 0x11,
+    0xb9, 0x95, 0x34, 0xcb, 0x06, 0x83, 0x86, 0xb9,
+    0x93, 0x43, 0xe2, 0x96, 0x53, 0x93, 0x7c, 0x98,
+    0x2f, 0x36, 0x93, 0x41, 0xb2, 0xb1, 0xc8, 0x95,
+    0xd8, 0x8b, 0xb1, 0xa8, 0xf3, 0x6e, 0x1a, 0x17,
+    0x04, 0xf7, 0x45, 0x3d, 0x71, 0x1c, 0x57, 0x7c,
+    0x57, 0x4c, 0xf5, 0x98, 0xdb, 0x89, 0xa6, 0x78,
+    0xcc, 0xab, 0x69, 0x28, 0x46, 0xd0, 0x0c, 0xc5,
+    0x67, 0xe0, 0xad, 0x27, 0x83, 0xec, 0x36, 0x5c,
+    0xdb, 0x13, 0xf3, 0x41, 0x14, 0xf5, 0xb7, 0x5f,
+    0x7c, 0x2d, 0x15, 0x15, 0x1f, 0x86, 0x6e, 0xf0,
+    0xb8, 0xde, 0x06, 0x96, 0x90, 0x83, 0x22, 0x8c,
+    0x5d, 0x3f, 0x63, 0xa2, 0x9c, 0x71, 0x1d, 0xa6,
+    0x16, 0xf9, 0x50, 0xc5, 0xf1, 0x26, 0xb3, 0xbb,
+    0x0c, 0x32, 0xd7, 0x4c, 0x73, 0xf3, 0x51, 0xc5,
+    0xf6, 0x2b, 0xb1, 0x5f, 0xa9, 0xfd, 0xda, 0xd8,
+    0x2f, 0x5e, 0x17, 0x4f, 0xf6, 0xb6, 0x57, 0x17,
+    0x69, 0x64, 0x37, 0x11, 0x61, 0xc9, 0xcc, 0x6d,
+    0xc5, 0x6e, 0xba, 0xae, 0xca, 0x20, 0x0d, 0x42,
+    0xb3, 0x37, 0x60, 0xd9, 0x3b, 0xcd, 0x92, 0x25,
+    0x56, 0xfe, 0x20, 0xc6, 0x03, 0xdc, 0xec, 0x78,
+    0x7b, 0x8c, 0xcf, 0x70, 0x9a, 0xf8, 0x40, 0xda,
+    0xd8, 0xd1, 0x0a, 0x19, 0x56, 0x0f, 0x27, 0x95,
+    0x66, 0x6b, 0x91, 0x9a, 0x7e, 0xda, 0x86, 0xc9,
+    0xfa, 0x14, 0x1b, 0x1b, 0x27, 0xa8, 0x96, 0x77,
+    0xbd, 0x78, 0xe4, 0xf5, 0xe2, 0x6e, 0xab, 0x62,
+    0x2c, 0x72, 0x29, 0xfe, 0x0d, 0xd7, 0x79, 0x98,
+    0xc0, 0x64, 0xc7, 0x1c, 0x6f, 0xc7, 0xd3, 0x79,
+    0xc9, 0x61, 0x4a, 0xb4, 0x9e, 0x60, 0x12, 0x77,
+    0xb6, 0xbe, 0x2c, 0xb6, 0x69, 0x96, 0x38, 0x5d,
+    0x54, 0xb6, 0x06, 0xd6, 0x37, 0x28, 0x3b, 0x3a,
+    0x14, 0x6d, 0xcb, 0x6b, 0xf5, 0xf9, 0x04, 0xa6,
+    0xe1, 0x96, 0xd5, 0x0a, 0x74, 0x98, 0x96, 0x2a,
+    0x05, 0x33, 0x47, 0x3a, 0x95, 0xb9, 0xa3, 0xf6,
+    0x0f, 0xcd, 0x09, 0xfd, 0xfc, 0x7f, 0x16, 0x8f,
+    0x9d, 0x84, 0xd4, 0x59, 0x61, 0x3b, 0x37, 0x03,
+    0x02, 0x5f, 0x6e, 0x85, 0xce, 0x67, 0x14, 0xf7,
+    0x3c, 0x3f, 0x88, 0xfd, 0x41, 0xc9, 0x38, 0xca,
+    0x7c, 0x7c, 0x30, 0xe1, 0x7d, 0xcd, 0x8f, 0x6f,
+    0x8c, 0x59, 0x58, 0x3e, 0x3e, 0xf5, 0x9c, 0x6e,
+    0x27, 0x9a, 0x51, 0x1a, 0xb7, 0x71, 0x8a, 0x58,
+    0x83, 0xf2, 0x46, 0xee, 0xd1, 0x84, 0x60, 0xd7,
+    0x39, 0x2d, 0x2a, 0x17, 0x08, 0x26, 0x2f, 0xa5,
+    0x55, 0xd4, 0xc8, 0x99, 0xa2, 0x1c, 0x37, 0x5b,
+    0x67, 0x89, 0xa5, 0xb5, 0x11, 0x59, 0xd6, 0x77,
+    0xf6, 0x5b, 0x54, 0xf6, 0xf3, 0xa9, 0x2d, 0xf3,
+    0xb9, 0x39, 0xb0, 0xb2, 0xa9, 0xf2, 0x23, 0x0b,
+    0x59, 0x7b, 0x3b, 0x70, 0x8c, 0x16, 0x96, 0x75,
+    0x18, 0x6a, 0x7d, 0x66, 0x95, 0x18, 0xcc, 0x27,
+    0x79, 0x4b, 0x85, 0xec, 0xb0, 0xa6, 0x5a, 0x72,
+    0x6f, 0xd1, 0xd0, 0x1d, 0x6c, 0x3c, 0xf0, 0xa1,
+    0xe9, 0xc0, 0x47, 0xf4, 0x27, 0x25, 0xea, 0x83,
+    0x9d, 0x50, 0x53, 0x77, 0xec, 0xb1, 0x29, 0xa7,
+    0x62, 0xb0, 0xda, 0x32, 0x3c, 0xe6, 0x47, 0x1e,
+    0x90, 0x8d, 0x76, 0x12, 0x75, 0x7f, 0x14, 0x0d,
+    0x27, 0x1d, 0x77, 0xfe, 0x76, 0x1c, 0x50, 0x1e,
+    0x4e, 0xac, 0x70, 0x68, 0x88, 0x74, 0x13, 0x58,
+    0x54, 0x07, 0x71, 0x72, 0x6b, 0x46, 0xb0, 0xca,
+    0x5e, 0x59, 0x13, 0xdd, 0x4f, 0x60, 0xd1, 0x06,
+    0x5e, 0x40, 0x30, 0x1a, 0x2a, 0x3e, 0x38, 0xdb,
+    0x40, 0x4f, 0x19, 0x1a, 0x84, 0x87, 0x41, 0x8c,
+    0xfc, 0x08, 0x03, 0xd5, 0x98, 0x10, 0xc1, 0x33,
+    0xf2, 0x86, 0x0f, 0x7b, 0xde, 0x96, 0x4f, 0x39,
+    0x7a, 0x46, 0x60, 0x02, 0xa6, 0xc8, 0x4b, 0xe6,
+    0x87, 0xae, 0xe1, 0x47, 0x81, 0x4b, 0x16, 0x4d,
+    0xef, 0x9b, 0x84, 0x1e, 0xdb, 0xb0, 0x35, 0x0f,
+    0x6c, 0xc0, 0xba, 0x73, 0xe9, 0x74, 0x5c, 0x2b,
+    0xe3, 0x41, 0xec, 0xf7, 0x7c, 0xc0, 0x43, 0xc8,
+    0x8e, 0xdc, 0x53, 0x98, 0xb8, 0xcd, 0x55, 0xd8,
+    0x04, 0x9e, 0x8a, 0x91, 0x5b, 0x01, 0x85, 0xe0,
+    0xbe, 0x76, 0x02, 0x02, 0x19, 0x38, 0x95, 0x9c,
+    0x64, 0xc8, 0xca, 0xa1, 0x24, 0x8d, 0x39, 0x5b,
+    0xed, 0xc1, 0x9f, 0x28, 0x3e, 0x41, 0xc8, 0x7a,
+    0xa4, 0x70, 0xc0, 0x1c, 0x68, 0x38, 0xf5, 0x78,
+    0x0b, 0x60, 0x99, 0x67, 0x2b, 0xed, 0xdc, 0x73,
+    0x09, 0xfb, 0xe5, 0xa0, 0x81, 0x36, 0xe8, 0xe1,
+    0x37, 0xc9, 0x39, 0x0d, 0x17, 0x68, 0x78, 0x05,
+    0x06, 0xcd, 0x5d, 0x47, 0x0a, 0x42, 0x44, 0xc7,
+    0xd8, 0x74, 0x95, 0xd8, 0x3d, 0xe5, 0x70, 0xd7,
+    0x76, 0xad, 0x81, 0x2b, 0x93, 0x62, 0x3a, 0x76,
+    0x03, 0x07, 0x08, 0xd5, 0x56, 0xb6, 0x25, 0x32,
+    0xba, 0xc3, 0x39, 0x3e, 0xce, 0xe5, 0x35, 0xd7,
+    0x6e, 0x64, 0x4d, 0x88, 0x8a, 0x7c, 0x92, 0xbe,
+    0x2f, 0x56, 0x4e, 0x11, 0x3c, 0x29, 0xc8, 0x08,
+    0x7f, 0xf1, 0x7a, 0xb9, 0x24, 0x5d, 0x8f, 0x43,
+    0x47, 0x25, 0xbb, 0xdd, 0xf8, 0x50, 0x0c, 0xdc,
+    0x27, 0x07, 0xfb, 0xb4, 0x36, 0x59, 0x15, 0xe6,
+    0xf3, 0xd4, 0x4a, 0x69, 0x42, 0x2b, 0x69, 0x5d,
+    0x5a, 0x1e, 0x3f, 0xc6, 0xe3, 0x57, 0xbc, 0x1d,
+    0xe1, 0xf0, 0xac, 0xdb, 0xed, 0x60, 0x43, 0x65,
+    0xd4, 0x36, 0xfc, 0x02, 0xdc, 0xc4, 0x29, 0x80,
+    0x4d, 0xcf, 0xa8, 0xd5, 0x78, 0x80, 0x0d, 0x0f,
+    0x5d, 0x5d, 0xa9, 0xc1, 0xcb, 0x8a, 0xc2, 0x28,
+    0xc2, 0x7b, 0x8a, 0x93, 0x81, 0xd6, 0x9a, 0x28,
+    0xa4, 0xee, 0xca, 0xaa, 0x4c, 0xe2, 0x43, 0xa6,
+    0xbe, 0x72, 0xea, 0x44, 0xe9, 0xdb, 0x61, 0xf2,
+    0xce, 0x92, 0x80, 0x62, 0x90, 0xde, 0x2d, 0x72,
+    0xaa, 0x99, 0x52, 0x83, 0x48, 0xb6, 0x0b, 0x3c,
+    0xa5, 0xa7, 0x93, 0x73, 0x90, 0x69, 0x66, 0x11,
+    0x96, 0x69, 0xd7, 0xff, 0x68, 0x48, 0x8d, 0x33,
+    0x24, 0x1d, 0x6b, 0xdc, 0x08, 0x52, 0xc7, 0x3d,
+    0x10, 0x1e, 0x78, 0x79, 0xe7, 0xa5, 0x3d, 0x51,
+    0x60, 0x78, 0x58, 0xe4, 0x6a, 0x96, 0x83, 0xbe,
+    0x03, 0x5f, 0xb5, 0xdc, 0xdf, 0x0b, 0xc6, 0xa9,
+    0x59, 0x60, 0x91, 0x6f, 0x3d, 0x93, 0xc4, 0x7a,
+    0x2c, 0x0a, 0x9f, 0x43, 0x01, 0xae, 0x6c, 0x6d,
+    0x96, 0x5a, 0x24, 0x36, 0x0b, 0xc1, 0x66, 0xc1,
+    0x02, 0x4f, 0x29, 0xcb, 0xc2, 0x0b, 0x64, 0xa1,
+    0x45, 0x9a, 0xe5, 0x30, 0x8b, 0xb5, 0x36, 0xd9,
+    0x1c, 0x6d, 0x79, 0x47, 0x9b, 0x8d, 0x81, 0x2f,
+    0xb2, 0x9c, 0xe5, 0x3a, 0xc9, 0x02, 0xef, 0x68,
+    0x21, 0xab, 0x35, 0x47, 0x41, 0xfa, 0x19, 0x49,
+    0xa1, 0x17, 0x82, 0x98, 0x2c, 0x76, 0x74, 0x53,
+    0x1b, 0x7b, 0x20, 0x5a, 0x79, 0x21, 0x24, 0x38,
+    0xb1, 0x15, 0xdf, 0xa9, 0xb8, 0xf5, 0xe7, 0xd7,
+    0x31, 0x53, 0x18, 0x1a, 0x40, 0xbc, 0x04, 0x37,
+    0x5a, 0x79, 0xfa, 0x92, 0xd2, 0x75, 0x4f, 0xfc,
+    0x54, 0xba, 0x6e, 0xf7, 0xe8, 0xfc, 0x74, 0x2d,
+    0x48, 0x0c, 0x89, 0xce, 0xd6, 0x4e, 0x92, 0x58,
+    0x45, 0x85, 0x83, 0x64, 0x96, 0x60, 0x9e, 0x6e,
+    0x9d, 0x42, 0x8e, 0xed, 0xea, 0x18, 0xcd, 0x99,
+    0xcb, 0x67, 0xf9, 0x40, 0x01, 0xcc, 0x38, 0x99,
+    0x83, 0x72, 0x58, 0xf0, 0x0b, 0x9a, 0x16, 0x82,
+    0x2c, 0x29, 0xb3, 0x54, 0x29, 0x80, 0x5a, 0x77,
+    0xb9, 0x09, 0x60, 0x81, 0x40, 0x11, 0xc7, 0x3f,
+    0xe9, 0xa2, 0x22, 0x81, 0xd3, 0x45, 0x47, 0x48,
+    0x8a, 0x6d, 0x95, 0x13, 0xda, 0x35, 0x67, 0x09,
+    0x22, 0x10, 0xa5, 0x44, 0xd4, 0xf2, 0x47, 0xcd,
+    0x02, 0x24, 0x29, 0xd6, 0x6b, 0x8a, 0x81, 0xe2,
+    0x58, 0x40, 0x48, 0xbe, 0xd4, 0xfe, 0xfb, 0x04,
+    0x17, 0xc4, 0xb9, 0xd1, 0xeb, 0x68, 0x61, 0xfe,
+    0x49, 0xd2, 0x0a, 0x22, 0x05, 0x55, 0xf5, 0xb2,
+    0x45, 0xac, 0x39, 0x77, 0xce, 0x31, 0x38, 0x47,
+    0xb8, 0x09, 0x08, 0xcf, 0x73, 0xa5, 0x1e, 0x34,
+    0x8a, 0x0d, 0x74, 0x16, 0x91, 0x70, 0x4a, 0x47,
+    0x24, 0x88, 0x85, 0xdc, 0x8b, 0x27, 0x40, 0x92,
+    0x3a, 0x92, 0x53, 0xe1, 0xa8, 0x11, 0xb2, 0x33,
+    0x41, 0xa8, 0xe9, 0xa4, 0x38, 0x95, 0x46, 0x1e,
+    0x2d, 0x9a, 0x6a, 0x3e, 0x9e, 0x3f, 0x47, 0x04,
+    0x2a, 0x44, 0x19, 0xea, 0x4b, 0x81, 0x3e, 0xd9,
+    0xce, 0xb1, 0x4e, 0xc7, 0xf9, 0x24, 0x43, 0x2c,
+    0x95, 0x8b, 0xe6, 0x98, 0x4c, 0x40, 0xf8, 0x10,
+    0x98, 0xeb, 0x5b, 0x2b, 0x0d, 0xb6, 0x0e, 0x41,
+    0xa5, 0x30, 0x68, 0x2b, 0x14, 0xbb, 0x98, 0x0d,
+    0x65, 0x5e, 0x60, 0x03, 0x0a, 0x58, 0x52, 0x67,
+    0x92, 0x33, 0x51, 0xab, 0x50, 0x6b, 0x33, 0x01,
+    0x8a, 0x63, 0x70, 0x23, 0x9a, 0x1a, 0x65, 0x88,
+    0x1e, 0xe4, 0x84, 0xf9, 0x80, 0x6a, 0x65, 0x0e,
+    0x6f, 0xf4, 0x33, 0x54, 0xde, 0x77, 0x83, 0x4e,
+    0x8f, 0xc8, 0x57, 0xa8, 0xb1, 0x55, 0x12, 0xfe,
+    0xd8, 0x0b, 0xb8, 0x12, 0x3f, 0x19, 0xdb, 0xda,
+    0x95, 0x16, 0xa7, 0xf0, 0x91, 0x40, 0x03, 0x29,
+    0xaa, 0x9e, 0xf2, 0x1a, 0x9e, 0x2d, 0xc5, 0x9f,
+    0x4d, 0xd6, 0x8b, 0x8d, 0x98, 0xcb, 0xb7, 0x57,
+    0xf9, 0xf5, 0xe5, 0x3f, 0x31, 0xb9, 0xd9, 0xc2,
+    0x15, 0x5d, 0xfd, 0xf8, 0xf3, 0xd5, 0x0f, 0xf9,
+    0x77, 0xbf, 0xbe, 0xfb, 0x05, 0x7b, 0x0c, 0xf4,
+    0x77, 0xb6, 0xba, 0xbe, 0xfa, 0xb4, 0xba, 0x58,
+    0xd5, 0xa2, 0x9d, 0x1e, 0x57, 0x67, 0xab, 0x0f,
+    0x57, 0x97, 0xca, 0x56, 0x0c, 0x19, 0x28, 0xd4,
+    0x87, 0x7f, 0x5c, 0xd3, 0x30, 0x0a, 0x37, 0x18,
+    0x71, 0x6f, 0x3e, 0x5e, 0x7e, 0xbc, 0xc9, 0x6f,
+    0x3e, 0x5d, 0xdf, 0xfc, 0x92, 0xbf, 0xb9, 0xbc,
+    0x79, 0x87, 0x09, 0x65, 0xfa, 0x19, 0x53, 0xca,
+    0x09, 0x92, 0x5c, 0x55, 0x98, 0xa9, 0x36, 0x90,
+    0x4e, 0x9d, 0xf4, 0xe7, 0xeb, 0xf5, 0xea, 0xe2,
+    0x5f, 0xeb, 0xb3, 0x20, 0xf9, 0x0d, 0x50, 0x41,
+    0xd5, 0x54, 0xa3, 0x48, 0x45, 0x6d, 0x04, 0xa8,
+    0x9d, 0xb2, 0xdf, 0x20, 0x7f, 0xec, 0x45, 0x47,
+    0x98, 0x61, 0x66, 0xc6, 0xe5, 0x41, 0xf4, 0xeb,
+    0x6f, 0x9e, 0x83, 0x04, 0x16, 0x02, 0xf3, 0x0b,
+    0x58, 0x68, 0x61, 0x09, 0x14, 0xd2, 0x73, 0x58,
+    0x64, 0x61, 0x19, 0x68, 0xf8, 0x1c, 0x16, 0x5b,
+    0x58, 0x10, 0x40, 0x21, 0x31, 0x07, 0x26, 0x0e,
+    0x18, 0xc7, 0x4b, 0x6e, 0x52, 0x07, 0xdc, 0x84,
+    0x4b, 0x76, 0x36, 0x8e, 0xd5, 0x75, 0xb0, 0xe4,
+    0x27, 0x73, 0xc0, 0x68, 0x6d, 0x18, 0x02, 0x97,
+    0x43, 0xa7, 0x87, 0x0f, 0x04, 0xa5, 0x49, 0x02,
+    0x36, 0x1e, 0xa4, 0x0e, 0x14, 0x78, 0x20, 0x60,
+    0xd5, 0x07, 0x85, 0x1e, 0x08, 0x2e, 0xce, 0x07,
+    0x45, 0x1e, 0x28, 0x8b, 0x67, 0xa0, 0xd8, 0x81,
+    0x52, 0xd0, 0x0f, 0x1f, 0x94, 0x78, 0xa0, 0x60,
+    0xce, 0x46, 0xea, 0x81, 0xa2, 0x39, 0x1b, 0x1b,
+    0x0f, 0x14, 0x2b, 0x36, 0x3e, 0xcf, 0xdc, 0x23,
+    0xd4, 0x7d, 0x4a, 0x19, 0x82, 0x28, 0x8a, 0x56,
+    0x17, 0xa0, 0x91, 0x85, 0x4c, 0xd6, 0xf1, 0xa6,
+    0x52, 0x39, 0xed, 0x58, 0xf3, 0x64, 0x1d, 0x84,
+    0xb7, 0xa0, 0x64, 0x9a, 0x4a, 0xab, 0x14, 0x7c,
+    0x56, 0xfc, 0x7e, 0x6d, 0xd4, 0x0a, 0xf7, 0xa3,
+    0xa9, 0x40, 0x4d, 0x81, 0x4a, 0xfa, 0x93, 0xa1,
+    0x9a, 0x4c, 0x82, 0xd0, 0x9f, 0x8c, 0xd4, 0xe4,
+    0xc6, 0x88, 0x86, 0x26, 0x63, 0x35, 0x19, 0xac,
+    0xc3, 0xd8, 0x9f, 0x4d, 0x68, 0x36, 0xcc, 0x66,
+    0x5b, 0xa5, 0x34, 0x6b, 0xaf, 0x84, 0x66, 0x37,
+    0x34, 0x0b, 0x8e, 0xce, 0x9c, 0x15, 0xd2, 0x0d,
+    0x81, 0x8e, 0x62, 0x80, 0x0a, 0x33, 0x17, 0x95,
+    0x36, 0x4d, 0xa6, 0x4c, 0x78, 0x47, 0x79, 0x25,
+    0xb5, 0xc4, 0x2e, 0xeb, 0x9a, 0x69, 0x0b, 0x34,
+    0xa1, 0x49, 0xb2, 0x66, 0x92, 0x23, 0x3b, 0x14,
+    0xf7, 0x1c, 0xeb, 0x65, 0xcc, 0x1f, 0xb9, 0x1f,
+    0x7a, 0xa8, 0x5d, 0x78, 0x59, 0xa3, 0x0b, 0x7b,
+    0x62, 0xa6, 0x6c, 0xab, 0x28, 0xae, 0x5e, 0x15,
+    0x2d, 0x6b, 0xbb, 0x91, 0x81, 0x2f, 0x63, 0x18,
+    0x0f, 0x18, 0xdc, 0x04, 0x11, 0x33, 0x45, 0xcc,
+    0x1e, 0x0e, 0x02, 0xbe, 0xc9, 0xb5, 0x48, 0xd6,
+    0x83, 0x73, 0x04, 0x16, 0x29, 0x70, 0x03, 0xed,
+    0x97, 0x23, 0x06, 0x4a, 0x26, 0xc5, 0x1e, 0x56,
+    0x85, 0xdd, 0x8b, 0x91, 0x09, 0xc9, 0x0a, 0xbd,
+    0x17, 0xb5, 0x51, 0xa8, 0x9c, 0xd4, 0xc8, 0x12,
+    0x51, 0xd1, 0x2d, 0x51, 0xd1, 0x4b, 0xb3, 0x2a,
+    0x4f, 0x50, 0xc9, 0x18, 0x6c, 0xc7, 0x5b, 0x66,
+    0x3a, 0x0d, 0x96, 0x1e, 0x72, 0x89, 0x2b, 0x6a,
+    0x1f, 0xb3, 0xbe, 0x18, 0x24, 0x80, 0x54, 0xe5,
+    0xa1, 0xea, 0x49, 0x03, 0x18, 0x38, 0xe4, 0x28,
+    0x72, 0x54, 0x4d, 0xe4, 0xab, 0x6e, 0xaa, 0x2b,
+    0x3a, 0x97, 0xf2, 0xbd, 0x6f, 0x6f, 0x82, 0xec,
+    0x0d, 0xe4, 0xcd, 0xc8, 0x16, 0x10, 0x63, 0x8d,
+    0x53, 0x54, 0xd4, 0x9c, 0xf9, 0x4b, 0xa8, 0xec,
+    0x2b, 0x70, 0x99, 0x15, 0xa4, 0x3c, 0x62, 0x7c,
+    0x45, 0x79, 0xe6, 0x5f, 0x24, 0x6b, 0xa6, 0x91,
+    0x3f, 0x5a, 0x3a, 0x10, 0x83, 0xc1, 0x9b, 0xdf,
+    0x2c, 0xb6, 0x87, 0x0d, 0x04, 0xe2, 0x8f, 0xec,
+    0x06, 0x48, 0x51, 0x2a, 0x2d, 0x9a, 0x9e, 0xb6,
+    0x66, 0x54, 0x32, 0x63, 0xc9, 0xf3, 0x0e, 0x0f,
+    0xcf, 0x20, 0xf6, 0x8d, 0xd8, 0x90, 0x68, 0x3a,
+    0x60, 0xa3, 0x6b, 0x85, 0x8e, 0x3e, 0x1a, 0x0f,
+    0x73, 0x59, 0xc2, 0x83, 0xc8, 0x48, 0x6e, 0x94,
+    0xd1, 0xa9, 0x13, 0xbb, 0x02, 0x8e, 0x71, 0x85,
+    0xf9, 0xd6, 0x94, 0x75, 0x7c, 0xd7, 0x0d, 0x25,
+    0xb7, 0x4d, 0x29, 0xa6, 0xbb, 0xf7, 0xd4, 0x1b,
+    0x7d, 0xff, 0xe1, 0xfb, 0x9f, 0x19, 0x1a, 0x2e,
+    0x03, 0x65, 0x16, 0x80, 0x86, 0x72, 0xd8, 0x41,
+    0x0e, 0x58, 0x51, 0xc5, 0xf5, 0x3d, 0xe5, 0xb4,
+    0xde, 0xba, 0xd8, 0x17, 0x66, 0xa2, 0x3a, 0xc3,
+    0x4c, 0x51, 0xcb, 0xad, 0x03, 0x5d, 0x52, 0xef,
+    0x04, 0x9a, 0x0b, 0xea, 0x64, 0xbe, 0x40, 0xaa,
+    0xb4, 0x1c, 0x29, 0xe1, 0x2e, 0xc6, 0x02, 0x04,
+    0xf2, 0xe5, 0x37, 0x5f, 0x52, 0xf5, 0x60, 0x88,
+    0x4c, 0xdb, 0xdc, 0x75, 0xf1, 0x29, 0x33, 0xa5,
+    0x1a, 0xcc, 0x60, 0xd9, 0xa3, 0x24, 0xfe, 0x1c,
+    0xa0, 0xa1, 0x6e, 0x81, 0xed, 0x40, 0x5a, 0x4b,
+    0x2d, 0x2a, 0x03, 0x6c, 0x3a, 0xb0, 0x2c, 0xad,
+    0x5e, 0x0c, 0xfb, 0xa8, 0x18, 0x46, 0x1d, 0xd8,
+    0x76, 0x5d, 0x6d, 0x9f, 0x95, 0xd2, 0xac, 0x23,
+    0xb8, 0xae, 0x7a, 0xed, 0xfe, 0x91, 0xc7, 0x00,
+    0x58, 0x04, 0x23, 0x3f, 0x87, 0x4d, 0x23, 0x33,
+    0x6b, 0x7a, 0xaf, 0xda, 0xd2, 0x19, 0x48, 0x4b,
+    0x85, 0x72, 0x4a, 0x20, 0x97, 0x58, 0x06, 0xe4,
+    0xed, 0x8d, 0xdd, 0x4d, 0x13, 0xed, 0xc3, 0xcd,
+    0x6c, 0x5e, 0x17, 0x48, 0xea, 0x1a, 0x69, 0xe7,
+    0xd8, 0x13, 0xd2, 0xac, 0xbe, 0xf1, 0x70, 0xb0,
+    0x5b, 0x72, 0x5d, 0x3c, 0xa2, 0xee, 0x66, 0x46,
+    0xde, 0xd4, 0xa9, 0xbc, 0xe6, 0x52, 0x16, 0x7b,
+    0xce, 0x78, 0x5b, 0x42, 0x7e, 0x68, 0x0c, 0x14,
+    0x78, 0xb9, 0x16, 0x52, 0x72, 0xd8, 0x12, 0xea,
+    0xe2, 0x6a, 0xaa, 0x51, 0xdf, 0x80, 0x18, 0xd3,
+    0x72, 0xa6, 0x33, 0x15, 0x65, 0x0c, 0xfc, 0x9e,
+    0xe3, 0x45, 0x61, 0x46, 0xfe, 0x3c, 0xc1, 0xa1,
+    0x18, 0x2a, 0xe5, 0xa1, 0x34, 0x36, 0x36, 0xea,
+    0x9e, 0xc7, 0x36, 0x72, 0xd1, 0xc8, 0xf8, 0x78,
+    0x74, 0x8d, 0x57, 0xa9, 0x6a, 0x19, 0x06, 0x5f,
+    0xc3, 0xae, 0xee, 0x1e, 0xa8, 0x7a, 0xfa, 0x95,
+    0xeb, 0x05, 0x60, 0x29, 0x34, 0xa0, 0x41, 0x59,
+    0x1c, 0x78, 0xd3, 0xbe, 0x40, 0x9f, 0x82, 0x5d,
+    0x9c, 0x1b, 0x8b, 0x70, 0xc4, 0x37, 0x7b, 0x10,
+    0xe0, 0x97, 0xf9, 0x63, 0xc9, 0x01, 0xea, 0xf7,
+    0x9f, 0x29, 0x19, 0x75, 0x94, 0x33, 0x96, 0x5e,
+    0xa0, 0xc2, 0x92, 0xcb, 0xa3, 0x32, 0x27, 0x7e,
+    0x81, 0x02, 0xb3, 0xc4, 0x1b, 0x3e, 0xea, 0x3b,
+    0x51, 0x6c, 0x23, 0x86, 0x68, 0xa6, 0xc6, 0xcc,
+    0x19, 0x5b, 0xc0, 0xb3, 0x58, 0xbb, 0xc6, 0x8e,
+    0x18, 0x2c, 0xa6, 0xfc, 0xae, 0x72, 0x67, 0xfe,
+    0xc3, 0xd6, 0x8d, 0x76, 0xc4, 0x63, 0xd7, 0xb1,
+    0x5d, 0xa1, 0x64, 0x42, 0xf2, 0xc0, 0x06, 0xe0,
+    0x47, 0x5f, 0x45, 0xb4, 0xdf, 0x53, 0xbd, 0x78,
+    0xea, 0x97, 0x7f, 0x54, 0x52, 0x44, 0x4a, 0x70,
+    0x4b, 0x92, 0xab, 0x86, 0xe6, 0x47, 0x18, 0x81,
+    0xee, 0x3f, 0x61, 0xd3, 0x4c, 0xfb, 0x0e, 0x49,
+    0x8f, 0x74, 0x16, 0x82, 0x1a, 0x6b, 0x21, 0x98,
+    0xea, 0x7f, 0x6a, 0x8b, 0x5b, 0x8c, 0x46, 0x9d,
+    0x56, 0x64, 0x25, 0x0d, 0xc2, 0xa0, 0x9e, 0x9f,
+    0x43, 0x00, 0x4d, 0x80, 0x8b, 0xc5, 0x15, 0x20,
+    0x61, 0x1a, 0x6b, 0x6a, 0x3a, 0x39, 0xb0, 0xf2,
+    0x38, 0x4b, 0xdf, 0x45, 0xdd, 0xe4, 0x05, 0x52,
+    0x51, 0x95, 0x0e, 0xbc, 0x3e, 0x06, 0xeb, 0x58,
+    0x60, 0x23, 0xb1, 0xc1, 0x8d, 0xb3, 0x23, 0x5c,
+    0x77, 0x52, 0xaa, 0x93, 0x96, 0x60, 0x9f, 0x23,
+    0xd0, 0x5e, 0x4e, 0x7d, 0xbe, 0x05, 0x16, 0x2a,
+    0xda, 0x11, 0x5a, 0x7a, 0x84, 0xe6, 0x64, 0x47,
+    0xaf, 0x7e, 0x0e, 0xac, 0xa2, 0xd1, 0x8c, 0x95,
+    0xd0, 0x07, 0x63, 0xf8, 0xbd, 0xf9, 0xf0, 0xbd,
+    0xaa, 0xec, 0xa8, 0xfb, 0x76, 0x0c, 0x93, 0x3d,
+    0xc7, 0xa4, 0x21, 0x49, 0x96, 0xc0, 0xb6, 0x6b,
+    0xcf, 0x6f, 0x31, 0xf2, 0x28, 0xdb, 0x5b, 0x70,
+    0x31, 0x63, 0x52, 0x3b, 0x40, 0x23, 0x35, 0xed,
+    0xaf, 0x92, 0xd9, 0x1d, 0x52, 0x77, 0x13, 0x97,
+    0xee, 0x05, 0xf5, 0xe8, 0x35, 0x8c, 0x00, 0xb3,
+    0x33, 0xc0, 0xed, 0xaa, 0x97, 0xe4, 0xbc, 0x3c,
+    0x4c, 0xed, 0x1d, 0x28, 0x1f, 0xa4, 0x2a, 0x15,
+    0x3d, 0x50, 0x7a, 0xf3, 0xd2, 0x01, 0x80, 0x1b,
+    0xf2, 0x7a, 0x3a, 0xc8, 0xa2, 0x53, 0x87, 0x6a,
+    0x4b, 0xb2, 0x52, 0x32, 0x55, 0x71, 0xc4, 0xeb,
+    0xf9, 0x53, 0x11, 0x9c, 0xa7, 0x86, 0x3c, 0xe6,
+    0x1e, 0x16, 0x20, 0x26, 0x54, 0x7a, 0x62, 0x4d,
+    0x64, 0x7b, 0xd4, 0x71, 0xbe, 0x60, 0x3f, 0x43,
+    0x3e, 0x04, 0x75, 0xce, 0x2d, 0x96, 0x69, 0x3b,
+    0x7c, 0x71, 0x90, 0x7f, 0xa3, 0x6a, 0x50, 0xbd,
+    0x75, 0xdb, 0xd4, 0x48, 0xbf, 0x80, 0x57, 0xf4,
+    0x8c, 0x20, 0xb1, 0x6f, 0x8b, 0x1e, 0x9e, 0x7c,
+    0x4f, 0x09, 0x60, 0x04, 0x61, 0x5d, 0x0d, 0x49,
+    0x99, 0x7a, 0x9c, 0xfc, 0xe9, 0xf2, 0xea, 0x07,
+    0x7a, 0xf1, 0x31, 0x6f, 0x1e, 0xaa, 0x3c, 0x46,
+    0x03, 0xab, 0x8b, 0x01, 0xb3, 0x08, 0x6c, 0x07,
+    0x9c, 0xa8, 0x01, 0xd1, 0xaa, 0xc9, 0xa9, 0xe3,
+    0x0b, 0x92, 0x4e, 0xaa, 0xc8, 0x09, 0x62, 0xe5,
+    0x0b, 0xe9, 0xe7, 0xd1, 0x2b, 0x0b, 0xe6, 0x9f,
+    0x50, 0xd0, 0x45, 0x41, 0x96, 0x24, 0x2a, 0xe1,
+    0xd6, 0x83, 0x54, 0x65, 0xdc, 0x34, 0x48, 0x13,
+    0xe5, 0x22, 0x60, 0x90, 0xa6, 0x1b, 0xf8, 0x8e,
+    0x3e, 0xc3, 0x4a, 0x35, 0x5c, 0x4c, 0x8b, 0xc6,
+    0xbe, 0xc2, 0x7f, 0x07, 0x78, 0xff, 0xe1, 0xc7,
+    0xfb, 0x68, 0xa5, 0xfa, 0x40, 0x90, 0xc4, 0x48,
+    0x2e, 0x5d, 0x49, 0x97, 0x8b, 0x76, 0xd6, 0x4d,
+    0x54, 0x1e, 0x3b, 0x3f, 0xd5, 0x7d, 0x3a, 0x47,
+    0x5f, 0x63, 0xde, 0xf0, 0x67, 0x24, 0x85, 0xd7,
+    0x66, 0x65, 0x0a, 0x42, 0x0d, 0x82, 0x73, 0x0c,
+    0x22, 0x94, 0x0b, 0xb9, 0x7a, 0xfc, 0x3c, 0xb2,
+    0xaf, 0xcf, 0xe0, 0x27, 0xf4, 0x83, 0x84, 0x2a,
+    0xd9, 0xd5, 0xbb, 0x05, 0xce, 0x99, 0x7b, 0x55,
+    0x7d, 0x10, 0x08, 0x0f, 0xb9, 0x6d, 0x6b, 0x21,
+    0xb9, 0xd2, 0x0c, 0xd5, 0xbf, 0x7d, 0x89, 0x71,
+    0x4d, 0xa2, 0x3f, 0x72, 0x6f, 0x7f, 0xec, 0x31,
+    0x98, 0xd7, 0x22, 0x09, 0x5e, 0xd2, 0x3e, 0xfe,
+    0x9c, 0xa3, 0x72, 0xe8, 0xce, 0xae, 0x81, 0xbd,
+    0x24, 0x14, 0x41, 0x5e, 0x56, 0xaf, 0x1a, 0xba,
+    0x97, 0x9a, 0x19, 0x5b, 0x87, 0xae, 0x01, 0x7b,
+    0x3c, 0x5e, 0xc4, 0x7f, 0x08, 0xc2, 0xbd, 0x53,
+    0xf7, 0xfa, 0x91, 0x9b, 0x7b, 0xf2, 0x1a, 0xb0,
+    0x6a, 0x6c, 0xc4, 0x1a, 0xba, 0x17, 0x06, 0x0f,
+    0xd7, 0x3e, 0x35, 0x50, 0x8b, 0xe6, 0x35, 0xe2,
+    0xe2, 0x53, 0x89, 0x13, 0x28, 0x5b, 0xd6, 0x37,
+    0x24, 0xd3, 0x6d, 0xe4, 0x5e, 0x24, 0x8e, 0xda,
+    0xcb, 0xde, 0x01, 0xcc, 0xbb, 0x83, 0x2f, 0xcc,
+    0xc4, 0x7b, 0x4d, 0x98, 0xcb, 0x4c, 0x4e, 0x65,
+    0xa9, 0x9e, 0x4c, 0xf0, 0x78, 0x18, 0x7d, 0x81,
+    0x4d, 0xff, 0xd5, 0xee, 0x1c, 0x23, 0x25, 0xd9,
+    0x3f, 0x54, 0x8a, 0xf5, 0xdd, 0xac, 0xcb, 0x24,
+    0x31, 0xcb, 0x6b, 0x4b, 0xbe, 0x78, 0x8f, 0x38,
+    0xa7, 0x16, 0xa4, 0xa3, 0x99, 0x75, 0x9e, 0x5d,
+    0xd3, 0x54, 0xf7, 0x86, 0x4d, 0x2f, 0x87, 0x7a,
+    0x8f, 0xfe, 0x92, 0xb7, 0xd3, 0x6e, 0xc7, 0x21,
+    0xde, 0x52, 0xd7, 0x1f, 0x8a, 0x21, 0x70, 0x2a,
+    0xb9, 0xc9, 0x44, 0xa4, 0x56, 0x35, 0x4c, 0x2e,
+    0x5d, 0xe2, 0x6d, 0x9f, 0x29, 0x4e, 0xcb, 0xf0,
+    0x64, 0x23, 0xf1, 0xe8, 0x26, 0xfd, 0xd6, 0xb4,
+    0x7f, 0xa5, 0x41, 0x3a, 0xef, 0xdc, 0xfd, 0xa9,
+    0x0a, 0x44, 0xaa, 0x58, 0x1d, 0x46, 0x95, 0xb0,
+    0x43, 0xfd, 0xaa, 0x4a, 0x57, 0xe9, 0xd4, 0x5e,
+    0x4e, 0x8d, 0xfe, 0x91, 0xbf, 0xab, 0xab, 0xda,
+    0x26, 0xae, 0x19, 0xb7, 0xe8, 0xd4, 0xd1, 0xc3,
+    0x8f, 0xc0, 0x65, 0x37, 0x0b, 0x27, 0xf4, 0x17,
+    0xcc, 0x60, 0x32, 0x66, 0xa0, 0xee, 0xd9, 0xb9,
+    0xc5, 0x13, 0x47, 0xc0, 0xd6, 0x1d, 0xb1, 0xbf,
+    0xf6, 0x9b, 0x72, 0x4e, 0xd7, 0xca, 0xc2, 0x76,
+    0x08, 0x4f, 0x3f, 0x74, 0x79, 0xaa, 0x87, 0xc5,
+    0x2c, 0xbd, 0x5f, 0x32, 0xfa, 0xff, 0x80, 0x69,
+    0xe6, 0x65, 0xb0, 0x09, 0xa1, 0xff, 0x8f, 0x0a,
+    0xbc, 0x60, 0xc9, 0x6f, 0x93, 0x4d, 0x15, 0xae,
+    0x3e, 0xff, 0x07, 0x7e, 0xa6, 0x75, 0xea,
+};
+
+// Identify size = 3239 (9587 uncompressed)
+const uint32_t command_identify_size PROGMEM
+    = ARRAY_SIZE(command_identify_data);
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# Benchmark bed_mesh interpolation of probed points
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, optparse, math, random, time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../klippy'))
+from extras import bed_mesh, bulk_sensor
+
+ALGOS = ['lagrange', 'bicubic']
+
+# Generate a probed matrix of a warped bed with some probe noise
+def gen_probed_matrix(x_count, y_count, seed=42):
+    rnd = random.Random(seed)
+    matrix = []
+    for j in range(y_count):
+        fy = j / float(y_count - 1)
+        row = []
+        for i in range(x_count):
+            fx = i / float(x_count - 1)
+            z = (.2 * math.sin(math.pi * fx) * math.cos(2. * math.pi * fy)
+                 + .05 * fx * fy + rnd.gauss(0., .005))
+            row.append(z)
+        matrix.append(row)
+    return matrix
+
+def make_params(algo, probe_count, pps, tension):
+    return {'min_x': 10., 'max_x': 290., 'min_y': 10., 'max_y': 290.,
+            'x_count': probe_count[0], 'y_count': probe_count[1],
+            'mesh_x_pps': pps[0], 'mesh_y_pps': pps[1],
+            'algo': algo, 'tension': tension}
+
+# Time the mesh generation of a sample method (best of repeat runs)
+def time_sample(sample_method, z_matrix, repeat):
+    best = None
+    for i in range(repeat):
+        start_time = time.time()
+        sample_method(z_matrix)
+        duration = time.time() - start_time
+        if best is None or duration < best:
+            best = duration
+    return best
+
+def run_benchmark(algo, probe_count, pps, options):
+    params = make_params(algo, probe_count, pps, options.tension)
+    z_matrix = gen_probed_matrix(probe_count[0], probe_count[1])
+    zmesh = bed_mesh.ZMesh(params, "benchmark")
+    if algo == 'lagrange':
+        methods = [zmesh._sample_lagrange, zmesh._sample_lagrange_numpy]
+    else:
+        methods = [zmesh._sample_bicubic, zmesh._sample_bicubic_numpy]
+    results = []
+    for method in methods:
+        duration = time_sample(method, z_matrix, options.repeat)
+        results.append((duration, zmesh.mesh_matrix))
+    (py_time, py_matrix), (np_time, np_matrix) = results
+    identical = py_matrix == np_matrix
+    print("%-8s probe=%dx%d pps=%d,%d mesh=%dx%d python=%.6fs numpy=%.6fs"
+          " speedup=%.1fx identical=%s" % (
+              algo, probe_count[0], probe_count[1], pps[0], pps[1],
+              zmesh.mesh_x_count, zmesh.mesh_y_count, py_time, np_time,
+              py_time / max(np_time, 1e-9), identical))
+    return identical
+
+def parse_pair(opts, value, name):
+    try:
+        pair = [int(v) for v in value.split(',')]
+    except ValueError:
+        opts.error("Invalid %s" % (name,))
+    if len(pair) == 1:
+        pair = pair * 2
+    if len(pair) != 2:
+        opts.error("Invalid %s" % (name,))
+    return pair
+
+def main():
+    # Parse command-line arguments
+    usage = "%prog [options]"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-a", "--algorithm", type="string", dest="algos",
+                    default=','.join(ALGOS),
+                    help="comma separated list of algorithms to benchmark")
+    opts.add_option("-c", "--probe-count", type="string", dest="probe_count",
+                    default=None, help="probe count (eg, 15,15)")
+    opts.add_option("-p", "--pps", type="string", dest="pps", default="4,4",
+                    help="mesh_pps (interpolated points per segment)")
+    opts.add_option("--tension", type="float", dest="tension", default=.2,
+                    help="bicubic_tension")
+    opts.add_option("-r", "--repeat", type="int", dest="repeat", default=3,
+                    help="number of runs of each benchmark")
+    options, args = opts.parse_args()
+    if args:
+        opts.error("Incorrect number of arguments")
+    if options.repeat < 1:
+        opts.error("Repeat must be at least 1")
+    if bulk_sensor.get_numpy() is None:
+        opts.error("The numpy module is required")
+    algos = options.algos.split(',')
+    for algo in algos:
+        if algo not in ALGOS:
+            opts.error("Unknown algorithm '%s'" % (algo,))
+    pps = parse_pair(opts, options.pps, "pps")
+    all_identical = True
+    for algo in algos:
+        if options.probe_count is not None:
+            probe_count = parse_pair(opts, options.probe_count, "probe count")
+        elif algo == 'lagrange':
+            # Lagrange interpolation supports at most 6 points per axis
+            probe_count = [6, 6]
+        else:
+            probe_count = [15, 15]
+        if not run_benchmark(algo, probe_count, pps, options):
+            all_identical = False
+    if not all_identical:
+        sys.stderr.write("Error: numpy and python results differ\n")
+        sys.exit(-1)
+
+if __name__ == '__main__':
+    main()
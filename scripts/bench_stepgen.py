@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+# Benchmark host step generation and step compression
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, optparse, math, json, random, time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../klippy'))
+import chelper, msgproto
+from extras import shaper_defs
+
+MCU_FREQ = 72000000.
+# Start after the trapq initial null move (see MAX_NULL_MOVE in trapq.c)
+START_TIME = 2.000
+FLUSH_INTERVAL = 0.050
+FINALIZE_DELAY = 0.250
+HISTORY_TIME = 1.000
+MAX_CLOCK = 0x7fffffffffffffff
+MOVE_COUNT = 500
+QUEUE_STEP_TAG, SET_DIR_TAG = 1, 2
+KINEMATICS = ['cartesian', 'corexy', 'delta', 'shaper', 'extruder']
+PATTERNS = ['zigzag', 'circles', 'random']
+
+
+######################################################################
+# Move streams
+######################################################################
+
+# Generate a list of xy points along a move pattern
+def gen_zigzag(total_dist, size=80., spacing=.4):
+    points = [(-.5 * size, -.5 * size)]
+    dist = 0.
+    y = -.5 * size
+    while dist < total_dist:
+        x = points[-1][0]
+        points.append((-x, y))
+        y += spacing
+        if y > .5 * size:
+            y = -.5 * size
+        points.append((-x, y))
+        dist += size + spacing
+    return points
+
+def gen_circles(total_dist, radius=20., seg_dist=1.):
+    count = max(8, int(2. * math.pi * radius / seg_dist))
+    seg = 2. * math.pi * radius / count
+    points = []
+    dist = 0.
+    while dist < total_dist:
+        for i in range(count):
+            a = 2. * math.pi * i / count
+            points.append((radius * math.cos(a), radius * math.sin(a)))
+        dist += seg * count
+    points.append(points[0])
+    return points
+
+def gen_random(total_dist, radius=60., min_dist=1., max_dist=10.):
+    rnd = random.Random(42)
+    points = [(0., 0.)]
+    dist = 0.
+    while dist < total_dist:
+        x, y = points[-1]
+        a = rnd.uniform(0., 2. * math.pi)
+        d = rnd.uniform(min_dist, max_dist)
+        nx, ny = x + d * math.cos(a), y + d * math.sin(a)
+        if nx**2 + ny**2 > radius**2:
+            nx, ny = -.5 * x, -.5 * y
+        points.append((nx, ny))
+        dist += math.sqrt((nx - x)**2 + (ny - y)**2)
+    return points
+
+# Lookahead planning of a list of points (similar to toolhead.py)
+def plan_moves(points, z, velocity, accel, square_corner_velocity):
+    segs = []
+    for (sx, sy), (ex, ey) in zip(points[:-1], points[1:]):
+        d = math.sqrt((ex - sx)**2 + (ey - sy)**2)
+        if d < .000000001:
+            continue
+        segs.append(((sx, sy, z), ((ex - sx) / d, (ey - sy) / d, 0.), d))
+    if not segs:
+        return []
+    jd = square_corner_velocity**2 * (math.sqrt(2.) - 1.) / accel
+    max_v2 = velocity**2
+    # Maximum junction speeds
+    junction_v2 = [0.]
+    for prev, cur in zip(segs[:-1], segs[1:]):
+        cos_theta = -(prev[1][0] * cur[1][0] + prev[1][1] * cur[1][1])
+        cos_theta = max(-0.999999, min(0.999999, cos_theta))
+        sin_theta_d2 = math.sqrt(.5 * (1. - cos_theta))
+        r_jd = sin_theta_d2 / (1. - sin_theta_d2)
+        junction_v2.append(min(r_jd * jd * accel, max_v2))
+    # Backward pass
+    max_start_v2 = [0.] * len(segs)
+    next_v2 = 0.
+    for i in range(len(segs) - 1, -1, -1):
+        next_v2 = min(junction_v2[i], next_v2 + 2. * accel * segs[i][2])
+        max_start_v2[i] = next_v2
+    # Forward pass
+    moves = []
+    print_time = START_TIME
+    start_v2 = 0.
+    for i, (start_pos, axes_r, d) in enumerate(segs):
+        start_v2 = min(start_v2, max_start_v2[i])
+        end_v2 = 0.
+        if i + 1 < len(segs):
+            end_v2 = max_start_v2[i + 1]
+        end_v2 = min(end_v2, start_v2 + 2. * accel * d)
+        cruise_v2 = min(max_v2, .5 * (start_v2 + end_v2) + accel * d)
+        start_v, end_v = math.sqrt(start_v2), math.sqrt(end_v2)
+        cruise_v = math.sqrt(cruise_v2)
+        accel_d = (cruise_v2 - start_v2) / (2. * accel)
+        decel_d = (cruise_v2 - end_v2) / (2. * accel)
+        cruise_d = max(0., d - accel_d - decel_d)
+        accel_t = (cruise_v - start_v) / accel
+        decel_t = (cruise_v - end_v) / accel
+        cruise_t = cruise_d / cruise_v
+        moves.append((print_time, accel_t, cruise_t, decel_t, start_pos,
+                      axes_r, start_v, cruise_v, accel))
+        print_time += accel_t + cruise_t + decel_t
+        start_v2 = end_v2
+    return moves
+
+def gen_moves(pattern, options):
+    total_dist = options.duration * options.velocity
+    funcs = {'zigzag': gen_zigzag, 'circles': gen_circles,
+             'random': gen_random}
+    points = funcs[pattern](total_dist)
+    return plan_moves(points, 10., options.velocity, options.accel,
+                      options.scv)
+
+# Load trapq moves recorded with the motion_report/dump_trapq endpoint
+def load_moves(filename):
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('result', data).get('data', [])
+    moves = []
+    for print_time, move_t, start_v, accel, start_pos, axes_r in data:
+        # Each entry is a single constant acceleration phase
+        moves.append((print_time, move_t, 0., 0., tuple(start_pos),
+                      tuple(axes_r), start_v, start_v + accel * move_t,
+                      accel))
+    return moves
+
+
+######################################################################
+# Step generation
+######################################################################
+
+# Create the stepper_kinematics for a kinematic type
+def setup_kinematics(kin, options, keep_sks):
+    ffi_main, ffi_lib = chelper.get_ffi()
+    def alloc(name, *args):
+        return ffi_main.gc(getattr(ffi_lib, name)(*args), ffi_lib.free)
+    if kin == 'cartesian':
+        return [(alloc('cartesian_stepper_alloc', a), False)
+                for a in [b'x', b'y', b'z']]
+    if kin == 'corexy':
+        return [(alloc('corexy_stepper_alloc', b'+'), False),
+                (alloc('corexy_stepper_alloc', b'-'), False),
+                (alloc('cartesian_stepper_alloc', b'z'), False)]
+    if kin == 'delta':
+        arm2 = 250.**2
+        sks = []
+        for angle in [210., 330., 90.]:
+            a = math.radians(angle)
+            sks.append((alloc('delta_stepper_alloc', arm2,
+                              math.cos(a) * 140., math.sin(a) * 140.), False))
+        return sks
+    if kin == 'shaper':
+        A, T = shaper_defs.get_mzv_shaper(options.shaper_freq, .1)
+        sks = []
+        for axis in [b'x', b'y']:
+            sk = alloc('cartesian_stepper_alloc', axis)
+            is_sk = alloc('input_shaper_alloc')
+            ffi_lib.input_shaper_set_sk(is_sk, sk)
+            ffi_lib.input_shaper_set_shaper_params(is_sk, axis, len(A), A, T)
+            sks.append((is_sk, False))
+            # Keep a reference to the wrapped stepper_kinematics
+            keep_sks.append(sk)
+        return sks
+    if kin == 'extruder':
+        sk = alloc('extruder_stepper_alloc')
+        ffi_lib.extruder_set_pressure_advance(sk, options.pressure_advance,
+                                              .040)
+        return [(sk, True)]
+    raise Exception("Unknown kinematics '%s'" % (kin,))
+
+# Derive extruder moves from the xy distance of each toolhead move (as
+# done in kinematics/extruder.py, x is the extruder movement and y is
+# the pressure advance flag)
+def extruder_moves(moves, e_ratio):
+    emoves = []
+    epos = 0.
+    for m in moves:
+        print_time, accel_t, cruise_t, decel_t, start_pos, axes_r = m[:6]
+        start_v, cruise_v, accel = m[6:9]
+        axis_r = math.sqrt(axes_r[0]**2 + axes_r[1]**2) * e_ratio
+        can_pressure_advance = 1. if axis_r > 0. else 0.
+        emoves.append((print_time, accel_t, cruise_t, decel_t, (epos, 0., 0.),
+                       (1., can_pressure_advance, 0.), start_v * axis_r,
+                       cruise_v * axis_r, accel * axis_r))
+        dist = ((start_v + cruise_v) * .5 * accel_t + cruise_v * cruise_t
+                + (cruise_v - .5 * accel * decel_t) * decel_t)
+        epos += dist * axis_r
+    return emoves
+
+# Estimate the encoded size of queue_step and set_next_step_dir messages
+def calc_msg_bytes(history, oid, last_dir):
+    enc = msgproto.PT_int32()
+    def vlq_len(v):
+        out = []
+        enc.encode(out, v)
+        return len(out)
+    oid_len = vlq_len(oid)
+    queue_steps = dir_changes = steps = msg_bytes = 0
+    for h in history:
+        count = h.step_count
+        sdir = count > 0
+        if sdir != last_dir:
+            if last_dir is not None:
+                dir_changes += 1
+                msg_bytes += 1 + oid_len + vlq_len(int(sdir))
+            last_dir = sdir
+        count = abs(count)
+        queue_steps += 1
+        steps += count
+        msg_bytes += (1 + oid_len + vlq_len(h.interval) + vlq_len(count)
+                      + vlq_len(h.add))
+    return (queue_steps, dir_changes, steps, msg_bytes), last_dir
+
+def get_serialqueue_stats(sq):
+    ffi_main, ffi_lib = chelper.get_ffi()
+    cbuf = ffi_main.new("char[4096]")
+    ffi_lib.serialqueue_get_stats(sq, cbuf, len(cbuf))
+    stats = ffi_main.string(cbuf).decode()
+    return dict([s.split('=', 1) for s in stats.split()])
+
+# Run the move stream through itersolve, stepcompress, and serialqueue
+def run_benchmark(kin, moves, max_error, options):
+    ffi_main, ffi_lib = chelper.get_ffi()
+    devnull = open(os.devnull, 'wb')
+    sq = ffi_lib.serialqueue_alloc(devnull.fileno(), b'f', 0)
+    ffi_lib.serialqueue_set_clock_est(sq, 1000000000000.,
+                                      ffi_lib.get_monotonic(), 0, 0)
+    tq = ffi_main.gc(ffi_lib.trapq_alloc(), ffi_lib.trapq_free)
+    etq = ffi_main.gc(ffi_lib.trapq_alloc(), ffi_lib.trapq_free)
+    for m in moves:
+        ffi_lib.trapq_append(tq, m[0], m[1], m[2], m[3], *(m[4] + m[5] + m[6:]))
+    for m in extruder_moves(moves, options.e_ratio):
+        ffi_lib.trapq_append(etq, m[0], m[1], m[2], m[3],
+                             *(m[4] + m[5] + m[6:]))
+    keep_sks = []
+    sks = setup_kinematics(kin, options, keep_sks)
+    max_error_ticks = int(max_error * MCU_FREQ)
+    scs = []
+    start_pos = moves[0][4]
+    for oid, (sk, is_extruder) in enumerate(sks):
+        sc = ffi_main.gc(ffi_lib.stepcompress_alloc(oid),
+                         ffi_lib.stepcompress_free)
+        ffi_lib.stepcompress_fill(sc, max_error_ticks, QUEUE_STEP_TAG,
+                                  SET_DIR_TAG)
+        step_dist = options.step_dist
+        if is_extruder:
+            step_dist = options.e_step_dist
+            ffi_lib.itersolve_set_position(sk, 0., 0., 0.)
+            ffi_lib.itersolve_set_trapq(sk, etq)
+        else:
+            ffi_lib.itersolve_set_position(sk, *start_pos)
+            ffi_lib.itersolve_set_trapq(sk, tq)
+        ffi_lib.itersolve_set_stepcompress(sk, sc, step_dist)
+        scs.append(sc)
+    ss = ffi_main.gc(ffi_lib.steppersync_alloc(sq, scs, len(scs), MOVE_COUNT),
+                     ffi_lib.steppersync_free)
+    ffi_lib.steppersync_set_time(ss, 0., MCU_FREQ)
+    last = moves[-1]
+    end_time = last[0] + last[1] + last[2] + last[3] + FINALIZE_DELAY
+    # Generate steps
+    totals = [0, 0, 0, 0]
+    history = ffi_main.new('struct pull_history_steps[1024]')
+    # Per stepper (last accounted first_clock, last step direction)
+    accounted = [(-1, None)] * len(scs)
+    start_cpu = time.process_time()
+    start_wall = time.time()
+    flush_time = start_time = moves[0][0]
+    while flush_time < end_time:
+        flush_time = min(flush_time + FLUSH_INTERVAL, end_time)
+        for sk, is_extruder in sks:
+            ret = ffi_lib.itersolve_generate_steps(sk, flush_time)
+            if ret:
+                raise Exception("Internal error in stepcompress")
+        clock = int(flush_time * MCU_FREQ)
+        clear_clock = max(0, clock - int(HISTORY_TIME * MCU_FREQ))
+        ret = ffi_lib.steppersync_flush(ss, clock, clear_clock)
+        if ret:
+            raise Exception("Internal error in stepcompress")
+        finalize_time = flush_time - FINALIZE_DELAY
+        ffi_lib.trapq_finalize_moves(tq, finalize_time, finalize_time)
+        ffi_lib.trapq_finalize_moves(etq, finalize_time, finalize_time)
+        # Account for the queue_step commands sent since the last flush
+        for oid, sc in enumerate(scs):
+            count = ffi_lib.stepcompress_extract_history(
+                sc, history, len(history), clear_clock, MAX_CLOCK)
+            if count > len(history):
+                history = ffi_main.new('struct pull_history_steps[]', count)
+                count = ffi_lib.stepcompress_extract_history(
+                    sc, history, len(history), clear_clock, MAX_CLOCK)
+            last_first_clock, last_dir = accounted[oid]
+            entries = [history[i] for i in range(count)
+                       if history[i].first_clock > last_first_clock]
+            if not entries:
+                continue
+            res, last_dir = calc_msg_bytes(entries, oid, last_dir)
+            accounted[oid] = (entries[-1].first_clock, last_dir)
+            totals = [t + r for t, r in zip(totals, res)]
+    cpu_time = time.process_time() - start_cpu
+    wall_time = time.time() - start_wall
+    # Wait for the serialqueue to transmit all data
+    for i in range(1000):
+        stats = get_serialqueue_stats(sq)
+        if stats['ready_bytes'] == '0' and stats['upcoming_bytes'] == '0':
+            break
+        time.sleep(.001)
+    ffi_lib.serialqueue_exit(sq)
+    ffi_lib.serialqueue_free(sq)
+    devnull.close()
+    queue_steps, dir_changes, steps, msg_bytes = totals
+    move_time = end_time - FINALIZE_DELAY - start_time
+    return {
+        'kinematics': kin, 'max_error': max_error, 'steps': steps,
+        'queue_step': queue_steps, 'set_next_step_dir': dir_changes,
+        'msg_bytes': msg_bytes, 'wire_bytes': int(stats['bytes_write']),
+        'move_time': move_time, 'cpu_time': cpu_time, 'wall_time': wall_time,
+        'steps_per_sec': steps / cpu_time if cpu_time else 0.,
+        'queue_step_per_sec': queue_steps / move_time,
+        'wire_bytes_per_sec': int(stats['bytes_write']) / move_time,
+        'compression_ratio': float(steps) / max(1, queue_steps),
+    }
+
+
+######################################################################
+# Reporting
+######################################################################
+
+def report(results):
+    print("%-10s %9s %10s %9s %7s %10s %11s %12s" % (
+        "kin", "max_error", "steps", "queue_st", "ratio", "qs/sec",
+        "bytes/sec", "steps/cpusec"))
+    for r in results:
+        print("%-10s %9.6f %10d %9d %7.2f %10.0f %11.0f %12.0f" % (
+            r['kinematics'], r['max_error'], r['steps'], r['queue_step'],
+            r['compression_ratio'], r['queue_step_per_sec'],
+            r['wire_bytes_per_sec'], r['steps_per_sec']))
+
+def result_key(r):
+    return "%s:%.9f" % (r['kinematics'], r['max_error'])
+
+# Compare results against a baseline file - returns list of failures
+def check_regressions(results, baseline, threshold):
+    base = {result_key(r): r for r in baseline['results']}
+    failures = []
+    for r in results:
+        b = base.get(result_key(r))
+        if b is None:
+            continue
+        limit = 1. + threshold / 100.
+        if r['steps_per_sec'] * limit < b['steps_per_sec']:
+            failures.append("%s: steps/sec %.0f (baseline %.0f)" % (
+                result_key(r), r['steps_per_sec'], b['steps_per_sec']))
+        for field in ['queue_step', 'wire_bytes']:
+            if r[field] > b[field] * limit:
+                failures.append("%s: %s %d (baseline %d)" % (
+                    result_key(r), field, r[field], b[field]))
+    return failures
+
+def main():
+    # Parse command-line arguments
+    usage = "%prog [options]"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-k", "--kinematics", type="string", dest="kinematics",
+                    default=','.join(KINEMATICS),
+                    help="comma separated list of kinematics to benchmark")
+    opts.add_option("-p", "--pattern", type="choice", dest="pattern",
+                    choices=PATTERNS, default='zigzag',
+                    help="synthetic move pattern (%s)" % (', '.join(PATTERNS),))
+    opts.add_option("-t", "--trapq", type="string", dest="trapq",
+                    help="replay moves from a motion_report/dump_trapq file")
+    opts.add_option("-e", "--max-error", type="string", dest="max_error",
+                    default="0.000025",
+                    help="comma separated list of max_error values")
+    opts.add_option("-d", "--duration", type="float", dest="duration",
+                    default=10., help="approximate synthetic move time")
+    opts.add_option("--velocity", type="float", dest="velocity",
+                    default=300., help="synthetic move velocity")
+    opts.add_option("--accel", type="float", dest="accel", default=5000.,
+                    help="synthetic move acceleration")
+    opts.add_option("--scv", type="float", dest="scv", default=5.,
+                    help="synthetic move square_corner_velocity")
+    opts.add_option("--step-dist", type="float", dest="step_dist",
+                    default=.0125, help="toolhead stepper step distance")
+    opts.add_option("--e-step-dist", type="float", dest="e_step_dist",
+                    default=.0025, help="extruder step distance")
+    opts.add_option("--e-ratio", type="float", dest="e_ratio", default=.04,
+                    help="extrusion length per xy move distance")
+    opts.add_option("--pressure-advance", type="float",
+                    dest="pressure_advance", default=.04,
+                    help="extruder pressure_advance")
+    opts.add_option("--shaper-freq", type="float", dest="shaper_freq",
+                    default=50., help="input shaper (mzv) frequency")
+    opts.add_option("-r", "--repeat", type="int", dest="repeat", default=1,
+                    help="number of runs of each benchmark")
+    opts.add_option("-o", "--output", type="string", dest="output",
+                    help="write results to the given json file")
+    opts.add_option("-b", "--baseline", type="string", dest="baseline",
+                    help="compare results to a previously written json file")
+    opts.add_option("--threshold", type="float", dest="threshold",
+                    default=10., help="allowed regression percentage")
+    options, args = opts.parse_args()
+    if args:
+        opts.error("Incorrect number of arguments")
+    if options.repeat < 1:
+        opts.error("Repeat must be at least 1")
+    kinematics = options.kinematics.split(',')
+    for kin in kinematics:
+        if kin not in KINEMATICS:
+            opts.error("Unknown kinematics '%s'" % (kin,))
+    try:
+        max_errors = [float(v) for v in options.max_error.split(',')]
+    except ValueError:
+        opts.error("Invalid max_error list")
+    # Load or generate moves
+    if options.trapq:
+        moves = load_moves(options.trapq)
+    else:
+        moves = gen_moves(options.pattern, options)
+    if not moves:
+        opts.error("No moves to benchmark")
+    # Run benchmarks
+    results = []
+    for kin in kinematics:
+        for max_error in max_errors:
+            # Report the fastest of the repeated runs
+            runs = [run_benchmark(kin, moves, max_error, options)
+                    for i in range(options.repeat)]
+            results.append(max(runs, key=lambda r: r['steps_per_sec']))
+    report(results)
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump({'results': results}, f, indent=2)
+    if options.baseline:
+        with open(options.baseline, 'r') as f:
+            baseline = json.load(f)
+        failures = check_regressions(results, baseline, options.threshold)
+        for msg in failures:
+            print("REGRESSION %s" % (msg,))
+        if failures:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
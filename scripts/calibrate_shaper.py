@@ -16,6 +16,9 @@ shaper_calibrate = importlib.import_module('.shaper_calibrate', 'extras')
 MAX_TITLE_LENGTH=65
 
 def parse_log(logname):
+    if logname.endswith('.npy'):
+        # Raw accelerometer data in numpy binary format
+        return np.load(logname, mmap_mode='r')
     with open(logname) as f:
         for header in f:
             if not header.startswith('#'):
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Check that the eddy current calibration lookups agree with each other
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, random
+sys.path.append(os.path.join(os.path.dirname(__file__), '../klippy'))
+from extras import probe_eddy_current, bulk_sensor
+
+# Calibration tables as (z position, frequency) pairs
+TABLES = {
+    'empty': [],
+    'single': [(1.0, 3000000.)],
+    'multi': [(0.05 + i * .04, 3300000. - i * 2500. - i * i * 10.)
+              for i in range(100)],
+    'flat': [(0.5, 3100000.), (1.0, 3100000.), (1.5, 3050000.)],
+}
+
+def make_calibration(table):
+    cal = probe_eddy_current.EddyCalibration.__new__(
+        probe_eddy_current.EddyCalibration)
+    cal.load_calibration([list(t) for t in table])
+    return cal
+
+def get_test_freqs(table, rnd):
+    freqs = [0., 2900000., 3000000., 3500000.]
+    for zpos, freq in table:
+        freqs.extend([freq, freq - 0.5, freq + 0.5])
+    freqs.extend([rnd.uniform(2900000., 3400000.) for i in range(1000)])
+    return freqs
+
+def check_table(name, table, rnd):
+    np = bulk_sensor.get_numpy()
+    cal = make_calibration(table)
+    freqs = get_test_freqs(table, rnd)
+    samples = [(i * .001, freq, 999.9) for i, freq in enumerate(freqs)]
+    cal.apply_calibration(samples)
+    arr = np.array([(i * .001, freq, 999.9) for i, freq in enumerate(freqs)])
+    cal.apply_calibration_array(arr)
+    errors = 0
+    for (ptime, freq, z), row in zip(samples, arr.tolist()):
+        if row[2] != z or z != cal.freq_to_height(freq):
+            sys.stdout.write("%s: freq %.3f scalar %.6f array %.6f\n"
+                             % (name, freq, z, row[2]))
+            errors += 1
+    return errors
+
+def main():
+    if bulk_sensor.get_numpy() is None:
+        sys.stdout.write("numpy not available - skipping check\n")
+        return
+    rnd = random.Random(42)
+    errors = 0
+    for name in sorted(TABLES):
+        errors += check_table(name, TABLES[name], rnd)
+    if errors:
+        sys.stdout.write("%d mismatched heights\n" % (errors,))
+        sys.exit(-1)
+    sys.stdout.write("Calibration lookups match\n")
+
+if __name__ == '__main__':
+    main()
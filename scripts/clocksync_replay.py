@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Replay recorded mcu clock samples through the clock sync regression
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import optparse, json
+import numpy as np
+
+DECAY = 1. / 30.
+BLOCK_SIZE = 256
+
+# Calculate y[n] = scale * y[n-1] + x[n] for all n
+def decayed_sum(x, scale):
+    out = np.empty_like(x)
+    carry = 0.
+    for start in range(0, len(x), BLOCK_SIZE):
+        block = x[start:start+BLOCK_SIZE]
+        powers = scale ** np.arange(len(block))
+        acc = np.cumsum(block / powers) * powers
+        out[start:start+len(block)] = acc + carry * scale * powers
+        carry = out[start+len(block)-1]
+    return out
+
+# Exponentially weighted linear regression of clock vs sent_time
+def replay_regression(sent_time, clock, decay):
+    t = sent_time - sent_time[0]
+    c = clock - clock[0]
+    scale = 1. - decay
+    s0 = decayed_sum(np.ones_like(t), scale)
+    st = decayed_sum(t, scale)
+    sc = decayed_sum(c, scale)
+    stt = decayed_sum(t * t, scale)
+    stc = decayed_sum(t * c, scale)
+    time_avg = st / s0
+    clock_avg = sc / s0
+    time_var = stt / s0 - time_avg**2
+    covar = stc / s0 - time_avg * clock_avg
+    with np.errstate(divide='ignore', invalid='ignore'):
+        freq = covar / time_var
+    # Residual of each sample against the prior prediction
+    resid = np.zeros_like(t)
+    resid[2:] = c[2:] - (clock_avg[1:-1]
+                         + freq[1:-1] * (t[2:] - time_avg[1:-1]))
+    return freq, resid
+
+def fmt_stats(name, values, units=1.):
+    if not len(values):
+        return "%s: (none)" % (name,)
+    values = values * units
+    return "%s: avg=%.3f stddev=%.3f min=%.3f max=%.3f" % (
+        name, np.mean(values), np.std(values), np.min(values), np.max(values))
+
+def analyze_mcu(name, history, sample_header, adj_header, options):
+    samples = history.get('samples')
+    if not samples:
+        print("mcu '%s': no clock samples recorded" % (name,))
+        return None
+    mcu_freq = history['mcu_freq']
+    data = np.array(samples, dtype=np.float64)
+    cols = {h: i for i, h in enumerate(sample_header)}
+    used = data[data[:,cols['ignored']] == 0.]
+    sent_time = used[:,cols['sent_time']]
+    recv_time = used[:,cols['receive_time']]
+    clock = used[:,cols['clock']]
+    freq, resid = replay_regression(sent_time, clock, options.decay)
+    recorded_freq = used[:,cols['freq']]
+    # Skip the initial samples while the regression converges
+    skip = min(len(used) - 1, int(2. / options.decay))
+    print("mcu '%s': %d samples (%d ignored) over %.1f seconds" % (
+        name, len(data), len(data) - len(used),
+        sent_time[-1] - sent_time[0]))
+    print("  " + fmt_stats("half_rtt (us)", .5 * (recv_time - sent_time),
+                           1000000.))
+    print("  " + fmt_stats("recorded residual (us)",
+                           used[skip:,cols['residual']], 1000000. / mcu_freq))
+    print("  " + fmt_stats("replay residual (us)", resid[skip:],
+                           1000000. / mcu_freq))
+    print("  " + fmt_stats("replay freq (ppm)", freq[skip:] / mcu_freq - 1.,
+                           1000000.))
+    print("  " + fmt_stats("replay-recorded freq (ppm)",
+                           (freq[skip:] - recorded_freq[skip:]) / mcu_freq,
+                           1000000.))
+    fit = np.polyfit(sent_time - sent_time[0], clock - clock[0], 1)
+    print("  least squares freq over buffer: %.3f (%.3f ppm)" % (
+        fit[0], (fit[0] / mcu_freq - 1.) * 1000000.))
+    res = {'sent_time': sent_time, 'resid': resid / mcu_freq,
+           'freq': freq, 'recorded_freq': recorded_freq, 'skip': skip}
+    adjustments = history.get('adjustments')
+    if adjustments:
+        adj = np.array(adjustments, dtype=np.float64)
+        acols = {h: i for i, h in enumerate(adj_header)}
+        skew = adj[:,acols['skew']]
+        print("  " + fmt_stats("secondary skew (us)", skew, 1000000.))
+        res['adj_time'] = adj[:,acols['eventtime']]
+        res['skew'] = skew
+    return res
+
+def plot_results(results, outname):
+    import matplotlib
+    if outname:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot
+    fig, (ax1, ax2) = matplotlib.pyplot.subplots(nrows=2, sharex=True)
+    ax1.set_title("Clock sync replay")
+    ax1.set_ylabel('Residual (us)')
+    ax2.set_ylabel('Secondary skew (us)')
+    ax2.set_xlabel('Time (s)')
+    for name, res in sorted(results.items()):
+        skip = res['skip']
+        ax1.plot(res['sent_time'][skip:], res['resid'][skip:] * 1000000.,
+                 label=name, alpha=0.8)
+        if 'skew' in res:
+            ax2.plot(res['adj_time'], res['skew'] * 1000000., label=name)
+    for ax in (ax1, ax2):
+        if ax.get_lines():
+            ax.legend(loc='best', prop={'size': 'x-small'})
+        ax.grid(True)
+    if outname:
+        fig.set_size_inches(8, 6)
+        fig.savefig(outname)
+    else:
+        matplotlib.pyplot.show()
+
+def main():
+    # Parse command-line arguments
+    usage = "%prog [options] <clock_diagnostics.json>"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-d", "--decay", type="float", dest="decay",
+                    default=DECAY, help="regression decay factor")
+    opts.add_option("-m", "--mcu", type="string", dest="mcu", default=None,
+                    help="only analyze the given mcu")
+    opts.add_option("-g", "--graph", action="store_true",
+                    help="graph residuals and secondary mcu skew")
+    opts.add_option("-o", "--output", type="string", dest="output",
+                    default=None, help="filename of output graph")
+    options, args = opts.parse_args()
+    if len(args) != 1:
+        opts.error("Incorrect number of arguments")
+    if not 0. < options.decay < 1.:
+        opts.error("Decay must be between 0 and 1")
+    with open(args[0], 'r') as f:
+        data = json.load(f)
+    results = {}
+    for name, history in sorted(data['mcus'].items()):
+        if options.mcu is not None and name != options.mcu:
+            continue
+        res = analyze_mcu(name, history, data['sample_header'],
+                          data['adj_header'], options)
+        if res is not None:
+            results[name] = res
+    if results and (options.graph or options.output):
+        plot_results(results, options.output)
+
+if __name__ == '__main__':
+    main()
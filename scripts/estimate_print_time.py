@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Estimate the print time of gcode files using the toolhead move planner
+#
+# Copyright (C) 2026  agent <agent@local>
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, optparse, configparser, time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../klippy'))
+from extras import print_time_estimator
+
+def format_time(seconds):
+    minutes, seconds = divmod(int(seconds + .5), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%d:%02d:%02d" % (hours, minutes, seconds)
+
+# Read the printer limits from a config file (include files are not
+# processed, so the [printer] and [extruder] sections must be present)
+def read_config_limits(opts, filename):
+    fileconfig = configparser.RawConfigParser(
+        strict=False, inline_comment_prefixes=(';', '#'))
+    try:
+        if not fileconfig.read(filename):
+            opts.error("Unable to read config file '%s'" % (filename,))
+        return print_time_estimator.get_config_limits(fileconfig)
+    except (configparser.Error, ValueError) as e:
+        opts.error("Unable to parse config file '%s': %s" % (filename, e))
+
+def main():
+    # Parse command-line arguments
+    usage = "%prog [options] <gcode file> [<gcode file>...]"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-c", "--config", type="string", dest="config",
+                    default=None, help="printer config file to read limits")
+    opts.add_option("-l", "--limit", type="string", dest="limits",
+                    action="append", default=[],
+                    help="override a limit (eg, max_accel=5000)")
+    options, args = opts.parse_args()
+    if not args:
+        opts.error("Incorrect number of arguments")
+    if options.config is None:
+        opts.error("A printer config file must be specified")
+    limits = read_config_limits(opts, options.config)
+    for limit in options.limits:
+        name, sep, value = limit.partition('=')
+        if name not in print_time_estimator.LIMIT_NAMES:
+            opts.error("Unknown limit '%s'" % (name,))
+        try:
+            limits[name] = float(value)
+        except ValueError:
+            opts.error("Invalid limit '%s'" % (limit,))
+    # Estimate each file
+    for filename in args:
+        start_time = time.time()
+        try:
+            res = print_time_estimator.estimate_file(filename, limits)
+        except IOError as e:
+            sys.stderr.write("Unable to read '%s': %s\n" % (filename, e))
+            sys.exit(-1)
+        duration = max(time.time() - start_time, 1e-9)
+        print("%s: %s (%.3fs) moves=%d runtime=%.3fs (%.0f moves/s)" % (
+            filename, format_time(res['estimated_time']),
+            res['estimated_time'], res['move_count'], duration,
+            res['move_count'] / duration))
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,85 @@
 # Copyright (C) 2018  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import sys, os, optparse, logging, subprocess
+import sys, os, optparse, logging, subprocess, time, resource, re
+import multiprocessing
+sys.path.append(os.path.join(os.path.dirname(__file__), '../klippy'))
+import msgproto
 
-TEMP_GCODE_FILE = "_test_.gcode"
-TEMP_LOG_FILE = "_test_.log"
-TEMP_OUTPUT_FILE = "_test_output"
+TEMP_GCODE_FILE = "_test_%s.gcode"
+TEMP_LOG_FILE = "_test_%s.log"
+TEMP_OUTPUT_FILE = "_test_%s_output"
+GOLDEN_EXT = ".dump"
+MAX_REPORT_DIFFS = 5
+
+
+######################################################################
+# MCU output decoding
+######################################################################
+
+# Parsed data dictionaries (cached for the life of the process)
+msg_parsers = {}
+
+def get_msg_parser(dict_fname):
+    mp = msg_parsers.get(dict_fname)
+    if mp is None:
+        f = open(dict_fname, 'rb')
+        dictionary = f.read()
+        f.close()
+        mp = msgproto.MessageParser()
+        mp.process_identify(dictionary, decompress=False)
+        msg_parsers[dict_fname] = mp
+    return mp
+
+# Translate a batch mode output file to a list of mcu commands
+def decode_output(dict_fname, data_fname):
+    mp = get_msg_parser(dict_fname)
+    f = open(data_fname, 'rb')
+    data = bytearray(f.read())
+    f.close()
+    msgs = []
+    pos = 0
+    while pos < len(data):
+        l = mp.check_packet(data[pos:pos+msgproto.MESSAGE_MAX])
+        if l <= 0:
+            raise error("Invalid data in %s at offset %d" % (data_fname, pos))
+        msgs.extend(mp.dump(data[pos:pos+l])[1:])
+        pos += l
+    return msgs
+
+OID_R = re.compile(r'\boid=([0-9]+)')
+
+# The host may interleave messages of different command queues
+# differently on each run, so only compare the order of messages with
+# the same name and oid.
+def group_messages(msgs):
+    groups = {}
+    for msg in msgs:
+        m = OID_R.search(msg)
+        key = (msg.split(' ', 1)[0], m.group(1) if m else "")
+        groups.setdefault(key, []).append(msg)
+    return groups
+
+def compare_messages(expected, actual):
+    expected_groups = group_messages(expected)
+    actual_groups = group_messages(actual)
+    diffs = []
+    for key in sorted(set(expected_groups) | set(actual_groups)):
+        exp_msgs = expected_groups.get(key, [])
+        act_msgs = actual_groups.get(key, [])
+        if exp_msgs == act_msgs:
+            continue
+        for i in range(max(len(exp_msgs), len(act_msgs))):
+            exp_msg = act_msg = "<none>"
+            if i < len(exp_msgs):
+                exp_msg = exp_msgs[i]
+            if i < len(act_msgs):
+                act_msg = act_msgs[i]
+            if exp_msg != act_msg:
+                diffs.append("%s oid=%s #%d: expected '%s' got '%s'" % (
+                    key[0], key[1] or "-", i, exp_msg, act_msg))
+                break
+    return diffs
 
 
 ######################################################################
@@ -18,12 +92,26 @@ class error(Exception):
     pass
 
 class TestCase:
-    def __init__(self, fname, dictdir, tempdir, verbose, keepfiles):
+    def __init__(self, fname, index, dictdir, tempdir, verbose, keepfiles,
+                 golden_dir=None, update_golden=False):
         self.fname = fname
         self.dictdir = dictdir
         self.tempdir = tempdir
         self.verbose = verbose
         self.keepfiles = keepfiles
+        self.golden_dir = golden_dir
+        self.update_golden = update_golden
+        self.name = os.path.splitext(os.path.basename(fname))[0]
+        # Use unique temporary files so tests may run in parallel
+        self.temp_name = "%d_%s" % (index, self.name)
+        self.log_fname = self.relpath(TEMP_LOG_FILE % (self.temp_name,),
+                                      'temp')
+        self.output_fname = self.relpath(
+            TEMP_OUTPUT_FILE % (self.temp_name,), 'temp')
+        self.temp_fnames = []
+        self.multi_tests = False
+        self.test_count = 0
+        self.timings = []
     def relpath(self, fname, rel='test'):
         if rel == 'dict':
             reldir = self.dictdir
@@ -35,7 +123,7 @@ class TestCase:
     def parse_test(self):
         # Parse file into test cases
         config_fname = gcode_fname = dict_fnames = None
-        should_fail = multi_tests = False
+        should_fail = False
         gcode = []
         f = open(self.fname, 'r')
         for line in f:
@@ -48,12 +136,12 @@ class TestCase:
             if parts[0] == "CONFIG":
                 if config_fname is not None:
                     # Multiple tests in same file
-                    if not multi_tests:
-                        multi_tests = True
+                    if not self.multi_tests:
+                        self.multi_tests = True
                         self.launch_test(config_fname, dict_fnames,
                                          gcode_fname, gcode, should_fail)
                 config_fname = self.relpath(parts[1])
-                if multi_tests:
+                if self.multi_tests:
                     self.launch_test(config_fname, dict_fnames,
                                      gcode_fname, gcode, should_fail)
             elif parts[0] == "DICTIONARY":
@@ -66,17 +154,24 @@ class TestCase:
                 gcode_fname = self.relpath(parts[1])
             elif parts[0] == "SHOULD_FAIL":
                 should_fail = True
+            elif parts[0] == "TEMP_FILE":
+                # File written by the test - start without it
+                temp_fname = self.relpath(parts[1])
+                self.temp_fnames.append(temp_fname)
+                self.remove_temp_file(temp_fname)
             else:
                 gcode.append(line.strip())
         f.close()
-        if not multi_tests:
+        if not self.multi_tests:
             self.launch_test(config_fname, dict_fnames,
                              gcode_fname, gcode, should_fail)
     def launch_test(self, config_fname, dict_fnames, gcode_fname, gcode,
                     should_fail):
+        self.test_count += 1
         gcode_is_temp = False
         if gcode_fname is None:
-            gcode_fname = self.relpath(TEMP_GCODE_FILE, 'temp')
+            gcode_fname = self.relpath(TEMP_GCODE_FILE % (self.temp_name,),
+                                       'temp')
             gcode_is_temp = True
             f = open(gcode_fname, 'w')
             f.write('\n'.join(gcode + ['']))
@@ -88,15 +183,22 @@ class TestCase:
         if dict_fnames is None:
             raise error("data dictionary file not specified")
         # Call klippy
-        sys.stderr.write("    Starting %s (%s)\n" % (
-            self.fname, os.path.basename(config_fname)))
+        config_name = os.path.basename(config_fname)
+        sys.stderr.write("    Starting %s (%s)\n" % (self.fname, config_name))
         args = [ sys.executable, './klippy/klippy.py', config_fname,
-                 '-i', gcode_fname, '-o', TEMP_OUTPUT_FILE, '-v' ]
+                 '-i', gcode_fname, '-o', self.output_fname, '-v' ]
         for df in dict_fnames:
             args += ['-d', df]
         if not self.verbose:
-            args += ['-l', TEMP_LOG_FILE]
+            args += ['-l', self.log_fname]
+        start_time = time.time()
+        start_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
         res = subprocess.call(args)
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        wall_time = time.time() - start_time
+        cpu_time = (usage.ru_utime - start_usage.ru_utime
+                    + usage.ru_stime - start_usage.ru_stime)
+        self.timings.append((config_name, wall_time, cpu_time))
         is_fail = (should_fail and not res) or (not should_fail and res)
         if is_fail:
             if not self.verbose:
@@ -104,18 +206,53 @@ class TestCase:
             if should_fail:
                 raise error("Test failed to raise an error")
             raise error("Error during test")
+        if self.golden_dir is not None and not should_fail:
+            self.check_golden(dict_fnames)
         # Do cleanup
         if self.keepfiles:
             return
+        out_prefix = os.path.basename(self.output_fname)
         for fname in os.listdir(self.tempdir):
-            if fname.startswith(TEMP_OUTPUT_FILE):
-                os.unlink(fname)
+            if fname.startswith(out_prefix):
+                os.unlink(self.relpath(fname, 'temp'))
         if not self.verbose:
-            os.unlink(TEMP_LOG_FILE)
+            os.unlink(self.log_fname)
         else:
             sys.stderr.write('\n')
         if gcode_is_temp:
             os.unlink(gcode_fname)
+    def get_golden_fname(self, suffix):
+        name = self.name
+        if self.multi_tests:
+            name = "%s-%d" % (name, self.test_count)
+        return os.path.join(self.golden_dir, name + suffix + GOLDEN_EXT)
+    def check_golden(self, dict_fnames):
+        # Compare the output of each mcu to the stored output
+        for df in dict_fnames:
+            suffix = ""
+            if '=' in df:
+                mcu, df = df.split('=', 1)
+                suffix = "-" + mcu
+            msgs = decode_output(df, self.output_fname + suffix)
+            golden_fname = self.get_golden_fname(suffix)
+            if self.update_golden:
+                f = open(golden_fname, 'w')
+                f.write(''.join([msg + '\n' for msg in msgs]))
+                f.close()
+                continue
+            if not os.path.exists(golden_fname):
+                raise error("Golden output %s not found" % (golden_fname,))
+            f = open(golden_fname, 'r')
+            expected = f.read().splitlines()
+            f.close()
+            diffs = compare_messages(expected, msgs)
+            if diffs:
+                sys.stdout.write("Output differs from %s:\n  %s\n" % (
+                    golden_fname, "\n  ".join(diffs[:MAX_REPORT_DIFFS])))
+                raise error("Output does not match golden output")
+    def remove_temp_file(self, fname):
+        if os.path.exists(fname):
+            os.unlink(fname)
     def run(self):
         try:
             self.parse_test()
@@ -124,9 +261,13 @@ class TestCase:
         except Exception:
             logging.exception("Unhandled exception during test run")
             return "internal error"
+        finally:
+            if not self.keepfiles:
+                for fname in self.temp_fnames:
+                    self.remove_temp_file(fname)
         return "success"
     def show_log(self):
-        f = open(TEMP_LOG_FILE, 'r')
+        f = open(self.log_fname, 'r')
         data = f.read()
         f.close()
         sys.stdout.write(data)
@@ -136,6 +277,13 @@ class TestCase:
 # Startup
 ######################################################################
 
+def run_test(args):
+    fname, index, options = args
+    tc = TestCase(fname, index, options.dictdir, options.tempdir,
+                  options.verbose, options.keepfiles, options.golden_dir,
+                  options.update_golden)
+    return fname, tc.run(), tc.timings
+
 def main():
     # Parse args
     usage = "%prog [options] <test cases>"
@@ -148,19 +296,67 @@ def main():
                     help="do not remove temporary files")
     opts.add_option("-v", action="store_true", dest="verbose",
                     help="show all output from tests")
+    opts.add_option("-j", "--jobs", type="int", dest="jobs", default=1,
+                    help="number of test cases to run in parallel")
+    opts.add_option("-g", "--golden", dest="golden_dir", default=None,
+                    help="directory of golden mcu output to compare against")
+    opts.add_option("-u", "--update-golden", action="store_true",
+                    dest="update_golden",
+                    help="store the mcu output in the golden directory")
     options, args = opts.parse_args()
     if len(args) < 1:
         opts.error("Incorrect number of arguments")
+    if options.jobs < 1:
+        opts.error("Number of jobs must be at least 1")
+    if options.update_golden:
+        if options.golden_dir is None:
+            opts.error("A golden directory must be specified")
+        if not os.path.isdir(options.golden_dir):
+            os.makedirs(options.golden_dir)
+    if options.golden_dir is not None:
+        names = [os.path.basename(fname) for fname in args]
+        if len(set(names)) != len(names):
+            opts.error("Golden output requires unique test file names")
     logging.basicConfig(level=logging.DEBUG)
 
     # Run each test
-    for fname in args:
-        tc = TestCase(fname, options.dictdir, options.tempdir, options.verbose,
-                      options.keepfiles)
-        res = tc.run()
+    start_time = time.time()
+    work = [(fname, i, options) for i, fname in enumerate(args)]
+    if options.jobs > 1:
+        pool = multiprocessing.Pool(options.jobs)
+        results = pool.imap_unordered(run_test, work)
+    else:
+        pool = None
+        results = map(run_test, work)
+    failures = []
+    timings = []
+    for fname, res, test_timings in results:
+        for config_name, wall_time, cpu_time in test_timings:
+            sys.stderr.write("    Finished %s (%s) in %.2fs (cpu %.2fs)\n" % (
+                fname, config_name, wall_time, cpu_time))
+            timings.append((wall_time, cpu_time, fname, config_name))
         if res != 'success':
             sys.stderr.write("\n\nTest case %s FAILED (%s)!\n\n" % (fname, res))
-            sys.exit(-1)
+            failures.append(fname)
+    if pool is not None:
+        pool.close()
+        pool.join()
+    total_time = time.time() - start_time
+
+    # Report timing summary (slowest test cases first)
+    timings.sort(reverse=True)
+    sys.stderr.write("\n    Test case timing (wall / cpu):\n")
+    for wall_time, cpu_time, fname, config_name in timings:
+        sys.stderr.write("      %8.2fs %8.2fs  %s (%s)\n" % (
+            wall_time, cpu_time, fname, config_name))
+    sys.stderr.write("    Total: %.2fs elapsed, %.2fs test time, %.2fs cpu"
+                     " (%d jobs)\n" % (
+                         total_time, sum([t[0] for t in timings]),
+                         sum([t[1] for t in timings]), options.jobs))
+    if failures:
+        sys.stderr.write("\n    %d of %d test cases FAILED: %s\n" % (
+            len(failures), len(args), ' '.join(failures)))
+        sys.exit(-1)
 
     sys.stderr.write("\n    All %d test cases passed\n" % (len(args),))
 